@@ -0,0 +1,3 @@
+"""
+Benchmarks of slackviews, run them from the root of the repository, i.e. python -m benchmarks.bench_suggestions
+"""
@@ -0,0 +1,63 @@
+"""
+Benchmark of the throughput of SlackClient publishing Home tabs to a local StubSlackServer, so it's measured offline:
+
+ - pooled: connections are kept alive and reused
+ - unpooled: a new connection is opened for each request
+ - pre_serialized: connections are reused, and views are sent as json rendered in advance
+
+    python -m benchmarks.bench_client --requests 2000 --threads 4
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.bench_views import build_view
+from slackviews.client import SlackClient
+from slackviews.stub import StubSlackServer
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+MODES = ('pooled', 'unpooled', 'pre_serialized')
+
+
+def measure(server, mode, view, requests, threads):
+    """
+    Publishes supplied view for supplied number of requests, from a number of threads
+    :return: A dictionary with the duration and the requests per second
+    """
+    client = SlackClient('any token', base_url=server.api_url, pool_size=0 if mode == 'unpooled' else threads)
+    if mode == 'pre_serialized':
+        view = view.serialize(as_json=True)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(lambda user: client.views_publish(f'U{user}', view), range(requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        client.close()
+    return {'seconds': elapsed, 'requests_per_second': requests / elapsed}
+
+
+def run(requests=2000, threads=4, num_of_blocks=10):
+    """
+    Runs all modes against a new stub server
+    :return: A dictionary with results by mode
+    """
+    results = dict()
+    view = build_view(num_of_blocks)
+    with StubSlackServer(record=False) as server:
+        for mode in MODES:
+            results[mode] = measure(server, mode, view, requests, threads)
+            print(f'{mode:>16}: {results[mode]["requests_per_second"]:10.0f} requests/s', file=sys.stderr)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000, help='number of requests of each mode')
+    parser.add_argument('--threads', type=int, default=4, help='number of threads sending requests')
+    parser.add_argument('--blocks', type=int, default=10, help='number of blocks of the view')
+    args = parser.parse_args()
+    run(args.requests, args.threads, args.blocks)
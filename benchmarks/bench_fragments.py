@@ -0,0 +1,58 @@
+"""
+Benchmark of FragmentCache: builds and serializes Home tabs made of a greeting of each user and a leaderboard shared by
+all users, building the leaderboard for each user, or splicing it from the cache:
+
+    python -m benchmarks.bench_fragments --rows 20
+"""
+import argparse
+import sys
+
+from benchmarks.bench_views import measure
+from slackviews.fragments import FragmentCache
+from slackviews.view import BlocksArray, Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def build_leaderboard(rows):
+    """
+    Builds the leaderboard, a header followed by a section per row
+    :return: An instance of BlocksArray
+    """
+    builder = BlocksArray.Builder().Header().text('Leaderboard').up()
+    for row in range(rows):
+        builder.Section().block_id_(f'row-{row}').field__(f'*{row + 1}.* <@U{row:06d}>') \
+            .field__(f'{1000 - row} points').up()
+    return builder.build()
+
+
+def build_home(user, leaderboard):
+    """
+    Builds the Home tab of a user, with supplied leaderboard
+    :return: The Home tab, serialized as json
+    """
+    return Home.Builder().title('Home').Blocks().Section().text__(f'Hello <@{user}>').up().Divider().up() \
+        .blocks(leaderboard).up().build().serialize(as_json=True)
+
+
+def run(rows=20):
+    """
+    Measures the time to build a Home tab with and without the cache
+    :return: A dictionary with results by scenario
+    """
+    cache = FragmentCache('leaderboard', ttl=300)
+    scenarios = (('without_cache', lambda: build_home('U000000', build_leaderboard(rows))),
+                 ('with_cache', lambda: build_home('U000000', cache.get('weekly', lambda: build_leaderboard(rows)))))
+    results = dict()
+    for name, function in scenarios:
+        results[name] = measure(function)
+        print(f'{name:>16}: {results[name]["best_us"]:10.2f} us', file=sys.stderr)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20, help='rows of the leaderboard')
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,80 @@
+"""
+Benchmark of PublishGuard in refreshes of Home tabs where only some users get a different view, against a local
+StubSlackServer. It reports the calls to the Web API saved, and the time of refreshes with and without the guard:
+
+    python -m benchmarks.bench_guard --users 500 --rounds 5 --changed 0.1 --store lru
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_views import build_view
+from slackviews.client import SlackClient
+from slackviews.guard import PublishGuard, LRUFingerprintStore, SQLiteFingerprintStore
+from slackviews.stub import StubSlackServer
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def refresh(publisher, views, rounds, changed, seed=1):
+    """
+    Publishes the views of all users in each round, changing the view of a fraction of users between rounds
+    :return: The duration in seconds
+    """
+    rnd = random.Random(seed)
+    views = dict(views)
+    start = time.perf_counter()
+    for round_ in range(rounds):
+        for user_id, view in views.items():
+            publisher.views_publish(user_id, view)
+        for user_id in rnd.sample(list(views), int(len(views) * changed)):
+            views[user_id] = build_view(10).builder().callback_id_(f'round-{round_}').build() \
+                .serialize(as_json=True)
+    return time.perf_counter() - start
+
+
+def run(users=500, rounds=5, changed=0.1, store='lru'):
+    """
+    Runs the refreshes with and without the guard
+    :return: A dictionary with the API calls and duration of each one
+    """
+    views = {f'U{user}': build_view(10).serialize(as_json=True) for user in range(users)}
+    results = dict()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'fingerprints.db')
+    try:
+        with StubSlackServer(record=False) as server, SlackClient('any token', base_url=server.api_url) as client:
+            elapsed = refresh(client, views, rounds, changed)
+            results['unguarded'] = {'calls': server.count, 'seconds': elapsed}
+
+            server.count = 0
+            fingerprints = SQLiteFingerprintStore(path) if store == 'sqlite' else LRUFingerprintStore()
+            guard = PublishGuard(client, fingerprints, team_id='T000000')
+            elapsed = refresh(guard, views, rounds, changed)
+            results['guarded'] = dict(guard.metrics(), calls=server.count, seconds=elapsed)
+            if store == 'sqlite':
+                fingerprints.close()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(directory)
+
+    print(f'unguarded: {results["unguarded"]["calls"]} calls in {results["unguarded"]["seconds"]:.2f} s',
+          file=sys.stderr)
+    print(f'  guarded: {results["guarded"]["calls"]} calls in {results["guarded"]["seconds"]:.2f} s, '
+          f'hit rate {results["guarded"]["hit_rate"]:.2%}', file=sys.stderr)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=5, help='refreshes of all users')
+    parser.add_argument('--changed', type=float, default=0.1, help='fraction of users with a new view in each round')
+    parser.add_argument('--store', choices=('lru', 'sqlite'), default='lru')
+    args = parser.parse_args()
+    run(args.users, args.rounds, args.changed, args.store)
@@ -0,0 +1,82 @@
+"""
+Benchmark of the import time of slackviews modules, measured with python -X importtime in a new interpreter for each
+run, so modules already imported don't hide the cost. Bytecode is compiled once before measuring, in a temporary
+pycache_prefix, so compilation isn't measured and no file is written in the sources.
+
+The import of the package itself must stay under a budget, since apps and CLIs pay it at startup:
+
+    python -m benchmarks.bench_import --budget 5
+
+The exit status is 1 if the import of the package takes longer than the budget, in milliseconds
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+MODULES = ('slackviews', 'slackviews.view', 'slackviews.payloads', 'slackviews.pagination')
+
+
+def import_time(module, pycache_prefix):
+    """
+    Measures the import time of supplied module in a new interpreter
+    :param module: The name of the module
+    :param pycache_prefix: The directory of compiled bytecode
+    :return: The cumulative import time of the module, including the modules it imports, in milliseconds
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-X', f'pycache_prefix={pycache_prefix}',
+                              '-c', f'import {module}'], capture_output=True, text=True, check=True, env=env)
+    # lines are: import time: self [us] | cumulative | imported package
+    for line in process.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise AttributeError(f'Import time of [{module}] not found')
+
+
+def run(modules=MODULES, repeat=10):
+    """
+    Measures the import time of supplied modules
+    :param modules: Names of modules
+    :param repeat: Number of measures of each module
+    :return: A dictionary with the environment and the results by module
+    """
+    results = dict()
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        for module in modules:
+            # first import compiles the bytecode
+            import_time(module, pycache_prefix)
+            timings = [import_time(module, pycache_prefix) for _ in range(repeat)]
+            results[module] = {'best_ms': min(timings), 'median_ms': statistics.median(timings)}
+            print(f'{module:>24}: {results[module]["best_ms"]:8.2f} ms (median {results[module]["median_ms"]:.2f} ms)',
+                  file=sys.stderr)
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='number of measures of each module')
+    parser.add_argument('--budget', type=float, default=5.0, help='max import time of the package, in milliseconds')
+    parser.add_argument('--output', help='json file to save results')
+    args = parser.parse_args()
+
+    results_ = run(repeat=args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results_, f, indent=2)
+
+    package_ms = results_['results']['slackviews']['median_ms']
+    if package_ms > args.budget:
+        print(f'OVER BUDGET slackviews: {package_ms:.2f} ms > {args.budget:.2f} ms')
+        sys.exit(1)
@@ -0,0 +1,152 @@
+"""
+Benchmark of the memory held by views kept in memory, i.e. in-flight modals, one per user, personalized from the same
+base view. It compares representations of the views:
+
+ - regular: each view is built from scratch
+ - interned: each view is built from scratch, with interning of texts enabled
+ - frozen: a frozen base view is cloned for each user, copying only the personalized block
+ - lazy: only the json of each view is kept, to be deserialized when needed
+
+Memory is measured with tracemalloc, and with AbstractBlock.memory_usage, counting shared objects once. Results can be
+saved to a json file, and compared with a previous one to flag regressions:
+
+    python -m benchmarks.bench_memory --output before.json
+    python -m benchmarks.bench_memory --compare before.json --threshold 0.1
+
+The exit status is 1 if any scenario takes more memory than the threshold
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_views import build_view
+from slackviews.view import AbstractText
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+VARIANTS = ('regular', 'interned', 'frozen', 'lazy')
+BLOCK_SIZES = (10, 100)
+
+
+def personalize(view, user):
+    """
+    Changes the text of the first section of the view, as done for each user
+    :param view: The view, built by bench_views.build_view
+    :param user: A number identifying the user
+    :return: The view
+    """
+    view.builder().edit_blocks().edit(1).text__(f'Hello user {user}, this is your personal view')
+    return view
+
+
+def build_views(variant, size, number):
+    """
+    Builds the views of supplied variant
+    :param variant: One of VARIANTS
+    :param size: Number of blocks of each view
+    :param number: Number of views
+    :return: A list of views, or json strings for variant lazy
+    """
+    if variant == 'regular':
+        return [personalize(build_view(size), user) for user in range(number)]
+    elif variant == 'interned':
+        AbstractText.enable_interning()
+        try:
+            return [personalize(build_view(size), user) for user in range(number)]
+        finally:
+            AbstractText.disable_interning()
+    elif variant == 'frozen':
+        base = build_view(size).freeze()
+        return [personalize(base.clone(), user) for user in range(number)]
+    elif variant == 'lazy':
+        return [personalize(build_view(size), user).serialize(as_json=True) for user in range(number)]
+    raise AttributeError(f'Unknown variant [{variant}]')
+
+
+def measure(variant, size, number):
+    """
+    Measures the memory held by the views of supplied variant
+    :return: A dictionary with bytes per view measured by tracemalloc, and by memory_usage
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        views = build_views(variant, size, number)
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    seen = set()
+    if variant == 'lazy':
+        usage = sum(sys.getsizeof(view) for view in views)
+    else:
+        usage = sum(view.memory_usage(seen=seen) for view in views)
+    return {'views': number, 'bytes_per_view': traced / number, 'memory_usage_per_view': usage / number}
+
+
+def run(number=100, filter_=None):
+    """
+    Runs all scenarios
+    :param number: Number of views of each scenario
+    :param filter_: If supplied, only scenarios which name contains it are run
+    :return: A dictionary with the environment and the results by scenario
+    """
+    results = dict()
+    for size in BLOCK_SIZES:
+        for variant in VARIANTS:
+            name = f'{variant}[{size}]'
+            if filter_ and filter_ not in name:
+                continue
+            results[name] = measure(variant, size, number)
+            print(f'{name:>16}: {results[name]["bytes_per_view"]:12.0f} bytes/view (tracemalloc) '
+                  f'{results[name]["memory_usage_per_view"]:12.0f} bytes/view (memory_usage)', file=sys.stderr)
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares the memory per view of each scenario with the one in a baseline
+    :param results: Results provided by run()
+    :param baseline: Results of a previous run
+    :param threshold: Max allowed growth, i.e. 0.1 for 10%
+    :return: A list of tuples (scenario, baseline bytes, current bytes, ratio) of scenarios taking more memory
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['bytes_per_view'] / previous['bytes_per_view']
+        if ratio > 1 + threshold:
+            regressions.append((name, previous['bytes_per_view'], result['bytes_per_view'], ratio))
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--views', type=int, default=100, help='number of views of each scenario')
+    parser.add_argument('--filter', help='only run scenarios which name contains this text')
+    parser.add_argument('--output', help='json file to save results')
+    parser.add_argument('--compare', help='json file with results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.1, help='max allowed growth, 0.1 is 10%%')
+    args = parser.parse_args()
+
+    results_ = run(args.views, args.filter)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results_, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions_ = compare(results_, json.load(f), args.threshold)
+        for name_, before, after, ratio_ in regressions_:
+            print(f'REGRESSION {name_}: {before:.0f} bytes/view -> {after:.0f} bytes/view (x{ratio_:.2f})')
+        sys.exit(1 if regressions_ else 0)
@@ -0,0 +1,105 @@
+"""
+Benchmark of the latency of the event loop while views are rendered for many users, i.e. a mass refresh of Home
+tabs. A ticker coroutine sleeps 1 ms in a loop, and its lateness is recorded while views are rendered:
+
+ - inline: views are built and serialized in the event loop, yielding to it between views
+ - threads: views are rendered with render_async in the default executor of the loop
+ - processes: views are rendered with render_async in a ProcessPoolExecutor
+
+    python -m benchmarks.bench_render_async --users 200 --blocks 100
+"""
+import argparse
+import asyncio
+import functools
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.bench_views import build_view
+from slackviews.rendering import render, render_async
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+MODES = ('inline', 'threads', 'processes')
+TICK = 0.001
+
+
+def build_home(num_of_blocks, user):
+    """
+    Builds the view of a user, see bench_views.build_view. It's a module function, so it can be pickled
+    """
+    return build_view(num_of_blocks)
+
+
+async def ticker(lags, stop):
+    """
+    Records the lateness of sleeps of TICK seconds, until stop is set
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def measure(mode, users, num_of_blocks, concurrency):
+    """
+    Renders the views of supplied number of users in supplied mode, measuring the lateness of the event loop
+    :return: A dictionary with the duration of renders, and the median, p99 and max lateness in milliseconds
+    """
+    lags, stop = [], asyncio.Event()
+    task = asyncio.ensure_future(ticker(lags, stop))
+    await asyncio.sleep(TICK)
+    view_factory = functools.partial(build_home, num_of_blocks)
+
+    async def consumer(user, view):
+        pass
+
+    start = time.perf_counter()
+    if mode == 'inline':
+        for user in range(users):
+            render(view_factory, user)
+            await asyncio.sleep(0)
+    elif mode == 'threads':
+        await render_async(view_factory, range(users), consumer, concurrency=concurrency)
+    else:
+        with ProcessPoolExecutor(concurrency) as executor:
+            await render_async(view_factory, range(users), consumer, executor=executor, concurrency=concurrency)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await task
+    lags.sort()
+    return {'seconds': elapsed, 'median_lag_ms': statistics.median(lags) * 1000,
+            'p99_lag_ms': lags[int(len(lags) * 0.99)] * 1000, 'max_lag_ms': lags[-1] * 1000}
+
+
+def run(users=200, num_of_blocks=100, concurrency=4):
+    """
+    Runs all modes
+    :return: A dictionary with results by mode
+    """
+    results = dict()
+    executor = ThreadPoolExecutor(concurrency)
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(executor)
+    try:
+        for mode in MODES:
+            results[mode] = loop.run_until_complete(measure(mode, users, num_of_blocks, concurrency))
+            print(f'{mode:>10}: {results[mode]["seconds"]:8.2f} s, event loop lag median '
+                  f'{results[mode]["median_lag_ms"]:.2f} ms, p99 {results[mode]["p99_lag_ms"]:.2f} ms, '
+                  f'max {results[mode]["max_lag_ms"]:.2f} ms', file=sys.stderr)
+    finally:
+        loop.close()
+        executor.shutdown(wait=True)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=200, help='number of views to render')
+    parser.add_argument('--blocks', type=int, default=100, help='number of blocks of each view')
+    parser.add_argument('--concurrency', type=int, default=4, help='max renders in flight')
+    args = parser.parse_args()
+    run(args.users, args.blocks, args.concurrency)
@@ -0,0 +1,72 @@
+"""
+Benchmark of a mass refresh of Home tabs with PublishScheduler, against a local StubSlackServer that rate limits
+views.publish as Slack does, responding 429 with Retry-After when requests exceed its rate. Some users get many
+updates, that are coalesced by the scheduler. Rates are scaled up, so it runs in seconds:
+
+    python -m benchmarks.bench_scheduler --users 500 --updates 2 --limit 200 --rate 180
+"""
+import argparse
+import sys
+import threading
+import time
+
+from benchmarks.bench_views import build_view
+from slackviews.client import SlackClient
+from slackviews.scheduler import PublishScheduler, TokenBucket
+from slackviews.stub import StubSlackServer
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def rate_limiter(limit):
+    """
+    Provides a response of the stub that rate limits requests to supplied requests per second
+    """
+    bucket, lock = TokenBucket(limit, capacity=max(1, int(limit / 10))), threading.Lock()
+
+    def respond(request):
+        with lock:
+            if bucket.consume():
+                return None
+            return 429, {'ok': False, 'error': 'ratelimited'}, {'Retry-After': f'{bucket.wait_time():.3f}'}
+    return respond
+
+
+def run(users=500, updates=2, limit=200, rate=180, workers=2, num_of_blocks=10):
+    """
+    Submits updates of the Home tab of users, and publishes them
+    :param users: Number of users
+    :param updates: Number of updates of each user, submitted in rounds
+    :param limit: Requests per second allowed by the stub
+    :param rate: Requests per second of the scheduler
+    :param workers: Threads of the scheduler
+    :param num_of_blocks: Blocks of each view
+    :return: The metrics of the scheduler
+    """
+    view = build_view(num_of_blocks).serialize(as_json=True)
+    with StubSlackServer(responses={'views.publish': rate_limiter(limit)}, record=False) as server, \
+            SlackClient('any token', base_url=server.api_url) as client:
+        scheduler = PublishScheduler(client, workers=workers, rate=rate)
+        start = time.perf_counter()
+        with scheduler:
+            for _ in range(updates):
+                scheduler.submit_all((f'U{user}', view) for user in range(users))
+            scheduler.join()
+        elapsed = time.perf_counter() - start
+    metrics = scheduler.metrics()
+    print(f'{metrics["published"]} views published in {elapsed:.2f} s ({metrics["throughput"]:.0f} views/s), '
+          f'{metrics["coalesced"]} coalesced, {metrics["rate_limited"]} rate limited, {metrics["failed"]} failed, '
+          f'max queue depth {metrics["max_queue_depth"]}', file=sys.stderr)
+    return metrics
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--updates', type=int, default=2, help='updates of each user')
+    parser.add_argument('--limit', type=float, default=200, help='requests per second allowed by the stub')
+    parser.add_argument('--rate', type=float, default=180, help='requests per second of the scheduler')
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+    run(args.users, args.updates, args.limit, args.rate, args.workers)
@@ -0,0 +1,83 @@
+"""
+Benchmark of OptionsIndex and OptionsProvider, answering type-ahead queries over a large corpus of options
+
+    python -m benchmarks.bench_suggestions --options 1000000
+"""
+import argparse
+import random
+import string
+import time
+
+from slackviews.suggestions import OptionsIndex, OptionsProvider
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def _corpus(size, seed):
+    """
+    Builds a corpus of options with two or three random words each
+    :param size: Number of options
+    :param seed: Seed of the random generator
+    :return: A list of tuples (text, value)
+    """
+    rnd = random.Random(seed)
+    syllables = [a + b for a in 'bcdfghjklmnprstvz' for b in 'aeiou']
+    words = [''.join(rnd.choice(syllables) for _ in range(rnd.randint(2, 4))).capitalize() for _ in range(50000)]
+    return [(' '.join(rnd.choice(words) for _ in range(rnd.randint(2, 3))), f'{i:08d}') for i in range(size)]
+
+
+def _queries(corpus, number, seed):
+    """
+    Builds queries like those typed by users, prefixes of words in the corpus and random strings
+    """
+    rnd = random.Random(seed)
+    queries = []
+    for _ in range(number):
+        text = rnd.choice(corpus)[0].split()
+        word = rnd.choice(text).lower()
+        queries.append(word[:rnd.randint(1, len(word))])
+    queries.extend(''.join(rnd.choice(string.ascii_lowercase) for _ in range(3)) for _ in range(number // 10))
+    return queries
+
+
+def run(options, queries, substring, seed=0):
+    """
+    Runs the benchmark
+    :return: A dictionary with the results
+    """
+    corpus = _corpus(options, seed)
+    queries = _queries(corpus, queries, seed)
+
+    start = time.perf_counter()
+    index = OptionsIndex(corpus, substring=substring)
+    build_time = time.perf_counter() - start
+
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    provider = OptionsProvider()
+    provider.register('any', index)
+    start = time.perf_counter()
+    for query in queries * 2:
+        provider.options('any', query)
+    provider_time = time.perf_counter() - start
+
+    return {'options': options, 'queries': len(queries), 'substring': substring, 'build_s': build_time,
+            'search_p50_ms': timings[len(timings) // 2] * 1000,
+            'search_p99_ms': timings[int(len(timings) * .99)] * 1000, 'search_max_ms': timings[-1] * 1000,
+            'provider_total_s': provider_time, 'provider_cache': provider.stats()}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--options', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--substring', action='store_true', help='build the trigram index too')
+    args = parser.parse_args()
+    for k, v in run(args.options, args.queries, args.substring).items():
+        print(f'{k:>18}: {v}')
@@ -0,0 +1,230 @@
+"""
+Benchmark suite of views: builders, serialization to dict and json, deserialization from dict and json, __eq__ and
+parsing of interactions, with views from 1 to 100 blocks and select menus from 10 to 1000 options.
+
+Results can be saved to a json file, and compared with a previous one to flag regressions:
+
+    python -m benchmarks.bench_views --output before.json
+    ... change something ...
+    python -m benchmarks.bench_views --compare before.json --threshold 0.1
+
+The exit status is 1 if any scenario is slower than the threshold
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from urllib.parse import quote_plus
+
+from slackviews.payloads import parse_interaction
+from slackviews.view import Modal, BlocksFactory, SelectMenu, Option
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+BLOCK_SIZES = (1, 10, 100)
+OPTION_SIZES = (10, 100, 1000)
+
+
+# -- fixtures
+
+def build_view(num_of_blocks):
+    """
+    Builds a modal with supplied number of blocks, cycling through the main types of blocks
+    :param num_of_blocks: Number of blocks of the view
+    :return: An instance of Modal
+    """
+    blocks = Modal.Builder().title('Benchmark').submit_('Submit').close_('Close').callback_id_('benchmark') \
+        .private_metadata_({'user': 'U000000', 'page': 1}).Blocks()
+    for i in range(num_of_blocks):
+        kind = i % 6
+        if kind == 0:
+            blocks.Header().block_id_(f'header-{i}').text(f'Header {i}')
+        elif kind == 1:
+            blocks.Section().block_id_(f'section-{i}').text__(f'*Section* {i} with some _markdown_ text') \
+                .accessory_().Button().action_id(f'button-{i}').text('Click').value_(str(i))
+        elif kind == 2:
+            blocks.Input().block_id_(f'input-{i}').label(f'Input {i}').element().PlainTextInput() \
+                .action_id(f'text-{i}').placeholder_('Type something').multiline_(True)
+        elif kind == 3:
+            blocks.Actions().block_id_(f'actions-{i}').element().Button().action_id(f'ok-{i}').text('OK') \
+                .style_('primary').up().element().SelectMenu().action_id(f'select-{i}').placeholder('Choose') \
+                .options_from(texts=[f'Option {j}' for j in range(5)], values=[str(j) for j in range(5)])
+        elif kind == 4:
+            blocks.Context().block_id_(f'context-{i}').element().Text().text(f'Context {i}')
+        else:
+            blocks.Divider().block_id_(f'divider-{i}')
+    return blocks.up().build()
+
+
+def build_select_menu(num_of_options):
+    """
+    Builds a select menu with supplied number of options. Menus with more than SelectMenu.MAX_OPTIONS options
+    use groups of options
+    :param num_of_options: Number of options of the menu
+    :return: An instance of SelectMenu
+    """
+    builder = SelectMenu.Builder().action_id('menu').placeholder('Choose')
+    if num_of_options <= SelectMenu.MAX_OPTIONS:
+        return builder.options_from(texts=[f'Option {i}' for i in range(num_of_options)],
+                                    values=[f'value-{i}' for i in range(num_of_options)]).build()
+    for start in range(0, num_of_options, SelectMenu.MAX_OPTIONS):
+        end = min(start + SelectMenu.MAX_OPTIONS, num_of_options)
+        builder.OptionGroup__().label(f'Group {start}') \
+            .options_from(texts=[f'Option {i}' for i in range(start, end)],
+                          values=[f'value-{i}' for i in range(start, end)])
+    return builder.build()
+
+
+def view_submission_body(view):
+    """
+    Builds the raw body of a view_submission request for supplied view, as sent by Slack
+    :param view: An instance of View
+    :return: The body as bytes
+    """
+    serialized = view.serialize()
+    values = dict()
+    for block in serialized['blocks']:
+        if block['type'] == 'input':
+            values[block['block_id']] = {block['element']['action_id']: {'type': 'plain_text_input',
+                                                                         'value': 'any value'}}
+    serialized.update({'id': 'V000000', 'state': {'values': values}})
+    payload = {'type': 'view_submission', 'team': {'id': 'T000000'}, 'user': {'id': 'U000000'},
+               'api_app_id': 'A000000', 'token': 'token', 'trigger_id': 'trigger', 'view': serialized}
+    return f'payload={quote_plus(json.dumps(payload))}'.encode('utf-8')
+
+
+# -- scenarios
+
+def scenarios():
+    """
+    Provides all scenarios of the suite
+    :return: A list of tuples (name, callable without arguments)
+    """
+    scenarios_ = []
+    for size in BLOCK_SIZES:
+        view = build_view(size)
+        other = build_view(size)
+        view_dict = view.serialize()
+        view_json = view.serialize(as_json=True)
+        body = view_submission_body(view)
+        inputs = [(block['block_id'], block['element']['action_id'])
+                  for block in view_dict['blocks'] if block['type'] == 'input']
+
+        def parse(body=body, inputs=inputs):
+            interaction = parse_interaction(body)
+            for block_id, action_id in inputs:
+                interaction.get_textinput_value(block_id, action_id)
+            interaction.private_metadata()
+
+        scenarios_.extend([
+            (f'build_view[{size}]', lambda size=size: build_view(size)),
+            (f'serialize_dict[{size}]', view.serialize),
+            (f'serialize_json[{size}]', lambda view=view: view.serialize(as_json=True)),
+            (f'deserialize_dict[{size}]', lambda view_dict=view_dict: BlocksFactory.of(view_dict)),
+            (f'deserialize_json[{size}]', lambda view_json=view_json: BlocksFactory.of(view_json, from_json=True)),
+            (f'eq[{size}]', lambda view=view, other=other: view == other),
+            (f'parse_view_submission[{size}]', parse),
+        ])
+
+    for size in OPTION_SIZES:
+        menu = build_select_menu(size)
+        menu_dict = menu.serialize()
+        scenarios_.extend([
+            (f'build_select_menu[{size}]', lambda size=size: build_select_menu(size)),
+            (f'serialize_select_menu[{size}]', menu.serialize),
+            (f'deserialize_select_menu[{size}]', lambda menu_dict=menu_dict: BlocksFactory.of(menu_dict)),
+            (f'of_many_options[{size}]', lambda size=size: Option.of_many(
+                pairs=[(f'Option {i}', f'value-{i}') for i in range(size)])),
+        ])
+    return scenarios_
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """
+    Measures the time of supplied function, calling it in loops that last at least min_time
+    :param function: A callable without arguments
+    :param repeat: Number of loops
+    :param min_time: Min duration of each loop, in seconds
+    :return: A dictionary with best and median time per call, in microseconds, and the number of calls per loop
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return {'best_us': min(timings), 'median_us': statistics.median(timings), 'calls': number}
+
+
+def run(filter_=None, repeat=5, min_time=0.2):
+    """
+    Runs the scenarios of the suite
+    :param filter_: If supplied, only scenarios which name contains it are run
+    :param repeat: Number of loops of each scenario
+    :param min_time: Min duration of each loop, in seconds
+    :return: A dictionary with the environment and the results by scenario
+    """
+    results = dict()
+    for name, function in scenarios():
+        if filter_ and filter_ not in name:
+            continue
+        results[name] = measure(function, repeat, min_time)
+        print(f'{name:>32}: {results[name]["best_us"]:12.2f} us', file=sys.stderr)
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares the best time of each scenario with the one in a baseline
+    :param results: Results provided by run()
+    :param baseline: Results of a previous run
+    :param threshold: Max allowed slowdown, i.e. 0.1 for 10%
+    :return: A list of tuples (scenario, baseline time, current time, ratio) of slower scenarios
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        ratio = result['best_us'] / previous['best_us']
+        if ratio > 1 + threshold:
+            regressions.append((name, previous['best_us'], result['best_us'], ratio))
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='only run scenarios which name contains this text')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='min seconds of each loop of a scenario')
+    parser.add_argument('--output', help='json file to save results')
+    parser.add_argument('--compare', help='json file with results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.1, help='max allowed slowdown, 0.1 is 10%%')
+    args = parser.parse_args()
+
+    results_ = run(args.filter, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results_, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions_ = compare(results_, json.load(f), args.threshold)
+        for name_, before, after, ratio_ in regressions_:
+            print(f'REGRESSION {name_}: {before:.2f} us -> {after:.2f} us (x{ratio_:.2f})')
+        sys.exit(1 if regressions_ else 0)
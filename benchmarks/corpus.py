@@ -0,0 +1,343 @@
+"""
+Seeded generator of a synthetic corpus of Block Kit documents, to feed load and fuzz benchmarks: random but valid
+modals, home tabs and messages, built with the block classes of slackviews, and the view_submission and block_actions
+payloads Slack would send for them.
+
+The same seed always provides the same corpus. Sizes follow triangular distributions (min, mode, max), that can be
+changed to look like production traffic, and large corpora can be written to disk as json lines:
+
+    python -m benchmarks.corpus --count 100000 --seed 1 --output corpus.jsonl
+
+Each line is a json object {"kind": kind, "data": document}, where kind is one of modal, home, message,
+view_submission or block_actions. Views and messages are serialized blocks, and payloads are raw payloads, ready for
+slackviews.payloads.interaction_of.
+"""
+import argparse
+import json
+import random
+import sys
+
+from slackviews.view import Modal, Home, BlocksArray, SelectMenu
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+KINDS = ('modal', 'home', 'message', 'view_submission', 'block_actions')
+
+# max number of blocks in a message
+MAX_MESSAGE_BLOCKS = 50
+
+_WORDS = ('account', 'approve', 'budget', 'customer', 'deploy', 'invoice', 'meeting', 'order', 'project', 'release',
+          'report', 'request', 'review', 'service', 'status', 'task', 'team', 'ticket', 'update', 'vacation')
+
+
+class CorpusGenerator:
+    """
+    Generates random but valid views, messages and interaction payloads. Sizes are tuples (min, mode, max) of
+    triangular distributions
+    """
+
+    def __init__(self, seed=0, blocks=(1, 10, 100), options=(2, 8, 100), words=(1, 6, 60), kinds=None):
+        """
+        :param seed: Seed of the random generator
+        :param blocks: Distribution of the number of blocks of views. Messages are limited to 50 blocks
+        :param options: Distribution of the number of options of select menus
+        :param words: Distribution of the number of words of texts
+        :param kinds: Weights of each kind of document in records(), a dictionary {kind: weight}. By default all kinds
+        have the same weight
+        """
+        self.random = random.Random(seed)
+        self.blocks = blocks
+        self.options = options
+        self.words = words
+        self.kinds = kinds or {kind: 1 for kind in KINDS}
+        self._count = 0
+
+    def size(self, distribution):
+        """
+        Provides a random size
+        :param distribution: A tuple (min, mode, max)
+        :return: An integer between min and max
+        """
+        low, mode, high = distribution
+        return int(round(self.random.triangular(low, high, mode)))
+
+    def text(self, max_length=None):
+        """
+        Provides a random text, using the distribution of words of texts
+        :param max_length: Max length of the text
+        :return: A string
+        """
+        text = ' '.join(self.random.choice(_WORDS) for _ in range(max(1, self.size(self.words))))
+        return text[:max_length].strip() if max_length else text
+
+    def label(self, max_length):
+        """
+        Provides a random short text, i.e. for titles, buttons or options
+        :param max_length: Max length of the text
+        :return: A string
+        """
+        text = ' '.join(self.random.choice(_WORDS) for _ in range(self.random.randint(1, 3))).capitalize()
+        return text[:max_length].strip() if max_length else text
+
+    def _id(self, prefix):
+        self._count += 1
+        return f'{prefix}-{self._count}'
+
+    # -- blocks
+
+    def _select_menu(self, builder):
+        """
+        Adds options to a SelectMenu builder, using option groups for large menus
+        """
+        num_of_options = min(self.size(self.options), SelectMenu.MAX_OPTIONS * SelectMenu.MAX_OPTION_GROUPS)
+        if num_of_options <= SelectMenu.MAX_OPTIONS or self.random.random() < .5:
+            num_of_options = min(num_of_options, SelectMenu.MAX_OPTIONS)
+            builder.options_from(texts=[self.label(75) for _ in range(num_of_options)],
+                                 values=[self._id('value') for _ in range(num_of_options)])
+        else:
+            for start in range(0, num_of_options, SelectMenu.MAX_OPTIONS):
+                size = min(SelectMenu.MAX_OPTIONS, num_of_options - start)
+                builder.OptionGroup__().label(self.label(75)) \
+                    .options_from(texts=[self.label(75) for _ in range(size)],
+                                  values=[self._id('value') for _ in range(size)])
+        return builder
+
+    def _add_block(self, blocks, allow_input):
+        """
+        Appends a random block to a BlocksArray builder
+        :param blocks: A BlocksArray builder
+        :param allow_input: If True, Input blocks can be added
+        """
+        kinds = ['section', 'section', 'actions', 'context', 'divider', 'header']
+        if allow_input:
+            kinds.extend(['input'] * 3)
+        kind = self.random.choice(kinds)
+        if kind == 'section':
+            section = blocks.Section().block_id_(self._id('section'))
+            if self.random.random() < .7:
+                section.text__(self.text(3000), verbatim=self.random.random() < .1)
+            else:
+                for _ in range(self.random.randint(1, 10)):
+                    section.field__(self.text(2000))
+            accessory = self.random.random()
+            if accessory < .3:
+                section.accessory_().Button().action_id(self._id('button')).text(self.label(75)).value_(self._id('v'))
+            elif accessory < .45:
+                self._select_menu(section.accessory_().SelectMenu().action_id(self._id('select'))
+                                  .placeholder(self.label(150)))
+            elif accessory < .5:
+                overflow = section.accessory_().Overflow().action_id(self._id('overflow'))
+                overflow.options_from(pairs=[(self.label(75), self._id('value'))
+                                             for _ in range(self.random.randint(2, 5))])
+        elif kind == 'actions':
+            actions = blocks.Actions().block_id_(self._id('actions'))
+            for _ in range(self.random.randint(1, 5)):
+                if self.random.random() < .7:
+                    button = actions.element().Button().action_id(self._id('button')).text(self.label(75)) \
+                        .value_(self._id('v'))
+                    if self.random.random() < .3:
+                        button.style_(self.random.choice(('primary', 'danger')))
+                else:
+                    self._select_menu(actions.element().SelectMenu().action_id(self._id('select'))
+                                      .placeholder(self.label(150)))
+        elif kind == 'context':
+            context = blocks.Context().block_id_(self._id('context'))
+            for _ in range(self.random.randint(1, 5)):
+                if self.random.random() < .8:
+                    context.element().Text().text(self.text(3000))
+                else:
+                    context.element().Image().image_url(f'https://example.com/{self._id("image")}.png') \
+                        .alt_text(self.label(2000))
+        elif kind == 'divider':
+            blocks.Divider().block_id_(self._id('divider'))
+        elif kind == 'header':
+            blocks.Header().block_id_(self._id('header')).text(self.label(150))
+        else:
+            _input = blocks.Input().block_id_(self._id('input')).label(self.label(2000)) \
+                .optional_(self.random.random() < .3)
+            if self.random.random() < .7:
+                _input.element().PlainTextInput().action_id(self._id('text')) \
+                    .multiline_(self.random.random() < .3)
+            else:
+                self._select_menu(_input.element().SelectMenu().action_id(self._id('select'))
+                                  .placeholder(self.label(150)))
+
+    def blocks_array(self, max_blocks=MAX_MESSAGE_BLOCKS, allow_input=False):
+        """
+        Provides a random array of blocks, i.e. for a message
+        :param max_blocks: Max number of blocks
+        :param allow_input: If True, Input blocks can be added
+        :return: An instance of BlocksArray
+        """
+        blocks = BlocksArray.Builder()
+        for _ in range(max(1, min(max_blocks, self.size(self.blocks)))):
+            self._add_block(blocks, allow_input)
+        return blocks.build()
+
+    def modal(self):
+        """
+        Provides a random modal, with input blocks
+        :return: An instance of Modal
+        """
+        # submit is required if there are input blocks
+        modal = Modal.Builder().title(self.label(24)).close_(self.label(24)).submit_(self.label(24)) \
+            .callback_id_(self._id('callback')) \
+            .private_metadata_({'user': self._id('U'), 'step': self.random.randint(1, 5)}).build()
+        setattr(modal, '_blocks', self.blocks_array(max_blocks=100, allow_input=True))
+        return modal
+
+    def home(self):
+        """
+        Provides a random home tab, without input blocks
+        :return: An instance of Home
+        """
+        home = Home.Builder().title(self.label(24)).callback_id_(self._id('callback')).build()
+        setattr(home, '_blocks', self.blocks_array(max_blocks=100))
+        return home
+
+    # -- payloads
+
+    def view_submission(self, modal=None):
+        """
+        Provides the view_submission payload of a modal, with random values for its input blocks
+        :param modal: An instance of Modal. If None, a random one is generated
+        :return: The raw payload as a dictionary
+        """
+        view = (modal or self.modal()).serialize()
+        values = dict()
+        for block in view['blocks']:
+            if block['type'] != 'input':
+                continue
+            element = block['element']
+            if element['type'] == 'plain_text_input':
+                value = {'type': 'plain_text_input', 'value': self.text()}
+            else:
+                options = element.get('options') or [opt for group in element['option_groups']
+                                                     for opt in group['options']]
+                value = {'type': element['type'], 'selected_option': self.random.choice(options)}
+            values[block['block_id']] = {element['action_id']: value}
+        view.update({'id': self._id('V'), 'team_id': 'T000000', 'state': {'values': values},
+                     'hash': self._id('hash'), 'app_id': 'A000000'})
+        return {'type': 'view_submission', 'team': {'id': 'T000000', 'domain': 'example'},
+                'user': {'id': self._id('U'), 'username': self.label(20), 'team_id': 'T000000'},
+                'api_app_id': 'A000000', 'token': 'token', 'trigger_id': self._id('trigger'), 'view': view}
+
+    def block_actions(self, view=None):
+        """
+        Provides the block_actions payload of a click on a random button or select menu of a view or message
+        :param view: An instance of View, or a BlocksArray for a message. If None, a random home tab or message is
+        generated
+        :return: The raw payload as a dictionary
+        """
+        if view is None:
+            view = self.home() if self.random.random() < .5 else self.blocks_array()
+        serialized = view.serialize()
+        blocks = serialized['blocks'] if isinstance(serialized, dict) else serialized
+        elements = [(block, elem) for block in blocks
+                    for elem in block.get('elements', []) + ([block['accessory']] if 'accessory' in block else [])
+                    if elem['type'] in ('button', 'static_select', 'overflow')]
+        if not elements:
+            # there must be at least one interactive element, a button is added
+            button = {'type': 'button', 'action_id': self._id('button'), 'value': self._id('v'),
+                      'text': {'type': 'plain_text', 'text': self.label(75), 'emoji': False}}
+            block = {'type': 'actions', 'block_id': self._id('actions'), 'elements': [button]}
+            blocks.append(block)
+            elements.append((block, button))
+
+        block, element = self.random.choice(elements)
+        action = {'type': element['type'], 'block_id': block['block_id'], 'action_id': element['action_id'],
+                  'action_ts': f'{self.random.randint(1600000000, 1700000000)}.{self._count:06d}'}
+        if element['type'] == 'button':
+            action.update({'text': element['text'], 'value': element.get('value', '')})
+        else:
+            options = element.get('options') or [opt for group in element['option_groups'] for opt in group['options']]
+            action['selected_option'] = self.random.choice(options)
+
+        payload = {'type': 'block_actions', 'team': {'id': 'T000000', 'domain': 'example'},
+                   'user': {'id': self._id('U'), 'username': self.label(20), 'team_id': 'T000000'},
+                   'api_app_id': 'A000000', 'token': 'token', 'trigger_id': self._id('trigger'), 'actions': [action]}
+        if isinstance(serialized, dict):
+            serialized.update({'id': self._id('V'), 'team_id': 'T000000', 'state': {'values': {}}})
+            payload.update({'container': {'type': 'view', 'view_id': serialized['id']}, 'view': serialized})
+        else:
+            ts = action['action_ts']
+            payload.update({'container': {'type': 'message', 'message_ts': ts, 'channel_id': 'C000000'},
+                            'channel': {'id': 'C000000', 'name': self.label(20)},
+                            'message': {'type': 'message', 'ts': ts, 'text': '', 'blocks': serialized}})
+        return payload
+
+    # -- corpus
+
+    def record(self, kind=None):
+        """
+        Provides a random document
+        :param kind: The kind of document, one of KINDS. If None, it's chosen using the weights of kinds
+        :return: A dictionary {'kind': kind, 'data': document as a dictionary or a list}
+        """
+        if kind is None:
+            kind = self.random.choices(list(self.kinds), weights=list(self.kinds.values()))[0]
+        if kind == 'modal':
+            data = self.modal().serialize()
+        elif kind == 'home':
+            data = self.home().serialize()
+        elif kind == 'message':
+            data = self.blocks_array().serialize()
+        elif kind == 'view_submission':
+            data = self.view_submission()
+        elif kind == 'block_actions':
+            data = self.block_actions()
+        else:
+            raise AttributeError(f'Unknown kind of document [{kind}]')
+        return {'kind': kind, 'data': data}
+
+    def records(self, count, kind=None):
+        """
+        Provides random documents, one by one
+        :param count: Number of documents
+        :param kind: The kind of documents, if None they're chosen using the weights of kinds
+        :return: A generator of dictionaries {'kind': kind, 'data': document}
+        """
+        for _ in range(count):
+            yield self.record(kind)
+
+    def write(self, file, count, kind=None):
+        """
+        Writes random documents as json lines
+        :param file: A file object opened for writing text
+        :param count: Number of documents
+        :param kind: The kind of documents, if None they're chosen using the weights of kinds
+        """
+        for record in self.records(count, kind):
+            file.write(json.dumps(record))
+            file.write('\n')
+
+
+def read(path):
+    """
+    Reads a corpus written as json lines
+    :param path: Path of the corpus
+    :return: A generator of dictionaries {'kind': kind, 'data': document}
+    """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--kind', choices=KINDS, help='only generate this kind of documents')
+    parser.add_argument('--blocks', type=int, nargs=3, default=(1, 10, 100), metavar=('MIN', 'MODE', 'MAX'))
+    parser.add_argument('--options', type=int, nargs=3, default=(2, 8, 100), metavar=('MIN', 'MODE', 'MAX'))
+    parser.add_argument('--output', help='json lines file, stdout if not supplied')
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(args.seed, blocks=tuple(args.blocks), options=tuple(args.options))
+    if args.output:
+        with open(args.output, 'w') as output:
+            generator.write(output, args.count, args.kind)
+    else:
+        generator.write(sys.stdout, args.count, args.kind)
@@ -34,11 +34,11 @@ setup(
     url='https://github.com/escamez/slackviews',
     download_url=f'https://github.com/escamez/slackviews/archive/v{_version()}.tar.gz',
     license='MIT',
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests', 'benchmarks')),
     include_package_data=True,
     zip_safe=False,
     keywords=_read_file('KEYWORDS', non_empty=True),
     install_requires=[],
     classifiers=_read_file('CLASSIFIERS', non_empty=True),
-    python_requires='>=3.6'
+    python_requires='>=3.7'
 )
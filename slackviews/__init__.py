@@ -1,7 +1,39 @@
 """
 Module slackviews
+
+Classes are imported from their modules on first access (PEP 562), so importing the package is cheap, i.e. for apps
+that only import slackviews.payloads, or CLIs that import the package but rarely build views.
 """
 
-from slackviews.view import AbstractBlock, AbstractBuilder, AbstractText, PlainText, MarkDown, Header, Image, \
-    Confirmation, Button, Option, OptionGroup, SelectMenu, MultiSelectMenu, Overflow, PlainTextInput, Section, \
-    Divider, Actions, Context, Input, View, Modal, Home, BlocksArray, BlocksFactory
+import importlib
+
+# name -> module that defines it
+_LAZY_ATTRIBUTES = {name: 'slackviews.view' for name in (
+    'AbstractBlock', 'AbstractBuilder', 'AbstractText', 'PlainText', 'MarkDown', 'Header', 'Image', 'Confirmation',
+    'Button', 'Option', 'OptionGroup', 'SelectMenu', 'MultiSelectMenu', 'ExternalSelect', 'Overflow', 'PlainTextInput',
+    'Section', 'Divider', 'Actions', 'Context', 'Input', 'View', 'Modal', 'Home', 'BlocksArray', 'BlocksFactory')}
+_LAZY_ATTRIBUTES['BlockProfiler'] = 'slackviews.profiling'
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """
+    Imports the module of supplied attribute, and caches the attribute in the package. Submodules, i.e. payloads,
+    are imported on first access too
+    """
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        try:
+            return importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,318 @@
+"""
+Module with an optional client of Slack's Web API, to send views and arrays of blocks built with this library to
+views.open, views.update, views.publish, chat.postMessage and response_url, with no dependencies but the standard
+library.
+
+Connections are kept alive and reused by requests, in a pool per host, so a mass refresh of Home tabs doesn't pay a
+TCP and TLS handshake per view. Views are sent as they are: instances of AbstractBlock and BlocksArray are serialized,
+but strings and bytes are taken as pre-serialized json, i.e. from render_async or frozen views, and pasted in the body
+of the request without parsing and serializing them again.
+
+    with SlackClient(token) as client:
+        client.views_publish(user_id, home)
+        client.views_open(trigger_id, modal.serialize(as_json=True))
+
+For tests and benchmarks, slackviews.stub.StubSlackServer mimics the Web API locally.
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import http.client
+import json
+import threading
+from urllib.parse import urlsplit
+
+from slackviews.view import AbstractBlock, BlocksArray
+
+# base url of Slack's Web API
+SLACK_API_URL = 'https://slack.com/api/'
+
+
+class SlackApiException(Exception):
+    """
+    Exception raised when Slack's Web API responds with an error status, or with ok false
+    """
+
+    def __init__(self, message, status=None, response=None, retry_after=None):
+        """
+        :param message: The error, i.e. 'invalid_arguments'
+        :param status: The HTTP status of the response
+        :param response: The response, as a dictionary
+        :param retry_after: Seconds to wait before retrying, when the request was rate limited (status 429)
+        """
+        super().__init__(message)
+        self.status = status
+        self.response = response
+        self.retry_after = retry_after
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP connections to a host, reused by requests. It's thread safe: each request takes an idle connection,
+    or opens a new one if there isn't any, and gives it back when the response is read. Up to max_size idle connections
+    are kept, the others are closed
+    """
+
+    # errors of an idle connection closed by the server
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+    # methods which requests can be sent again after reading the response failed
+    IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+    def __init__(self, scheme, host, max_size=4, timeout=10):
+        """
+        :param scheme: 'http' or 'https'
+        :param host: The host, with an optional port, i.e. 'slack.com' or '127.0.0.1:8080'
+        :param max_size: Max number of idle connections kept. If 0, connections are closed after each request
+        :param timeout: Timeout of connections, in seconds
+        """
+        self.connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        self.host = host
+        self.max_size = max_size
+        self.timeout = timeout
+        # number of connections opened, to check they're reused
+        self.opened = 0
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Provides an idle connection, or a new one if there isn't any
+        :return: A tuple (connection, True if it was idle)
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.opened += 1
+        return self.connection_class(self.host, timeout=self.timeout), False
+
+    def release(self, connection):
+        """
+        Gives back a connection after reading its response
+        """
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """
+        Closes all idle connections
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def request(self, method, path, body, headers):
+        """
+        Sends a request in a connection of the pool. If an idle connection was closed by the server, the request is
+        sent again in a new one only when it's safe: when the connection failed while sending the request, so the
+        server didn't get it, or when the method is idempotent. Otherwise the server may have processed the request
+        before closing the connection, i.e. a POST to chat.postMessage, and the error is raised so it isn't duplicated
+        :param method: The HTTP method
+        :param path: The path of the url, with the query string if any
+        :param body: The body, as bytes
+        :param headers: A dictionary of headers
+        :return: A tuple (status, headers of the response, body of the response as bytes)
+        """
+        while True:
+            connection, idle = self.acquire()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+            except self.STALE_CONNECTION_ERRORS:
+                connection.close()
+                if idle:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            try:
+                response = connection.getresponse()
+                data = response.read()
+            except self.STALE_CONNECTION_ERRORS:
+                connection.close()
+                if idle and method in self.IDEMPOTENT_METHODS:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(connection)
+            return response.status, response.headers, data
+
+
+class SlackClient:
+    """
+    Client of the methods of Slack's Web API related to views and messages
+    """
+
+    # fields which strings are taken as pre-serialized json
+    PRE_SERIALIZED_FIELDS = frozenset(('view', 'blocks'))
+
+    def __init__(self, token=None, base_url=SLACK_API_URL, pool_size=4, timeout=10):
+        """
+        :param token: The bot or user token. It's not needed to use response_url
+        :param base_url: The base url of the Web API, i.e. the api_url of a StubSlackServer
+        :param pool_size: Max number of idle connections kept per host. If 0, connections are not reused
+        :param timeout: Timeout of requests, in seconds
+        """
+        self.token = token
+        self.base_url = base_url if base_url.endswith('/') else f'{base_url}/'
+        self.pool_size = pool_size
+        self.timeout = timeout
+        # (scheme, host) -> ConnectionPool
+        self._pools = dict()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes all idle connections
+        """
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), dict()
+        for pool in pools:
+            pool.close()
+
+    def pool(self, scheme, host):
+        """
+        Provides the pool of connections to supplied host
+        :param scheme: 'http' or 'https'
+        :param host: The host, with an optional port
+        :return: An instance of ConnectionPool
+        """
+        with self._lock:
+            pool = self._pools.get((scheme, host))
+            if pool is None:
+                pool = self._pools[(scheme, host)] = ConnectionPool(scheme, host, self.pool_size, self.timeout)
+        return pool
+
+    @staticmethod
+    def to_json(value, pre_serialized=False):
+        """
+        Provides the json of supplied value, as bytes
+        :param value: An instance of AbstractBlock or BlocksArray, that is serialized, or any other value that json can
+        serialize
+        :param pre_serialized: If True, strings and bytes are taken as pre-serialized json, and provided as they are
+        :return: The json, as bytes
+        """
+        if pre_serialized and isinstance(value, bytes):
+            return value
+        if pre_serialized and isinstance(value, str):
+            return value.encode('utf-8')
+        if isinstance(value, (AbstractBlock, BlocksArray)):
+            return value.serialize(as_json=True).encode('utf-8')
+        return json.dumps(value).encode('utf-8')
+
+    def post(self, url, fields, authorize=True):
+        """
+        Posts a json object to supplied url
+        :param url: The full url
+        :param fields: A dictionary with the fields of the object. Fields with value None are skipped, and values are
+        converted as in to_json, so a pre-serialized view or array of blocks is sent as it is
+        :param authorize: If True, the token is sent in the Authorization header
+        :return: The response, as a dictionary
+        """
+        body = b'{' + b','.join(json.dumps(name).encode('utf-8') + b':' +
+                                self.to_json(value, name in self.PRE_SERIALIZED_FIELDS)
+                                for name, value in fields.items() if value is not None) + b'}'
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        if authorize and self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        parts = urlsplit(url)
+        path = f'{parts.path or "/"}?{parts.query}' if parts.query else parts.path or '/'
+        status, response_headers, data = self.pool(parts.scheme, parts.netloc).request('POST', path, body, headers)
+
+        try:
+            response = json.loads(data)
+        except ValueError:
+            # response_url responds plain text
+            response = {'ok': status == 200, 'text': data.decode('utf-8', 'replace')}
+
+        if status == 429:
+            raise SlackApiException('ratelimited', status, response,
+                                    retry_after=float(response_headers.get('Retry-After') or 1))
+        if status >= 400 or not response.get('ok', False):
+            raise SlackApiException(response.get('error') or f'HTTP status {status}', status, response)
+        return response
+
+    def api_call(self, method, **fields):
+        """
+        Calls a method of the Web API
+        :param method: The name of the method, i.e. 'views.publish'
+        :param fields: The arguments of the method, see post
+        :return: The response, as a dictionary
+        """
+        return self.post(f'{self.base_url}{method}', fields)
+
+    def views_open(self, trigger_id, view):
+        """
+        Opens a modal
+        :param trigger_id: The trigger_id of the interaction
+        :param view: A View, or its pre-serialized json
+        :return: The response, as a dictionary
+        """
+        return self.api_call('views.open', trigger_id=trigger_id, view=view)
+
+    def views_update(self, view, view_id=None, external_id=None, hash_=None):
+        """
+        Updates an open modal
+        :param view: A View, or its pre-serialized json
+        :param view_id: The id of the view to update. Mutually exclusive with external_id
+        :param external_id: The external_id of the view to update. Mutually exclusive with view_id
+        :param hash_: The hash of the view, to avoid race conditions
+        :return: The response, as a dictionary
+        """
+        assert (view_id is None) != (external_id is None), 'one of view_id or external_id is required'
+        return self.api_call('views.update', view_id=view_id, external_id=external_id, hash=hash_, view=view)
+
+    def views_publish(self, user_id, view, hash_=None):
+        """
+        Publishes the Home tab of a user
+        :param user_id: The id of the user
+        :param view: A Home, or its pre-serialized json
+        :param hash_: The hash of the view, to avoid race conditions
+        :return: The response, as a dictionary
+        """
+        return self.api_call('views.publish', user_id=user_id, hash=hash_, view=view)
+
+    def chat_post_message(self, channel, blocks=None, text=None, **fields):
+        """
+        Posts a message in a channel
+        :param channel: The id of the channel
+        :param blocks: A BlocksArray, or its pre-serialized json
+        :param text: The text of the message, used in notifications when there are blocks
+        :param fields: Other arguments of chat.postMessage, i.e. thread_ts
+        :return: The response, as a dictionary
+        """
+        assert blocks is not None or text is not None, 'one of blocks or text is required'
+        return self.api_call('chat.postMessage', channel=channel, text=text, blocks=blocks, **fields)
+
+    def respond(self, response_url, blocks=None, text=None, replace_original=None, response_type=None, **fields):
+        """
+        Sends a message to the response_url of a command or an interaction. The token is not needed
+        :param response_url: The response_url of the payload
+        :param blocks: A BlocksArray, or its pre-serialized json
+        :param text: The text of the message
+        :param replace_original: If True, the message of the interaction is replaced
+        :param response_type: 'ephemeral' or 'in_channel'
+        :param fields: Other fields of the message
+        :return: The response, as a dictionary
+        """
+        assert blocks is not None or text is not None, 'one of blocks or text is required'
+        return self.post(response_url, dict(text=text, blocks=blocks, replace_original=replace_original,
+                                            response_type=response_type, **fields), authorize=False)
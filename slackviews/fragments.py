@@ -0,0 +1,199 @@
+"""
+Module with a cache of fragments of views, that is, arrays of blocks shared by the views of many users, like
+leaderboards, status sections or menus, that only change every few minutes.
+
+Fragments are kept frozen (see AbstractBlock.freeze), so their serialization is computed once, and their blocks are
+spliced by reference into the views of each user with BlocksArray.Builder.blocks, without building, validating or
+serializing them again:
+
+    leaderboard = FragmentCache.named('leaderboard', ttl=300, stale_while_revalidate=60)
+
+    def build_home(user):
+        return Home.Builder().title('Home').Blocks() \\
+            .Header().text(f'Hello {user}').up() \\
+            .blocks(leaderboard.get('weekly', render_weekly_leaderboard)) \\
+            .up().build()
+
+Caches are TTL-bounded and LRU-evicted. A fragment older than its ttl, but within stale_while_revalidate seconds after
+it, is still provided while it's rendered again in a background thread, so users never wait for it.
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from slackviews.view import AbstractBlock, BlocksArray
+
+
+class FragmentCache:
+    """
+    A named cache of frozen BlocksArray fragments, keyed by keys supplied by callers
+    """
+
+    logger = logging.getLogger('FragmentCache')
+
+    # caches by name, see named()
+    _caches = dict()
+    _caches_lock = threading.Lock()
+
+    def __init__(self, name, ttl=60, max_size=1000, stale_while_revalidate=0, clock=time.monotonic):
+        """
+        :param name: The name of the cache, used in metrics
+        :param ttl: Seconds a fragment is fresh
+        :param max_size: Max number of fragments. The least recently used ones are evicted
+        :param stale_while_revalidate: Seconds after ttl a stale fragment is still provided, while it's rendered again
+        in background. If 0, expired fragments are rendered again before providing them
+        :param clock: A function that provides the current time, in seconds
+        """
+        assert ttl > 0, 'ttl must be greater than 0'
+        assert max_size > 0, 'max_size must be greater than 0'
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stale_while_revalidate = stale_while_revalidate
+        self.clock = clock
+        # key -> (fragment, time it was rendered)
+        self._fragments = OrderedDict()
+        # keys being rendered in background
+        self._revalidating = set()
+        self._lock = threading.Lock()
+        self._counters = dict(hits=0, stale_hits=0, misses=0, evictions=0, revalidations=0, errors=0)
+
+    @staticmethod
+    def named(name, **kwargs):
+        """
+        Provides the cache of supplied name, creating it if it doesn't exist
+        :param name: The name of the cache
+        :param kwargs: The arguments of the cache, used only when it's created
+        :return: An instance of FragmentCache
+        """
+        with FragmentCache._caches_lock:
+            cache = FragmentCache._caches.get(name)
+            if cache is None:
+                cache = FragmentCache._caches[name] = FragmentCache(name, **kwargs)
+            return cache
+
+    def __len__(self):
+        return len(self._fragments)
+
+    @staticmethod
+    def to_fragment(blocks):
+        """
+        Provides a frozen array of blocks
+        :param blocks: A BlocksArray, that is frozen in place; an iterable of AbstractBlock instances; or an array of
+        block dictionaries, or its json, i.e. rendered by other process, that is deserialized once
+        :return: A frozen instance of BlocksArray
+        """
+        if isinstance(blocks, str):
+            blocks = BlocksArray.of(blocks, from_json=True)
+        elif not isinstance(blocks, BlocksArray):
+            blocks = list(blocks)
+            if all(isinstance(blk, AbstractBlock) for blk in blocks):
+                blocks = BlocksArray(_blocks=blocks)
+            else:
+                blocks = BlocksArray.of(blocks)
+        return blocks.freeze()
+
+    def put(self, key, blocks):
+        """
+        Stores a fragment
+        :param key: The key of the fragment
+        :param blocks: The blocks of the fragment, see to_fragment
+        :return: The fragment, a frozen instance of BlocksArray
+        """
+        fragment = self.to_fragment(blocks)
+        with self._lock:
+            self._fragments[key] = (fragment, self.clock())
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_size:
+                self._fragments.popitem(last=False)
+                self._counters['evictions'] += 1
+        return fragment
+
+    def get(self, key, render=None):
+        """
+        Provides a fragment. If it's expired or missing, it's rendered with supplied function, if any
+        :param key: The key of the fragment
+        :param render: A function without arguments that provides the blocks of the fragment, see to_fragment
+        :return: The fragment, a frozen instance of BlocksArray, or None if it's missing and there is no render
+        """
+        with self._lock:
+            entry = self._fragments.get(key)
+            if entry is not None:
+                fragment, rendered = entry
+                age = self.clock() - rendered
+                if age < self.ttl:
+                    self._fragments.move_to_end(key)
+                    self._counters['hits'] += 1
+                    return fragment
+                if render is not None and age < self.ttl + self.stale_while_revalidate:
+                    self._fragments.move_to_end(key)
+                    self._counters['stale_hits'] += 1
+                    if key not in self._revalidating:
+                        self._revalidating.add(key)
+                        threading.Thread(target=self._revalidate, args=(key, render), daemon=True,
+                                         name=f'FragmentCache-{self.name}').start()
+                    return fragment
+            self._counters['misses'] += 1
+
+        if render is None:
+            return None
+        return self.put(key, render())
+
+    def _revalidate(self, key, render):
+        """
+        Renders a fragment again, in a background thread. If it fails, the stale fragment is kept
+        """
+        try:
+            self.put(key, render())
+            with self._lock:
+                self._counters['revalidations'] += 1
+        except Exception as e:
+            with self._lock:
+                self._counters['errors'] += 1
+            self.logger.exception('Failed rendering fragment [%s] of cache [%s]: %s', key, self.name, e)
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def invalidate(self, key):
+        """
+        Removes a fragment, so it's rendered again on next get
+        :param key: The key of the fragment
+        """
+        with self._lock:
+            self._fragments.pop(key, None)
+
+    def clear(self):
+        """
+        Removes all fragments
+        """
+        with self._lock:
+            self._fragments.clear()
+
+    def metrics(self):
+        """
+        Provides the counters of the cache
+        :return: A dictionary with the number of fresh hits, stale hits, misses, evictions, background revalidations
+        and errors rendering in background, and the number of fragments
+        """
+        with self._lock:
+            return dict(self._counters, size=len(self._fragments))
+
+    def prometheus(self, prefix='slackviews'):
+        """
+        Provides the metrics in Prometheus text exposition format
+        :param prefix: The prefix of the name of metrics
+        :return: A string with a line per metric
+        """
+        lines = []
+        for name, value in self.metrics().items():
+            type_, metric = ('gauge', f'{prefix}_fragments_{name}') if name == 'size' else \
+                ('counter', f'{prefix}_fragments_{name}_total')
+            lines.append(f'# TYPE {metric} {type_}')
+            lines.append(f'{metric}{{cache="{self.name}"}} {value}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,255 @@
+"""
+Module to skip publishing views that users already have.
+
+Many refreshes of Home tabs send exactly the same view a user already has. The PublishGuard keeps the fingerprint of
+the last view published for each (team, user, type of view) in a store, and skips the call to the Web API when the
+fingerprint of a new view matches it. Stores are pluggable: LRUFingerprintStore keeps them in memory, and
+SQLiteFingerprintStore in a file, so they survive restarts and can be shared by processes of the app.
+
+    guard = PublishGuard(SlackClient(token), SQLiteFingerprintStore('fingerprints.db'), team_id=team_id)
+    guard.views_publish(user_id, home)
+
+The guard has the method views_publish of SlackClient, so it can be the client of a PublishScheduler. Views of the same
+user are published one at a time by a guard, so the fingerprint stored is always the one of the last view published.
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from slackviews.client import SlackClient
+
+
+class FingerprintStore:
+    """
+    Interface of stores of fingerprints. Keys are tuples (team_id, user_id, type of view)
+    """
+
+    def get(self, key):
+        """
+        :return: The fingerprint stored for supplied key, or None
+        """
+        raise NotImplementedError()
+
+    def set(self, key, fingerprint):
+        """
+        Stores the fingerprint of supplied key
+        """
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """
+        Removes the fingerprint of supplied key, if any
+        """
+        raise NotImplementedError()
+
+
+class LRUFingerprintStore(FingerprintStore):
+    """
+    Stores fingerprints in memory, discarding the least recently used ones when max_size is exceeded
+    """
+
+    def __init__(self, max_size=100000):
+        """
+        :param max_size: Max number of fingerprints
+        """
+        assert max_size > 0, 'max_size must be greater than 0'
+        self.max_size = max_size
+        self._fingerprints = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def get(self, key):
+        with self._lock:
+            fingerprint = self._fingerprints.get(key)
+            if fingerprint is not None:
+                self._fingerprints.move_to_end(key)
+            return fingerprint
+
+    def set(self, key, fingerprint):
+        with self._lock:
+            self._fingerprints[key] = fingerprint
+            self._fingerprints.move_to_end(key)
+            if len(self._fingerprints) > self.max_size:
+                self._fingerprints.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._fingerprints.pop(key, None)
+
+
+class SQLiteFingerprintStore(FingerprintStore):
+    """
+    Stores fingerprints in a SQLite database, so they survive restarts of the app
+    """
+
+    def __init__(self, path=':memory:', timeout=5):
+        """
+        :param path: The path of the database file. It's created if it doesn't exist
+        :param timeout: Seconds to wait when the database is locked by other process
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ':memory:':
+                # write-ahead log, so processes read while other writes, and commits don't wait for a sync to disk
+                self._connection.execute('PRAGMA journal_mode=WAL')
+                self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS fingerprints (team_id TEXT NOT NULL, '
+                                     'user_id TEXT NOT NULL, view_type TEXT NOT NULL, fingerprint TEXT NOT NULL, '
+                                     'updated REAL NOT NULL, PRIMARY KEY (team_id, user_id, view_type))')
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM fingerprints').fetchone()[0]
+
+    def close(self):
+        """
+        Closes the database
+        """
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _params(key):
+        team_id, user_id, view_type = key
+        return team_id or '', user_id, view_type
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute('SELECT fingerprint FROM fingerprints WHERE team_id = ? AND user_id = ? '
+                                           'AND view_type = ?', self._params(key)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, fingerprint):
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)',
+                                     self._params(key) + (fingerprint, time.time()))
+
+    def delete(self, key):
+        with self._lock:
+            self._connection.execute('DELETE FROM fingerprints WHERE team_id = ? AND user_id = ? AND view_type = ?',
+                                     self._params(key))
+
+
+class PublishGuard:
+    """
+    Publishes views with a client, skipping the ones which fingerprint matches the last one published for the user
+    """
+
+    def __init__(self, client, store=None, team_id=None):
+        """
+        :param client: The SlackClient
+        :param store: The FingerprintStore. If None, a new LRUFingerprintStore
+        :param team_id: The id of the team of the client, part of the keys of the store
+        """
+        self.client = client
+        self.store = store if store is not None else LRUFingerprintStore()
+        self.team_id = team_id
+        self._counters = dict(hits=0, misses=0)
+        self._lock = threading.Lock()
+        # key -> [lock, number of threads using it], so views of the same user are published one at a time
+        self._key_locks = dict()
+
+    def __getattr__(self, name):
+        # other methods of the client, i.e. views_open
+        if name == 'client':
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @staticmethod
+    def fingerprint(view):
+        """
+        Provides the fingerprint of a view
+        :param view: A View, or its pre-serialized json
+        :return: A tuple (fingerprint, json of the view as bytes)
+        """
+        data = SlackClient.to_json(view, pre_serialized=True)
+        return hashlib.blake2b(data, digest_size=16).hexdigest(), data
+
+    def views_publish(self, user_id, view, hash_=None, team_id=None):
+        """
+        Publishes the Home tab of a user, unless it's the same one last published
+        :param user_id: The id of the user
+        :param view: A Home, or its pre-serialized json
+        :param hash_: The hash of the view, to avoid race conditions
+        :param team_id: The id of the team. If None, the one of the guard
+        :return: The response, as a dictionary. If it's skipped, {'ok': True, 'skipped': True}
+        """
+        key = (team_id or self.team_id, user_id, 'home')
+        fingerprint, data = self.fingerprint(view)
+        # the check, the call and the update of the store are done at once per key, otherwise the fingerprint of an
+        # older view could be stored after the one of the view the user has
+        with self._locked(key):
+            if self.store.get(key) == fingerprint:
+                with self._lock:
+                    self._counters['hits'] += 1
+                return {'ok': True, 'skipped': True}
+
+            with self._lock:
+                self._counters['misses'] += 1
+            # the view isn't serialized again
+            response = self.client.views_publish(user_id, data, hash_=hash_)
+            self.store.set(key, fingerprint)
+            return response
+
+    @contextmanager
+    def _locked(self, key):
+        """
+        Holds the lock of supplied key, that is removed when no thread uses it
+        :param key: The key of the store
+        """
+        with self._lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def invalidate(self, user_id, team_id=None, view_type='home'):
+        """
+        Forgets the view last published for a user, so next one is published, i.e. if it was changed by other app
+        :param user_id: The id of the user
+        :param team_id: The id of the team. If None, the one of the guard
+        :param view_type: The type of view
+        """
+        self.store.delete((team_id or self.team_id, user_id, view_type))
+
+    def metrics(self):
+        """
+        Provides the counters of the guard
+        :return: A dictionary with the number of skipped views (hits), published views (misses), and the hit rate
+        """
+        with self._lock:
+            metrics = dict(self._counters)
+        total = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = metrics['hits'] / total if total else 0.0
+        return metrics
+
+    def prometheus(self, prefix='slackviews'):
+        """
+        Provides the metrics in Prometheus text exposition format
+        :param prefix: The prefix of the name of metrics
+        :return: A string with a line per metric
+        """
+        metrics = self.metrics()
+        lines = [f'# TYPE {prefix}_guard_hits_total counter', f'{prefix}_guard_hits_total {metrics["hits"]}',
+                 f'# TYPE {prefix}_guard_misses_total counter', f'{prefix}_guard_misses_total {metrics["misses"]}',
+                 f'# TYPE {prefix}_guard_hit_rate gauge', f'{prefix}_guard_hit_rate {metrics["hit_rate"]}']
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,120 @@
+"""
+Module with the codec used to store state in the private_metadata field of Slack views.
+
+Slack limits private_metadata to 3000 characters, and it's sent back untouched in view_submission and block_actions
+payloads. The default format is a URL-encoded string of key=value pairs, field1=value1&field2=value2..., so it keeps
+being readable, but any key or value can contain '=' or '&' since they're escaped. For large state, the encoded string
+can be compressed with zlib, and then encoded with URL-safe base64, with a prefix to recognize it when decoding.
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+# base64 and zlib are imported only when compressing, since most views don't need it
+from urllib.parse import parse_qsl, urlencode
+
+# Max length of private_metadata field in a view, as defined in Slack's API
+MAX_PRIVATE_METADATA_LENGTH = 3000
+
+
+class PrivateMetadataCodec:
+    """
+    Encodes dictionaries as private_metadata strings and decodes them back. Any object implementing
+    methods encode and decode can be used instead, so the format is pluggable
+    """
+
+    # prefix of compressed strings. ':' is always escaped by the plain encoding, so there is no ambiguity
+    COMPRESSED_PREFIX = 'z:'
+
+    # suffix of plain strings. The legacy format, key=value pairs joined by '&' without escaping, never ends with it,
+    # so strings stored by previous versions are still decoded as they were
+    PLAIN_SUFFIX = '&'
+
+    def __init__(self, compress=False, compress_threshold=None, max_length=MAX_PRIVATE_METADATA_LENGTH):
+        """
+        :param compress: If True, encoded strings longer than compress_threshold are compressed. If False, strings
+        are never compressed
+        :param compress_threshold: Min length of the plain string to compress it. If None, strings are only compressed
+        when they exceed max_length
+        :param max_length: Max length allowed for an encoded string
+        """
+        self.compress = compress
+        self.compress_threshold = max_length if compress_threshold is None else compress_threshold
+        self.max_length = max_length
+
+    def encode(self, dictionary):
+        """
+        Creates a string that can be used as private_metadata from supplied dictionary
+        :param dictionary: The dictionary with key=value pairs to encode. Values are converted to strings
+        :return: A string representing private metadata from supplied dictionary
+        """
+        assert isinstance(dictionary, dict), 'private metadata must be a dictionary'
+        if not dictionary:
+            return ''
+        string = f'{urlencode(dictionary)}{self.PLAIN_SUFFIX}'
+
+        if self.compress and len(string) > self.compress_threshold:
+            import base64
+            import zlib
+            compressed = base64.urlsafe_b64encode(zlib.compress(string.encode('utf-8'), 9)).decode('ascii')
+            compressed = f'{self.COMPRESSED_PREFIX}{compressed}'
+            # compression of small strings could make them longer
+            if len(compressed) < len(string):
+                string = compressed
+
+        self.check_length(string)
+        return string
+
+    def decode(self, string):
+        """
+        Creates a dictionary from supplied private_metadata string
+        :param string: A private metadata string representation
+        :return: A dictionary representing private metadata from supplied string
+        """
+        if not string:
+            return dict()
+
+        if string.startswith(self.COMPRESSED_PREFIX):
+            import base64
+            import binascii
+            import zlib
+            try:
+                string = zlib.decompress(base64.urlsafe_b64decode(string[len(self.COMPRESSED_PREFIX):]))
+            except (binascii.Error, zlib.error) as e:
+                # a legacy string can start with the prefix too, if its first key does
+                if '=' not in string:
+                    raise ValueError(f'Wrong compressed private metadata: {e}')
+                return self.decode_legacy(string)
+            string = string.decode('utf-8')
+        elif not string.endswith(self.PLAIN_SUFFIX):
+            return self.decode_legacy(string)
+
+        return dict(parse_qsl(string, keep_blank_values=True))
+
+    @staticmethod
+    def decode_legacy(string):
+        """
+        Creates a dictionary from a private_metadata string in the legacy format field1=value1&field2=value2, where
+        keys and values are not escaped, as previous versions of ViewInteraction did
+        :param string: A private metadata string in legacy format
+        :return: A dictionary representing private metadata from supplied string
+        """
+        dict_ = dict()
+        for f in string.split('&'):
+            f = f.split('=')
+            dict_[f[0]] = f[1]
+        return dict_
+
+    def check_length(self, string):
+        """
+        Checks that supplied string fits in private_metadata field
+        :param string: The encoded private metadata
+        :return: An AttributeError is thrown if string is too long
+        """
+        if len(string) > self.max_length:
+            raise AttributeError(f'Encoded private metadata has {len(string)} chars, but max length is '
+                                 f'{self.max_length}')
+
+
+# codec used by default in views and interactions
+default_codec = PrivateMetadataCodec()
@@ -0,0 +1,131 @@
+"""
+Module to split arrays of blocks that exceed Slack limits into pages, each one a valid array of blocks for a message
+or a view.
+
+Blocks are consumed one by one from a BlocksArray, a list or any iterable, i.e. a generator of report rows, and pages
+are provided as soon as they're full, so only one page is kept in memory.
+
+    paginator = BlocksPaginator(max_blocks=MAX_MESSAGE_BLOCKS, max_bytes=...)
+    for page in paginator.pages(generate_blocks()):
+        client.chat_postMessage(channel=channel, blocks=page.serialize())
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+from itertools import chain
+
+from slackviews.view import BlocksArray, Header, View
+
+# max number of blocks in a message, and in a view (modal or home tab), as defined in Slack's API
+MAX_MESSAGE_BLOCKS = 50
+MAX_VIEW_BLOCKS = 100
+
+
+class BlocksPaginator:
+    """
+    Splits a sequence of blocks into pages, with a max number of blocks and a max size of the json array of each page.
+    Blocks of types in keep_with_next are never the last block of a page, so a Header is always on the same page than
+    the block that follows it, unless it's the last one.
+    """
+
+    def __init__(self, max_blocks=MAX_MESSAGE_BLOCKS, max_bytes=None, keep_with_next=(Header,)):
+        """
+        :param max_blocks: Max number of blocks in a page
+        :param max_bytes: Max size of the json array of blocks of a page. If None, size is not checked
+        :param keep_with_next: A tuple of block classes that must be on the same page than the following block
+        """
+        assert max_blocks > 0, 'max_blocks must be greater than 0'
+        self.max_blocks = max_blocks
+        self.max_bytes = max_bytes
+        self.keep_with_next = tuple(keep_with_next)
+
+    @staticmethod
+    def size_of(block):
+        """
+        Provides the size of supplied block as json. Frozen blocks cache their json, so it's cheaper for them
+        :param block: An instance of AbstractBlock
+        :return: The length of the json representation of the block
+        """
+        return len(block.serialize(as_json=True))
+
+    def pages(self, blocks, prefix=None):
+        """
+        Splits supplied blocks into pages
+        :param blocks: A BlocksArray, or an iterable of AbstractBlock instances
+        :param prefix: An optional list of blocks repeated at the start of every page, i.e. a title. They're taken into
+        account in the limits of each page
+        :return: A generator of BlocksArray instances
+        """
+        if isinstance(blocks, BlocksArray):
+            blocks = getattr(blocks, '_blocks')
+        prefix = list(prefix or [])
+        max_bytes = self.max_bytes
+
+        # sizes of prefix, and of json separators (', ') between blocks and brackets
+        prefix_size = 2 + sum(self.size_of(blk) + 2 for blk in prefix) if max_bytes is not None else 0
+        if len(prefix) >= self.max_blocks or (max_bytes is not None and prefix_size >= max_bytes):
+            raise AttributeError('prefix blocks exceed the limits of a page')
+
+        page, page_size = list(prefix), prefix_size
+        group, group_size = [], 0
+
+        # None marks the end of blocks, to place the last group
+        for block in chain(blocks, (None,)):
+            if block is not None:
+                block_size = 0
+                if max_bytes is not None:
+                    block_size = self.size_of(block) + 2
+                    if prefix_size + block_size - 2 > max_bytes:
+                        raise AttributeError(f'A block of {block_size - 2} chars exceeds max size of page')
+                group.append((block, block_size))
+                group_size += block_size
+                if isinstance(block, self.keep_with_next):
+                    continue
+
+            # the whole group goes to a new page if it doesn't fit in current one
+            if len(page) > len(prefix) and not self._fits(page, page_size, len(group), group_size):
+                yield BlocksArray(_blocks=page)
+                page, page_size = list(prefix), prefix_size
+
+            for blk, blk_size in group:
+                # only if the group itself is larger than a page
+                if not self._fits(page, page_size, 1, blk_size):
+                    yield BlocksArray(_blocks=page)
+                    page, page_size = list(prefix), prefix_size
+                page.append(blk)
+                page_size += blk_size
+            group, group_size = [], 0
+
+        if len(page) > len(prefix):
+            yield BlocksArray(_blocks=page)
+
+    def views(self, template, blocks):
+        """
+        Splits supplied blocks into views, i.e. one modal per page. Each view is a clone of supplied template, with
+        the blocks of the template followed by the blocks of the page
+        :param template: An instance of View, i.e. a Modal with title, close button and callback_id
+        :param blocks: A BlocksArray, or an iterable of AbstractBlock instances
+        :return: A generator of View instances
+        """
+        assert isinstance(template, View), 'template must be an instance of View'
+        prefix = getattr(template, '_blocks', [])
+        if isinstance(prefix, BlocksArray):
+            prefix = getattr(prefix, '_blocks')
+        for page in self.pages(blocks, prefix=prefix):
+            view = template.clone()
+            setattr(view, '_blocks', page)
+            yield view
+
+    def _fits(self, page, page_size, num_of_blocks, size):
+        """
+        Checks if some blocks fit in supplied page
+        :param page: The list of blocks of the page
+        :param page_size: The size of the page, as computed in pages()
+        :param num_of_blocks: The number of blocks to add
+        :param size: The size of the blocks to add, including separators
+        :return: True if they fit, False otherwise
+        """
+        if len(page) + num_of_blocks > self.max_blocks:
+            return False
+        return self.max_bytes is None or page_size + size - 2 <= self.max_bytes
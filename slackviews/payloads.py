@@ -2,10 +2,16 @@
 Module with logic to handle different types of payloads in Slack
 """
 import abc
+import functools
+import json
 import logging
+import re
+import shlex
+import time
+from urllib.parse import unquote_to_bytes
 
 from slackviews import View
-from werkzeug.datastructures import ImmutableDict
+from slackviews.metadata import default_codec
 
 
 # -- helper
@@ -55,6 +61,43 @@ def get_obj_attr(object, item, missing_value=None, join_with=None, transform=Non
             return value
 
 
+# -- tracing
+
+# callable invoked with (method name, elapsed seconds, instance) after each traced method, if any
+_tracer = None
+
+
+def set_tracer(tracer):
+    """
+    Sets the hook that receives the timings of traced methods in interactions, i.e. get_input_action,
+    private_metadata... Nothing is measured while no tracer is set
+    :param tracer: A callable with arguments (method name, elapsed seconds, instance), or None to disable tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def traced(method):
+    """
+    Decorator that reports the elapsed time of supplied method to the tracer, if one is set
+    :param method: The method to trace
+    :return: The decorated method
+    """
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        tracer = _tracer
+        if tracer is None:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            tracer(name, time.perf_counter() - start, self)
+    return wrapper
+
+
 # -- model classes to handle data easier
 
 class Serializable:
@@ -89,18 +132,234 @@ class DictionaryField(Serializable):
             setattr(self, name, value)
 
 
-class Command(ImmutableDict):
+# -- declarative arguments of commands
+
+class CommandArgumentsException(Exception):
+    """
+    Exception raised when the text of a command doesn't match its arguments specification
+    """
+
+
+class PositionalArgument:
+    """
+    A positional argument of a command, i.e. "/deploy <service>"
+    """
+    __slots__ = ('name', 'type_', 'required', 'default', 'choices', 'many')
+
+    def __init__(self, name, type_=str, required=True, default=None, choices=None, many=False):
+        """
+        :param name: The name of the argument in parsed arguments
+        :param type_: A callable to convert the token, i.e. int
+        :param required: If True, the argument must be supplied
+        :param default: The value when the argument is not supplied
+        :param choices: Optional collection with allowed values, after conversion
+        :param many: If True, it takes all remaining positional tokens as a list. Only allowed in last positional
+        """
+        self.name = name
+        self.type_ = type_
+        self.required = required and default is None
+        self.default = default
+        self.choices = choices
+        self.many = many
+
+
+class OptionArgument(PositionalArgument):
+    """
+    A named argument with a value, i.e. "--timeout=30" or "--timeout 30"
+    """
+    __slots__ = ('aliases',)
+
+    def __init__(self, name, type_=str, required=False, default=None, choices=None, aliases=()):
+        """
+        :param aliases: Other names of the option in command text, i.e. ('-t',)
+        """
+        super().__init__(name, type_=type_, required=required, default=default, choices=choices)
+        self.aliases = aliases
+
+
+class FlagArgument(OptionArgument):
+    """
+    A boolean argument, True when supplied, i.e. "--force"
+    """
+    __slots__ = ()
+
+    def __init__(self, name, aliases=()):
+        super().__init__(name, type_=bool, default=False, aliases=aliases)
+
+
+class CommandArguments:
+    """
+    The compiled arguments specification of a Command class. It's built once per class, the first time a command of
+    the class is parsed
+    """
+    __slots__ = ('positionals', 'named', 'specs')
+
+    # double quotes that Slack clients may send instead of regular ones
+    _QUOTES = str.maketrans({'\u201c': '"', '\u201d': '"'})
+
+    def __init__(self, specs):
+        self.specs = tuple(specs)
+        self.positionals = tuple(spec for spec in self.specs if not isinstance(spec, OptionArgument))
+        self.named = dict()
+        for spec in self.specs:
+            if isinstance(spec, OptionArgument):
+                for name in (f'--{spec.name}',) + tuple(spec.aliases):
+                    assert name not in self.named, f'Duplicated argument [{name}]'
+                    self.named[name] = spec
+        for spec in self.positionals[:-1]:
+            assert not spec.many, f'Only last positional argument can take many values, [{spec.name}] can not'
+
+    @classmethod
+    def tokenize(cls, text):
+        """
+        Splits supplied text in tokens, like a shell does, so arguments between double quotes can contain spaces.
+        Apostrophes and backslashes are regular chars, i.e. in "it's", and if double quotes are not balanced, the text
+        is split by whitespaces
+        :param text: The text of the command
+        :return: A list of tokens
+        """
+        if not text:
+            return []
+        lexer = shlex.shlex(text.translate(cls._QUOTES), posix=True)
+        lexer.whitespace_split = True
+        lexer.commenters = ''
+        lexer.escape = ''
+        lexer.quotes = '"'
+        try:
+            return list(lexer)
+        except ValueError:
+            return text.split()
+
+    def parse(self, tokens):
+        """
+        Parses supplied tokens in one pass, converting each value to the type of its spec
+        :param tokens: The list of tokens of the command
+        :return: A dictionary with the value of each argument by name
+        """
+        values = dict()
+        positionals = []
+        only_positionals = False
+        tokens = iter(tokens)
+
+        for token in tokens:
+            if only_positionals or not token.startswith('-') or token == '-':
+                positionals.append(token)
+                continue
+            if token == '--':
+                only_positionals = True
+                continue
+
+            name, has_value, value = token.partition('=')
+            spec = self.named.get(name)
+            if spec is None:
+                # negative numbers and so on are positional tokens
+                if name.startswith('--'):
+                    raise CommandArgumentsException(f'Unknown argument [{name}]')
+                positionals.append(token)
+                continue
+
+            if isinstance(spec, FlagArgument):
+                if has_value:
+                    raise CommandArgumentsException(f'Argument [{name}] does not take a value')
+                values[spec.name] = True
+            else:
+                if not has_value:
+                    value = next(tokens, None)
+                    if value is None:
+                        raise CommandArgumentsException(f'Missing value for argument [{name}]')
+                values[spec.name] = self._convert(spec, value)
+
+        for index, spec in enumerate(self.positionals):
+            if spec.many:
+                values[spec.name] = [self._convert(spec, value) for value in positionals[index:]]
+                positionals = positionals[:index]
+                break
+            if index < len(positionals):
+                values[spec.name] = self._convert(spec, positionals[index])
+        else:
+            if len(positionals) > len(self.positionals):
+                raise CommandArgumentsException(f'Unexpected arguments {positionals[len(self.positionals):]}')
+
+        for spec in self.specs:
+            if spec.name not in values or (spec.many and not values[spec.name]):
+                if spec.required:
+                    raise CommandArgumentsException(f'Missing required argument [{spec.name}]')
+                if spec.name not in values:
+                    values[spec.name] = spec.default
+        return values
+
+    @staticmethod
+    def _convert(spec, value):
+        try:
+            value = spec.type_(value)
+        except (TypeError, ValueError):
+            raise CommandArgumentsException(f'Wrong value [{value}] for argument [{spec.name}]')
+        if spec.choices is not None and value not in spec.choices:
+            raise CommandArgumentsException(f'Value [{value}] for argument [{spec.name}] must be one of '
+                                            f'{spec.choices}')
+        return value
+
+
+class ImmutableMapping(dict):
+    """
+    A lightweight read-only dictionary, with the same behaviour of werkzeug's ImmutableDict without importing
+    werkzeug. It's a dict, so it can be serialized as json and passed wherever a dict is expected
+    """
+    __slots__ = ()
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict.__repr__(self)})'
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (dict(self),)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f'{self.__class__.__name__!r} objects are immutable')
+
+    __setitem__ = __delitem__ = __ior__ = setdefault = update = pop = popitem = clear = _immutable
+
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        return cls(dict.fromkeys(keys, value))
+
+    def copy(self):
+        """
+        Provides a mutable copy of the mapping, as ImmutableDict does
+        :return: A regular dictionary
+        """
+        return dict(self)
+
+
+class Command(ImmutableMapping):
 
     __metaclass__ = abc.ABCMeta
 
     """
     Encapsulates the form content received when a slack command is invoked
-    It's basically a wrapper over InmmutableDict to use it as a regular object
+    It's basically a wrapper over an immutable mapping to use it as a regular object
     with accessor methods
+
+    Subclasses can declare their arguments in __arguments__, so the text is parsed and validated against them:
+
+        class Deploy(Command):
+            __arguments__ = (PositionalArgument('service'),
+                             OptionArgument('timeout', type_=int, default=30, aliases=('-t',)),
+                             FlagArgument('force'))
+
     """
 
+    # a tuple of PositionalArgument, Option and Flag instances describing the arguments of the command
+    __arguments__ = None
+
+    # the compiled __arguments__ of the class, built the first time it's needed
+    __compiled_arguments__ = None
+
     def __init__(self, _form, **kwargs):
-        super().__init__(_form)
+        # multi-value forms, like werkzeug's, must provide the first value of each field
+        super().__init__(_form.to_dict() if hasattr(_form, 'to_dict') else _form)
 
         # make sure command and arguments are ok
         self._verify_command()
@@ -193,21 +452,27 @@ class Command(ImmutableDict):
 
     def contains_argument(self, arg):
         """
-        Checks if current form contains supplied argument
+        Checks if current form contains supplied argument. If the class declares __arguments__, the argument must be
+        one of the tokens of the text, otherwise it can be any part of the text
         :param arg: name of the arg to check
         :return: True if arg in current form, False otherwise
         """
+        if self.arguments_spec():
+            return arg in self.parse_args()
         return arg in self.text()
 
     def parse_args(self):
         """
-        Returns an array with supplied arguments in form
+        Returns an array with supplied arguments in form. If the class declares __arguments__, arguments are split
+        by whitespaces unless they're quoted, and the text is only tokenized once per command. Otherwise, they're
+        split by spaces
         :return: An array with each argument in order
         """
-        if not self.text():
-            return []
-        else:
-            return self.text().split(' ')
+        if not self.arguments_spec():
+            return self.text().split(' ') if self.text() else []
+        if '_tokens' not in self.__dict__:
+            self.__dict__['_tokens'] = CommandArguments.tokenize(self.text())
+        return self.__dict__['_tokens']
 
     def num_args(self):
         """
@@ -216,13 +481,39 @@ class Command(ImmutableDict):
         """
         return len(self.parse_args())
 
-    @abc.abstractmethod
+    @classmethod
+    def arguments_spec(cls):
+        """
+        Provides the compiled arguments specification of current class, compiling it the first time
+        :return: An instance of CommandArguments, or None if the class does not declare __arguments__
+        """
+        # check the class itself, so subclasses don't reuse the spec compiled for their parent
+        if '__compiled_arguments__' not in cls.__dict__:
+            cls.__compiled_arguments__ = CommandArguments(cls.__arguments__) if cls.__arguments__ else None
+        return cls.__compiled_arguments__
+
+    def arguments(self):
+        """
+        Provides the arguments of the command, parsed and converted as declared in __arguments__. They're
+        parsed once, the first time they're requested
+        :return: A DictionaryField with an attribute for each declared argument
+        """
+        if '_arguments' not in self.__dict__:
+            spec = self.arguments_spec()
+            if not spec:
+                raise NotImplementedError(f'{self.__class__.__name__} does not declare __arguments__')
+            self.__dict__['_arguments'] = DictionaryField(**spec.parse(self.parse_args()))
+        return self.__dict__['_arguments']
+
     def _verify_command(self):
         """
-        Checks if command contains correct arguments for it's execution
-        :return: True if arguments are correct. False otherwise
+        Checks if command contains correct arguments for it's execution. By default, the arguments are validated
+        against __arguments__, classes without it must implement this method
+        :return: A CommandArgumentsException is raised if arguments are not correct
         """
-        raise NotImplementedError()
+        if not self.arguments_spec():
+            raise NotImplementedError()
+        self.arguments()
 
 
 # -- interactions
@@ -304,9 +595,15 @@ class Interaction(DictionaryField, HasBlocks, HasInputAction):
     """
     __metaclass__ = abc.ABCMeta
 
+    # logger shared by all instances of the class, it's set for each subclass
+    logger = logging.getLogger('Interaction')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     def is_block_actions(self):
         return getattr(self, 'type') == 'block_actions'
@@ -317,6 +614,7 @@ class Interaction(DictionaryField, HasBlocks, HasInputAction):
     def is_view_closed(self):
         return getattr(self, 'type') == 'view_closed'
 
+    @traced
     def search_block(self, block_id):
         """
         Searches for a given block_id in view's blocks
@@ -337,6 +635,7 @@ class Interaction(DictionaryField, HasBlocks, HasInputAction):
         """
         return get_obj_attr(self, 'user.id', None)
 
+    @traced
     def get_selectmenu_value(self, block_id, action_id):
         """
         Provides the text, and the value of the select element in a SelectMenu
@@ -350,9 +649,10 @@ class Interaction(DictionaryField, HasBlocks, HasInputAction):
         value = get_obj_attr(element, 'selected_option.value')
         text = get_obj_attr(element, 'selected_option.text.text')
 
-        self.logger.debug(f'\t text, value -> {text}, {value}')
+        self.logger.debug('\t text, value -> %s, %s', text, value)
         return text, value
 
+    @traced
     def get_textinput_value(self, block_id, action_id):
         """
         Provides the value, of a PlainTextInput element, if found
@@ -364,7 +664,7 @@ class Interaction(DictionaryField, HasBlocks, HasInputAction):
 
         assert element.type == 'plain_text_input', f'Wrong element type, it should be a plain_text_input'
         value = get_obj_attr(element, 'value')
-        self.logger.debug(f'\f value -> {value}')
+        self.logger.debug('\t value -> %s', value)
         return value
 
 
@@ -374,35 +674,36 @@ class ViewInteraction(Interaction, HasView):
     """
     __metaclass__ = abc.ABCMeta
 
+    # codec used to encode/decode private_metadata. It can be replaced by any object with encode and decode methods
+    codec = default_codec
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # tuple (raw private_metadata, decoded dictionary)
         self._private_metadata = None
 
-    @staticmethod
-    def private_metadata_string(dictionary):
+    @classmethod
+    def private_metadata_string(cls, dictionary):
         """
-        Creates a string that can be used as private_metadata from supplied dictionary
+        Creates a string that can be used as private_metadata from supplied dictionary, with the codec of the class
         :param dictionary: The dictionary with key=value pairs to create a string representation separated by &
         :return: A string representing private metadata from supplied dictionary
         """
-        return '&'.join([f'{key}={value}' for key, value in dictionary.items()])
+        return cls.codec.encode(dictionary)
 
-    @staticmethod
-    def private_metadata_dictionary(string):
+    @classmethod
+    def private_metadata_dictionary(cls, string):
         """
-        Creates a dictionary from supplied string with private metadata
+        Creates a dictionary from supplied string with private metadata, with the codec of the class
         :param string: A private metadata string repsentation
         :return: A dictionary  representing private metadata from supplied string
         """
-        dict_ = dict()
-        for f in string.split('&'):
-            f = f.split('=')
-            dict_[f[0]] = f[1]
-        return dict_
+        return cls.codec.decode(string)
 
     def is_home(self):
         return get_obj_attr(self, 'view.type') == 'home'
 
+    @traced
     def private_metadata(self):
         """
         Provides the private metadata of interaction view, if any. In our
@@ -414,15 +715,15 @@ class ViewInteraction(Interaction, HasView):
         :return: The private metadata content as dictionary
         """
         # depending on interaction, it could be a message, and not a view
-        if not hasattr(self, 'view') or not getattr(getattr(self, 'view'), 'private_metadata'):
+        if not hasattr(self, 'view') or not getattr(getattr(self, 'view'), 'private_metadata', None):
             return None
-        if not self._private_metadata:
-            _metadata = getattr(getattr(self, 'view'), 'private_metadata')
-            self.logger.debug(f'converting {_metadata} to a dictionary....')
-            dict_ = ViewInteraction.private_metadata_dictionary(_metadata)
-            self.logger.debug(f'\t -> OK {dict_}')
-            self._private_metadata = dict_
-        return self._private_metadata
+        _metadata = getattr(getattr(self, 'view'), 'private_metadata')
+        if self._private_metadata is None or self._private_metadata[0] != _metadata:
+            self.logger.debug('converting %s to a dictionary....', _metadata)
+            dict_ = self.codec.decode(_metadata)
+            self.logger.debug('\t -> OK %s', dict_)
+            self._private_metadata = (_metadata, dict_)
+        return self._private_metadata[1]
 
     def blocks(self):
         if not hasattr(self, 'view'):
@@ -438,10 +739,14 @@ class ViewSubmission(ViewInteraction):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @traced
     def get_input_action(self, block_id, action_id):
-        self.logger.debug(f'searching for __{action_id}__ in input block __{block_id}__')
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug('searching for __%s__ in input block __%s__', action_id, block_id)
         element = get_obj_attr(self, f'view.state.values.{block_id}.{action_id}')
-        self.logger.debug(f'\t -> FOUND -> __{element}__')
+        if debug:
+            self.logger.debug('\t -> FOUND -> __%s__', element)
         return element
 
 
@@ -488,8 +793,11 @@ class BlockActions(Interaction):
         else:
             return NoActionIdException('No actions field in payload')
 
+    @traced
     def get_input_action(self, block_id, action_id):
-        self.logger.debug(f'searching for __{action_id}__ in input block __{block_id}__')
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug('searching for __%s__ in input block __%s__', action_id, block_id)
         element = None
         actions = [DictionaryField(**a) for a in get_obj_attr(self, 'actions', missing_value=[])]
         try:
@@ -498,7 +806,8 @@ class BlockActions(Interaction):
         except IndexError:
             pass
 
-        self.logger.debug(f'\t -> FOUND -> __{element}__')
+        if debug:
+            self.logger.debug('\t -> FOUND -> __%s__', element)
         return element
 
 
@@ -552,3 +861,267 @@ class MessageBlocksInteraction(BlockActions):
         """
         assert hasattr(self, 'message'), 'Wrong interaction type'
         return get_obj_attr(self, 'message.blocks')
+
+
+class BlockSuggestion(ViewInteraction):
+    """
+    Payload sent by Slack to the options load URL, when a user types in an ExternalSelect. Fields action_id,
+    block_id and value (what the user typed) are in the root of the payload
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def query(self):
+        """
+        Provides the text typed by the user in the menu
+        :return: The query as a string, empty if nothing was typed
+        """
+        return getattr(self, 'value', '') or ''
+
+    def get_input_action(self, block_id, action_id):
+        raise NotImplementedError('block_suggestion payloads have no input actions')
+
+
+# -- routing of interactions
+
+class NoRouteException(Exception):
+    """
+    Exception raised when no handler is registered for an interaction
+    """
+
+
+def interaction_class_of(payload):
+    """
+    Provides the Interaction subclass that should wrap supplied raw payload
+    :param payload: The interaction payload as a dictionary, as sent by Slack
+    :return: The Interaction subclass for the payload, or None if the type of payload is not supported
+    """
+    type_ = payload.get('type')
+    if type_ == 'block_actions':
+        return ViewBlocksInteraction if 'view' in payload else MessageBlocksInteraction
+    return _INTERACTION_BY_TYPE.get(type_)
+
+
+def interaction_of(payload):
+    """
+    Builds the right Interaction instance from supplied raw payload
+    :param payload: The interaction payload as a dictionary, as sent by Slack
+    :return: An instance of ViewSubmission, ViewBlocksInteraction, MessageBlocksInteraction, BlockSuggestion or
+    ViewInteraction
+    """
+    class_of = interaction_class_of(payload)
+    if not class_of:
+        raise NoRouteException(f'Unsupported interaction type [{payload.get("type")}]')
+    return class_of(**payload)
+
+
+class RouteStats:
+    """
+    Counters of a route in the InteractionRouter
+    """
+    __slots__ = ('calls', 'errors', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def serialize(self):
+        """
+        Provides current counters as a dictionary
+        :return: A dictionary with calls, errors, total, mean and max time in seconds
+        """
+        return {'calls': self.calls, 'errors': self.errors, 'total_time': self.total_time,
+                'mean_time': self.total_time / self.calls if self.calls else 0.0, 'max_time': self.max_time}
+
+
+class InteractionRouter:
+    """
+    Dispatches interaction payloads to registered handlers, by interaction type, callback_id, block_id and action_id.
+    Any of them can be a wildcard (None or '*'), and the most specific route wins, that is, the one with more fields
+    defined, and in case of a tie, the one defining the leftmost field.
+
+    Routes are kept in a hashed table per combination of defined fields, so dispatching costs one dictionary lookup
+    per combination in use, no matter how many routes are registered.
+
+        router = InteractionRouter()
+
+        @router.route('view_submission', callback_id='new_ticket')
+        def on_new_ticket(interaction):
+            ...
+
+        router.dispatch(payload)
+    """
+
+    ANY = '*'
+
+    def __init__(self, default=None):
+        """
+        :param default: Optional handler invoked when no route matches. If None, NoRouteException is raised
+        """
+        self._default = default
+        # mask of defined fields -> {key: (handler, stats)}
+        self._tables = dict()
+        # masks in use, the most specific ones first
+        self._masks = []
+        self._stats = dict()
+
+    def add(self, handler, type_=None, callback_id=None, block_id=None, action_id=None):
+        """
+        Registers a handler for supplied route. The handler receives the Interaction instance
+        :param handler: A callable with one argument, the interaction
+        :param type_: The interaction type, i.e. block_actions, view_submission, view_closed
+        :param callback_id: The callback_id of the view
+        :param block_id: The block_id of the action
+        :param action_id: The action_id of the action
+        :return: Supplied handler
+        """
+        key = tuple(None if field == self.ANY else field for field in (type_, callback_id, block_id, action_id))
+        mask = tuple(field is not None for field in key)
+        if key in self._tables.get(mask, {}):
+            raise AttributeError(f'A handler is already registered for route {key}')
+
+        if mask not in self._tables:
+            self._tables[mask] = dict()
+            self._masks.append(mask)
+            self._masks.sort(key=lambda m: (-sum(m), [not f for f in m]))
+
+        stats = RouteStats()
+        self._tables[mask][key] = (handler, stats)
+        self._stats[key] = stats
+        return handler
+
+    def route(self, type_=None, callback_id=None, block_id=None, action_id=None):
+        """
+        Decorator version of add method
+        :return: A decorator that registers the decorated function
+        """
+        def decorator(handler):
+            return self.add(handler, type_, callback_id, block_id, action_id)
+        return decorator
+
+    @staticmethod
+    def route_key(payload):
+        """
+        Provides the values of the fields used to route supplied payload
+        :param payload: The interaction payload as a dictionary, or an Interaction instance
+        :return: A tuple (type, callback_id, block_id, action_id)
+        """
+        block_id = action_id = None
+        # shortcut and message_action payloads have no view, and their callback_id is in the root
+        if isinstance(payload, Interaction):
+            type_ = getattr(payload, 'type', None)
+            if hasattr(payload, 'view'):
+                callback_id = get_obj_attr(payload, 'view.callback_id')
+            else:
+                callback_id = getattr(payload, 'callback_id', None)
+            actions = getattr(payload, 'actions', None)
+        else:
+            type_ = payload.get('type')
+            view = payload.get('view')
+            callback_id = view.get('callback_id') if view else payload.get('callback_id')
+            actions = payload.get('actions')
+        if actions:
+            block_id = actions[0].get('block_id')
+            action_id = actions[0].get('action_id')
+        elif isinstance(payload, Interaction):
+            # block_suggestion payloads have them in the root
+            block_id = getattr(payload, 'block_id', None)
+            action_id = getattr(payload, 'action_id', None)
+        else:
+            block_id = payload.get('block_id')
+            action_id = payload.get('action_id')
+        return type_, callback_id or None, block_id, action_id
+
+    def resolve(self, payload):
+        """
+        Looks for the most specific handler of supplied payload
+        :param payload: The interaction payload as a dictionary, or an Interaction instance
+        :return: A tuple (handler, stats), or None if no route matches
+        """
+        key = self.route_key(payload)
+        for mask in self._masks:
+            found = self._tables[mask].get(tuple(k if m else None for k, m in zip(key, mask)))
+            if found:
+                return found
+        return None
+
+    def dispatch(self, payload):
+        """
+        Builds the interaction from supplied payload and invokes the handler of the matching route
+        :param payload: The interaction payload as a dictionary, or an already built Interaction. Payloads of types
+        without an Interaction subclass, i.e. shortcut or message_action, are wrapped in a plain Interaction
+        :return: The value returned by the handler
+        """
+        found = self.resolve(payload)
+        if isinstance(payload, Interaction):
+            interaction = payload
+        else:
+            interaction = (interaction_class_of(payload) or Interaction)(**payload)
+        if not found:
+            if not self._default:
+                raise NoRouteException(f'No route for interaction {self.route_key(payload)}')
+            return self._default(interaction)
+
+        handler, stats = found
+        start = time.perf_counter()
+        try:
+            return handler(interaction)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stats.calls += 1
+            stats.total_time += elapsed
+            if elapsed > stats.max_time:
+                stats.max_time = elapsed
+
+    def stats(self):
+        """
+        Provides the counters of each route
+        :return: A dictionary {(type, callback_id, block_id, action_id): counters as a dictionary}
+        """
+        return {key: stats.serialize() for key, stats in self._stats.items()}
+
+
+def parse_interaction(body):
+    """
+    Builds the Interaction from the raw body of the request sent by Slack, that is, an
+    application/x-www-form-urlencoded form with the json payload in field "payload". There is no need to decode the
+    form with a web framework first.
+    :param body: The request body as bytes, bytearray, memoryview or string
+    :return: An instance of the right Interaction subclass for the payload
+    """
+    return interaction_of(json.loads(_form_field(body, b'payload')))
+
+
+def _form_field(body, name):
+    """
+    Extracts and decodes the value of a field in a form-encoded body, without decoding the rest of fields
+    :param body: The request body as bytes, bytearray, memoryview or string
+    :param name: The name of the field as bytes
+    :return: The decoded value of the field as bytes
+    """
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+
+    # re searches any bytes-like object, so a memoryview or bytearray isn't copied, only the value of the field
+    found = re.search(b'(?:^|&)' + re.escape(name) + b'=([^&]*)', body)
+    if not found:
+        raise AttributeError(f'Missing field [{name.decode()}] in request body')
+    value = found.group(1)
+
+    # "+" is a space in form encoding, and the value only needs unquoting if it has escaped chars
+    if b'+' in value:
+        value = value.replace(b'+', b' ')
+    if b'%' in value:
+        value = unquote_to_bytes(value)
+    return value
+
+
+_INTERACTION_BY_TYPE = {'view_submission': ViewSubmission,
+                        'view_closed': ViewInteraction,
+                        'block_suggestion': BlockSuggestion}
@@ -0,0 +1,166 @@
+"""
+Module with the profiler of blocks, that records calls, cumulative time and allocated memory blocks per block class.
+It's only imported when profiling is enabled, see AbstractBlock.enable_profiling
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import functools
+import sys
+import time
+
+from slackviews.view import AbstractBlock, BlocksArray
+
+
+class BlockProfiler:
+    """
+    Counters of calls, cumulative time and allocated memory blocks per block class, for each operation:
+
+     - build: creation of an instance, by builders, deserialization or clone
+     - validation: _validation of the block
+     - serialize: serialize of the block, including the serialization of the blocks within it
+     - deserialize: deserialize of the block, including the deserialization of the blocks within it
+
+    Allocated memory blocks are the ones still allocated after the operation (see sys.getallocatedblocks), that is,
+    objects created by the operation and not released yet, of any type, i.e. the dictionary of a serialization.
+
+    While enabled, the methods of those operations are replaced in AbstractBlock, BlocksArray and their subclasses by
+    wrappers that record the counters, and original methods are restored when disabled, so a disabled profiler costs
+    nothing. Subclasses created while profiling is enabled inherit the wrapped methods, but their own ones are not
+    wrapped.
+    """
+
+    OPERATIONS = ('build', 'validation', 'serialize', 'deserialize')
+
+    # wrapped methods: (class, name of method, original attribute)
+    _wrapped = []
+
+    # the enabled profiler, if any
+    _current = None
+
+    def __init__(self):
+        # (class name, operation) -> [calls, seconds, allocated memory blocks]
+        self._counters = dict()
+        # (id of object or class, operation) of operations being recorded, to skip nested calls of the same operation
+        self._active = set()
+
+    def record(self, owner, operation, elapsed, allocated):
+        """
+        Adds a call to the counters of supplied class and operation
+        :param owner: The class of the block
+        :param operation: One of OPERATIONS
+        :param elapsed: The duration of the call, in seconds
+        :param allocated: The number of allocated memory blocks after the call
+        """
+        counters = self._counters.get((owner.__name__, operation))
+        if counters is None:
+            counters = self._counters[(owner.__name__, operation)] = [0, 0.0, 0]
+        counters[0] += 1
+        counters[1] += elapsed
+        counters[2] += allocated
+
+    def reset(self):
+        """
+        Discards all recorded counters
+        """
+        self._counters.clear()
+
+    def serialize(self):
+        """
+        Provides the recorded counters
+        :return: A dictionary {class name: {operation: {'calls': calls, 'seconds': seconds, 'allocated': allocated}}}
+        """
+        _dict = dict()
+        for (name, operation), (calls, seconds, allocated) in sorted(self._counters.items()):
+            _dict.setdefault(name, dict())[operation] = {'calls': calls, 'seconds': seconds, 'allocated': allocated}
+        return _dict
+
+    def prometheus(self, prefix='slackviews'):
+        """
+        Provides the recorded counters in Prometheus text exposition format
+        :param prefix: The prefix of the name of metrics
+        :return: A string with a line per metric, class and operation
+        """
+        metrics = ((f'{prefix}_block_calls_total', 'counter', 'Calls by block class and operation', 0),
+                   (f'{prefix}_block_seconds_total', 'counter', 'Cumulative time by block class and operation', 1),
+                   (f'{prefix}_block_allocated_blocks', 'gauge',
+                    'Memory blocks allocated by block class and operation', 2))
+        lines = []
+        for name, type_, help_, position in metrics:
+            lines.append(f'# HELP {name} {help_}')
+            lines.append(f'# TYPE {name} {type_}')
+            for (block, operation), counters in sorted(self._counters.items()):
+                lines.append(f'{name}{{block="{block}",operation="{operation}"}} {counters[position]}')
+        return '\n'.join(lines) + '\n'
+
+    def _wrap(self, function, operation):
+        """
+        Provides a wrapper of supplied function, that records its calls. The first argument of the function is the
+        block, or the class of the block
+        """
+        counter = time.perf_counter
+        allocated_blocks = sys.getallocatedblocks
+
+        @functools.wraps(function)
+        def wrapper(first, *args, **kwargs):
+            key = (id(first), operation)
+            if key in self._active:
+                return function(first, *args, **kwargs)
+            self._active.add(key)
+            blocks = allocated_blocks()
+            start = counter()
+            try:
+                return function(first, *args, **kwargs)
+            finally:
+                elapsed = counter() - start
+                self._active.discard(key)
+                self.record(first if isinstance(first, type) else first.__class__, operation, elapsed,
+                            allocated_blocks() - blocks)
+        return wrapper
+
+    @staticmethod
+    def enable(profiler=None):
+        """
+        Starts recording counters, see AbstractBlock.enable_profiling
+        :param profiler: The BlockProfiler that records the counters. If None, a new one is created
+        :return: The BlockProfiler
+        """
+        BlockProfiler.disable()
+        profiler = profiler or BlockProfiler()
+
+        classes, pending = [], [AbstractBlock]
+        while pending:
+            cls = pending.pop()
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+        classes.append(BlocksArray)
+
+        methods = (('__new__', 'build'), ('_validation', 'validation'), ('serialize', 'serialize'),
+                   ('deserialize', 'deserialize'))
+        for cls in classes:
+            for name, operation in methods:
+                original = cls.__dict__.get(name)
+                if original is None:
+                    continue
+                if isinstance(original, (staticmethod, classmethod)):
+                    wrapped = type(original)(profiler._wrap(original.__func__, operation))
+                else:
+                    wrapped = profiler._wrap(original, operation)
+                BlockProfiler._wrapped.append((cls, name, original))
+                setattr(cls, name, wrapped)
+
+        BlockProfiler._current = profiler
+        return profiler
+
+    @staticmethod
+    def disable():
+        """
+        Stops recording counters, restoring original methods
+        :return: The BlockProfiler that was enabled, if any
+        """
+        for cls, name, original in reversed(BlockProfiler._wrapped):
+            setattr(cls, name, original)
+        BlockProfiler._wrapped.clear()
+        profiler, BlockProfiler._current = BlockProfiler._current, None
+        return profiler
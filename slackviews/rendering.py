@@ -0,0 +1,114 @@
+"""
+Module to render views for many users from asyncio apps, i.e. a mass refresh of Home tabs, without blocking the event
+loop.
+
+Building and serializing views is CPU work, so it's done in an executor, with a bounded number of renders in flight.
+Rendered views are provided as soon as they're ready, and new renders only start when the consumer takes them, so a
+slow consumer, i.e. rate limited calls to views.publish, keeps memory bounded and the executor isn't flooded:
+
+    async def publish(user, view_json):
+        await client.views_publish(user_id=user, view=view_json)
+
+    await render_async(build_home, users, publish, concurrency=4)
+
+or, to consume rendered views in a loop:
+
+    async for user, view_json in render_stream(build_home, users):
+        ...
+
+With the default executor, renders run in threads, so the event loop keeps running while they're done, although they
+share the GIL. A ProcessPoolExecutor renders in parallel, in that case view_factory and users must be picklable.
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import asyncio
+
+
+def render(view_factory, user, as_json=True):
+    """
+    Builds and serializes the view of a user. It's the work done in the executor
+    :param view_factory: A callable that receives a user and provides a View, a BlocksArray or any other AbstractBlock
+    :param user: The user
+    :param as_json: If True, views are serialized as json strings, otherwise as dictionaries
+    :return: The serialized view
+    """
+    return view_factory(user).serialize(as_json=as_json)
+
+
+async def _iterate(users):
+    """
+    Provides an asynchronous generator of supplied iterable or asynchronous iterable
+    """
+    if hasattr(users, '__aiter__'):
+        async for user in users:
+            yield user
+    else:
+        for user in users:
+            yield user
+
+
+async def render_stream(view_factory, users, executor=None, concurrency=4, as_json=True):
+    """
+    Renders the views of supplied users in an executor, providing them as they're ready, so not in the order of users.
+    At most concurrency renders are in flight, and new ones only start when the rendered views are taken
+    :param view_factory: A callable that receives a user and provides a View, a BlocksArray or any other AbstractBlock
+    :param users: An iterable, or an asynchronous iterable, of users
+    :param executor: The concurrent.futures.Executor that renders the views. If None, the default one of the loop
+    :param concurrency: Max number of renders in flight
+    :param as_json: If True, views are serialized as json strings, otherwise as dictionaries
+    :return: An asynchronous generator of tuples (user, serialized view). If a render fails, its exception is raised
+    and renders in flight are cancelled, although the ones already running in the executor are completed
+    """
+    assert concurrency > 0, 'concurrency must be greater than 0'
+    loop = asyncio.get_running_loop()
+    users = _iterate(users)
+    # future -> user
+    pending = dict()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    user = await users.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[loop.run_in_executor(executor, render, view_factory, user, as_json)] = user
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            # exceptions of renders already done are retrieved, so they're not logged as never retrieved
+            if not future.cancel() and not future.cancelled():
+                future.exception()
+        await users.aclose()
+
+
+async def render_async(view_factory, users, consumer, executor=None, concurrency=4, as_json=True):
+    """
+    Renders the views of supplied users in an executor, see render_stream, and awaits supplied consumer with each one
+    as soon as it's ready
+    :param view_factory: A callable that receives a user and provides a View, a BlocksArray or any other AbstractBlock
+    :param users: An iterable, or an asynchronous iterable, of users
+    :param consumer: A coroutine function that receives the user and the serialized view, i.e. to publish it
+    :param executor: The concurrent.futures.Executor that renders the views. If None, the default one of the loop
+    :param concurrency: Max number of renders in flight
+    :param as_json: If True, views are serialized as json strings, otherwise as dictionaries
+    :return: The number of views rendered and consumed
+    """
+    count = 0
+    stream = render_stream(view_factory, users, executor, concurrency, as_json)
+    try:
+        async for user, view in stream:
+            await consumer(user, view)
+            count += 1
+    finally:
+        await stream.aclose()
+    return count
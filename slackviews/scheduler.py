@@ -0,0 +1,270 @@
+"""
+Module to publish Home tabs of many users, i.e. after a change of configuration, within Slack's rate limits.
+
+views.publish is rate limited per workspace, in tier 4 of Slack's Web API, so a mass refresh can't just send a request
+per user. The PublishScheduler takes (user_id, view) jobs and publishes them from worker threads, with a token bucket
+that allows the rate of views.publish (see PUBLISH_RATE). Only views.publish is scheduled:
+
+ - Jobs of a user not published yet are coalesced, so only the newest view of each user is sent
+ - A user is published by one worker at a time, so views of a user are sent in order of submission
+ - A rate limited request (status 429) pauses publishing for the seconds in its Retry-After, and is sent again after it
+ - Metrics of throughput and depth of the queue are provided as a dictionary, or in Prometheus text format
+
+    with PublishScheduler(SlackClient(token)) as scheduler:
+        for user_id in users:
+            scheduler.submit(user_id, build_home(user_id))
+        scheduler.join()
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from slackviews.client import SlackApiException
+
+# requests per second allowed for views.publish, tier 4 of Slack's Web API, that is, 100 per minute per workspace
+PUBLISH_RATE = 100 / 60
+
+
+class TokenBucket:
+    """
+    A token bucket: tokens are added at a constant rate, up to capacity, and each request takes one. It's not thread
+    safe, callers must synchronize it
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic):
+        """
+        :param rate: Tokens added per second
+        :param capacity: Max number of tokens, that is, the max burst of requests. The bucket starts full
+        :param clock: A function that provides the current time, in seconds
+        """
+        assert rate > 0, 'rate must be greater than 0'
+        assert capacity >= 1, 'capacity must be at least 1'
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self):
+        """
+        Provides the seconds to wait until a token is available
+        :return: 0 if a token is available, the seconds to wait otherwise
+        """
+        self._refill()
+        return 0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def consume(self):
+        """
+        Takes a token if one is available
+        :return: True if the token was taken, False otherwise
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class PublishScheduler:
+    """
+    Publishes the views of users in worker threads, within the rate limits of views.publish. See module's description
+    """
+
+    logger = logging.getLogger('PublishScheduler')
+
+    def __init__(self, client, workers=1, rate=None, burst=1, clock=time.monotonic):
+        """
+        :param client: The SlackClient, or any object with a method views_publish(user_id, view)
+        :param workers: Number of threads publishing views
+        :param rate: Requests per second. If None, PUBLISH_RATE
+        :param burst: Max burst of requests, the capacity of the token bucket
+        :param clock: A function that provides the current time, in seconds
+        """
+        assert workers > 0, 'workers must be greater than 0'
+        self.client = client
+        self.workers = workers
+        self.clock = clock
+        rate = rate or PUBLISH_RATE
+        self.bucket = TokenBucket(rate, burst, clock)
+
+        # user_id -> (sequence, view), in order of submission. Superseded views of a user are replaced in their position
+        self._pending = OrderedDict()
+        # user_id -> sequence of the view being published
+        self._in_flight = dict()
+        # user_id -> sequence of the newest view submitted, for users pending or in flight
+        self._latest = dict()
+        self._sequence = 0
+        self._paused_until = 0
+        self._stopping = False
+        self._drain = True
+        self._threads = []
+        self._condition = threading.Condition()
+
+        self._started = None
+        self._counters = dict(submitted=0, coalesced=0, published=0, failed=0, rate_limited=0, max_queue_depth=0)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop(drain=exc_type is None)
+
+    def start(self):
+        """
+        Starts the worker threads
+        :return: The PublishScheduler
+        """
+        with self._condition:
+            assert not self._threads, 'the scheduler is already started'
+            self._stopping = False
+            self._drain = True
+            self._started = self.clock()
+            self._threads = [threading.Thread(target=self._work, name=f'PublishScheduler-{i}', daemon=True)
+                             for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, drain=True, timeout=None):
+        """
+        Stops the worker threads
+        :param drain: If True, pending views are published before stopping. Otherwise, they're discarded
+        :param timeout: Max seconds to wait for each thread
+        """
+        with self._condition:
+            self._stopping = True
+            self._drain = drain
+            if not drain:
+                for user_id in self._pending:
+                    self._latest.pop(user_id, None)
+                self._pending.clear()
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, user_id, view):
+        """
+        Adds a view to publish. If there is a pending view of the user, it's replaced
+        :param user_id: The id of the user
+        :param view: A Home, or its pre-serialized json
+        """
+        with self._condition:
+            self._counters['submitted'] += 1
+            if user_id in self._pending:
+                self._counters['coalesced'] += 1
+            self._sequence += 1
+            self._pending[user_id] = (self._sequence, view)
+            self._latest[user_id] = self._sequence
+            self._counters['max_queue_depth'] = max(self._counters['max_queue_depth'], len(self._pending))
+            self._condition.notify()
+
+    def submit_all(self, jobs):
+        """
+        Adds views to publish
+        :param jobs: An iterable of tuples (user_id, view)
+        """
+        for user_id, view in jobs:
+            self.submit(user_id, view)
+
+    def join(self, timeout=None):
+        """
+        Waits until all pending views are published
+        :param timeout: Max seconds to wait. If None, it waits forever
+        :return: True if there are no pending views, False if timeout expired
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def metrics(self):
+        """
+        Provides the counters of the scheduler
+        :return: A dictionary with the number of submitted, coalesced, published, failed and rate limited views, the
+        current and max depth of the queue, and the throughput in published views per second since started
+        """
+        with self._condition:
+            metrics = dict(self._counters, queue_depth=len(self._pending), in_flight=len(self._in_flight))
+        elapsed = self.clock() - self._started if self._started is not None else 0
+        metrics['throughput'] = metrics['published'] / elapsed if elapsed > 0 else 0.0
+        return metrics
+
+    def prometheus(self, prefix='slackviews'):
+        """
+        Provides the metrics in Prometheus text exposition format
+        :param prefix: The prefix of the name of metrics
+        :return: A string with a line per metric
+        """
+        lines = []
+        for name, value in self.metrics().items():
+            type_ = 'gauge' if name in ('queue_depth', 'max_queue_depth', 'in_flight', 'throughput') else 'counter'
+            metric = f'{prefix}_publish_{name}' if type_ == 'gauge' else f'{prefix}_publish_{name}_total'
+            lines.append(f'# TYPE {metric} {type_}')
+            lines.append(f'{metric} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def _next_job(self):
+        """
+        Waits until there is a pending view of a user not in flight, and a token to publish it
+        :return: A tuple (user_id, sequence, view), or None if the scheduler is stopped
+        """
+        with self._condition:
+            while True:
+                if self._stopping and (not self._pending or not self._drain):
+                    return None
+                user_id = next((user_id for user_id in self._pending if user_id not in self._in_flight), None)
+                if user_id is None:
+                    self._condition.wait()
+                    continue
+                wait = max(self._paused_until - self.clock(), self.bucket.wait_time())
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                self.bucket.consume()
+                sequence, view = self._pending.pop(user_id)
+                self._in_flight[user_id] = sequence
+                return user_id, sequence, view
+
+    def _work(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            user_id, sequence, view = job
+            try:
+                self.client.views_publish(user_id, view)
+            except SlackApiException as e:
+                with self._condition:
+                    if e.retry_after is not None:
+                        self._counters['rate_limited'] += 1
+                        self._paused_until = max(self._paused_until, self.clock() + e.retry_after)
+                        # sent first after the pause, unless a newer view of the user was submitted meanwhile
+                        if self._latest.get(user_id) == sequence and not (self._stopping and not self._drain):
+                            self._pending[user_id] = (sequence, view)
+                            self._pending.move_to_end(user_id, last=False)
+                    else:
+                        self._counters['failed'] += 1
+                if e.retry_after is None:
+                    self.logger.warning('Failed publishing view of user [%s]: %s', user_id, e)
+            except Exception as e:
+                with self._condition:
+                    self._counters['failed'] += 1
+                self.logger.exception('Failed publishing view of user [%s]: %s', user_id, e)
+            else:
+                with self._condition:
+                    self._counters['published'] += 1
+            finally:
+                with self._condition:
+                    del self._in_flight[user_id]
+                    if user_id not in self._pending and self._latest.get(user_id) == sequence:
+                        del self._latest[user_id]
+                    self._condition.notify_all()
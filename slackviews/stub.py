@@ -0,0 +1,158 @@
+"""
+Module with a local stub of Slack's Web API, to test apps and measure the throughput of clients offline.
+
+It's an HTTP/1.1 server with keep-alive connections, running in a thread, that records the requests it receives and
+responds as Slack does to views.open, views.update, views.publish and chat.postMessage. Any other path, i.e. a
+response_url, responds ok. Responses can be replaced per method, i.e. to simulate errors or rate limits:
+
+    rate_limited = (429, {'ok': False, 'error': 'ratelimited'}, {'Retry-After': '1'})
+    with StubSlackServer(responses={'views.publish': rate_limited}) as server:
+        client = SlackClient('any token', base_url=server.api_url)
+        ...
+        assert server.requests[0].method == 'views.publish'
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+import itertools
+import json
+import socketserver
+import threading
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# a request received by the stub. method is the name of the API method, or the path for other urls
+StubRequest = namedtuple('StubRequest', ('method', 'path', 'headers', 'body'))
+
+
+class _StubHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    stub = None
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written apart, so Nagle's algorithm would delay responses in keep-alive connections
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = self.rfile.read(length)
+        try:
+            body = json.loads(data) if data else dict()
+        except ValueError:
+            body = data.decode('utf-8', 'replace')
+
+        path = self.path.split('?', 1)[0]
+        method = path[len('/api/'):] if path.startswith('/api/') else path
+        status, response, headers = self.server.stub.respond(StubRequest(method, self.path, dict(self.headers), body))
+
+        payload = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format_, *args):
+        pass
+
+
+class StubSlackServer:
+    """
+    A local stub of Slack's Web API. Its api_url is the base_url of SlackClient
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, responses=None, record=True):
+        """
+        :param host: The host to listen to
+        :param port: The port to listen to. If 0, any free port
+        :param responses: A dictionary {method: response}, where method is the name of the API method, or the path of
+        other urls, and response a dictionary, a tuple (status, dictionary, headers), or a callable that receives the
+        StubRequest and provides any of them
+        :param record: If True, requests are kept in requests. Otherwise only counted, i.e. for benchmarks
+        """
+        self.responses = dict(responses or {})
+        self.record = record
+        self.requests = []
+        self.count = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((host, port), _StubHandler)
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def api_url(self):
+        return f'{self.url}/api/'
+
+    def start(self):
+        """
+        Starts serving requests in a thread
+        :return: The StubSlackServer
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving requests, and closes the socket
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def respond(self, request):
+        """
+        Records supplied request, and provides its response
+        :param request: An instance of StubRequest
+        :return: A tuple (status, dictionary, headers)
+        """
+        with self._lock:
+            self.count += 1
+            if self.record:
+                self.requests.append(request)
+
+        response = self.responses.get(request.method)
+        if callable(response):
+            response = response(request)
+        if response is None:
+            response = self.default_response(request)
+        if isinstance(response, tuple):
+            return response
+        return 200, response, dict()
+
+    def default_response(self, request):
+        """
+        Provides the response of Slack to supplied request, with only the fields used by most apps
+        :param request: An instance of StubRequest
+        :return: A dictionary
+        """
+        body = request.body if isinstance(request.body, dict) else dict()
+        if request.method in ('views.open', 'views.update', 'views.publish'):
+            view = body.get('view')
+            view = dict(json.loads(view) if isinstance(view, str) else view or {})
+            view.setdefault('id', body.get('view_id') or f'V{next(self._ids):010d}')
+            view['hash'] = f'{next(self._ids)}.stub'
+            return {'ok': True, 'view': view}
+        if request.method == 'chat.postMessage':
+            return {'ok': True, 'channel': body.get('channel'), 'ts': f'{next(self._ids)}.000000',
+                    'message': {'text': body.get('text'), 'blocks': body.get('blocks')}}
+        return {'ok': True}
@@ -0,0 +1,248 @@
+"""
+Module with an engine to provide the options of ExternalSelect menus, answering block_suggestion payloads.
+
+Slack sends a block_suggestion payload each time the user types in an external select, and it expects the options
+in less than 3 seconds. OptionsIndex holds a large corpus of options, with a sorted index of word prefixes and
+optionally a trigram index for substring queries, and OptionsProvider keeps an index (or any callable) per
+action_id, and caches the responses of recent queries.
+
+    provider = OptionsProvider()
+    provider.register('employee', OptionsIndex(rows))
+    ...
+    response = provider.handle(parse_interaction(body))  # -> {'options': [...]}
+"""
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+from slackviews.view import Option
+
+# max number of options in a block_suggestion response
+MAX_SUGGESTED_OPTIONS = 100
+
+
+class LRUCache:
+    """
+    A dictionary with a max number of items, that discards least recently used ones
+    """
+    __slots__ = ('_items', 'maxsize', 'hits', 'misses')
+
+    def __init__(self, maxsize=1024):
+        self._items = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """
+        Provides the item with supplied key, marking it as recently used
+        :param key: The key of the item
+        :param default: Value returned if key is missing
+        :return: The item or default value
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Adds an item, discarding the least recently used one if max size is reached
+        :param key: The key of the item
+        :param value: The item
+        """
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def pop(self, key, default=None):
+        return self._items.pop(key, default)
+
+    def clear(self):
+        self._items.clear()
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+
+class OptionsIndex:
+    """
+    Index over a large corpus of options, for type-ahead queries. An option matches a query when each word in
+    the query is the prefix of a word in the text of the option, ignoring case. With substring=True, options
+    containing the query anywhere in their text are provided too, after those matching by prefix.
+    """
+    __slots__ = ('_texts', '_values', '_words', '_ids', '_trigrams')
+
+    def __init__(self, rows, substring=False):
+        """
+        :param rows: An iterable of tuples (text, value)
+        :param substring: If True, a trigram index is built too, to match queries in any position of the text
+        """
+        self._texts = []
+        self._values = []
+        words = []
+        ids = []
+        for position, (text, value) in enumerate(rows):
+            self._texts.append(text)
+            self._values.append(value)
+            for word in set(text.lower().split()):
+                words.append(word)
+                ids.append(position)
+
+        order = sorted(range(len(words)), key=words.__getitem__)
+        self._words = [words[i] for i in order]
+        self._ids = array('L', [ids[i] for i in order])
+
+        self._trigrams = None
+        if substring:
+            self._trigrams = dict()
+            for position, text in enumerate(self._texts):
+                text = text.lower()
+                for trigram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                    self._trigrams.setdefault(trigram, array('L')).append(position)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def search(self, query, limit=MAX_SUGGESTED_OPTIONS):
+        """
+        Provides the options matching supplied query
+        :param query: The text typed by the user
+        :param limit: Max number of options to provide
+        :return: A list of tuples (text, value)
+        """
+        words = query.lower().split()
+        if not words:
+            return list(zip(self._texts[:limit], self._values[:limit]))
+
+        found = dict()
+        # the longest word has the narrowest range of candidates
+        words.sort(key=len, reverse=True)
+        first, others = words[0], words[1:]
+        start = bisect_left(self._words, first)
+        end = bisect_left(self._words, first + '\U0010ffff', start)
+        for position in range(start, end):
+            _id = self._ids[position]
+            if _id in found:
+                continue
+            if others:
+                text_words = self._texts[_id].lower().split()
+                if not all(any(w.startswith(word) for w in text_words) for word in others):
+                    continue
+            found[_id] = None
+            if len(found) == limit:
+                break
+
+        if self._trigrams is not None and len(found) < limit:
+            query = ' '.join(query.lower().split())
+            for _id in self._substring_candidates(query):
+                if _id not in found and query in self._texts[_id].lower():
+                    found[_id] = None
+                    if len(found) == limit:
+                        break
+
+        return [(self._texts[_id], self._values[_id]) for _id in found]
+
+    def _substring_candidates(self, query):
+        """
+        Provides the ids of options that contain all trigrams of the query, in order
+        :param query: The query, in lower case
+        :return: An iterable of ids
+        """
+        if len(query) < 3:
+            return (_id for _id, text in enumerate(self._texts) if query in text.lower())
+        postings = [self._trigrams.get(query[i:i + 3]) for i in range(len(query) - 2)]
+        if not all(postings):
+            return ()
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return ()
+        return sorted(candidates)
+
+
+class OptionsProvider:
+    """
+    Provides the options of each ExternalSelect, by action_id, caching the responses of recent queries in a LRU
+    cache keyed by (action_id, query). Responses in cache are shared, so they must not be modified.
+    """
+
+    def __init__(self, cache_size=1024, limit=MAX_SUGGESTED_OPTIONS):
+        """
+        :param cache_size: Max number of responses in cache
+        :param limit: Max number of options in each response
+        """
+        self._sources = dict()
+        self._cache = LRUCache(cache_size)
+        self.limit = limit
+
+    def register(self, action_id, source):
+        """
+        Registers the source of options of supplied action_id
+        :param action_id: The action_id of the ExternalSelect
+        :param source: An OptionsIndex, or a callable with arguments (query, limit) that provides a list of tuples
+        (text, value)
+        """
+        self._sources[action_id] = source
+        self.invalidate(action_id)
+
+    def invalidate(self, action_id=None):
+        """
+        Discards cached responses of supplied action_id, or all of them if None
+        :param action_id: The action_id of the ExternalSelect
+        """
+        if action_id is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache.keys() if key[0] == action_id]:
+                self._cache.pop(key)
+
+    def options(self, action_id, query):
+        """
+        Provides the response with the options matching supplied query
+        :param action_id: The action_id of the ExternalSelect
+        :param query: The text typed by the user
+        :return: A dictionary {'options': [serialized options]}, ready to be sent as response
+        """
+        key = (action_id, query)
+        response = self._cache.get(key)
+        if response is None:
+            source = self._sources.get(action_id)
+            if source is None:
+                raise AttributeError(f'No options registered for action_id [{action_id}]')
+            rows = source.search(query, self.limit) if isinstance(source, OptionsIndex) else source(query, self.limit)
+            response = {'options': [opt.serialize() for opt in Option.of_many(rows[:self.limit])]}
+            self._cache.put(key, response)
+        return response
+
+    def handle(self, interaction):
+        """
+        Provides the response of a block_suggestion interaction
+        :param interaction: A BlockSuggestion instance
+        :return: A dictionary {'options': [serialized options]}, ready to be sent as response
+        """
+        return self.options(getattr(interaction, 'action_id'), interaction.query())
+
+    def stats(self):
+        """
+        Provides the counters of the cache
+        :return: A dictionary with hits, misses and size of the cache
+        """
+        return {'hits': self._cache.hits, 'misses': self._cache.misses, 'size': len(self._cache)}
@@ -34,8 +34,17 @@ __author__ = 'Agustin Escamez'
 __email__ = 'aech22@gmail.com'
 
 import abc
+import heapq
 import importlib
 import json
+import sys
+from itertools import islice
+
+from slackviews.metadata import MAX_PRIVATE_METADATA_LENGTH, default_codec
+
+
+# marker of slots not set
+_MISSING = object()
 
 
 # ################# #
@@ -43,15 +52,41 @@ import json
 # ################# #
 
 
+class FrozenList(list):
+    """
+    A list that can not be modified, used for arrays of blocks in frozen blocks. It's still a list, so any
+    validation of blocks keeps working
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise AttributeError('Arrays of frozen blocks can not be modified')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = extend = insert = pop = remove = clear = sort = \
+        reverse = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce_ex__(self, protocol):
+        return FrozenList, (list(self),)
+
+
 class AbstractBlock:
     """
     Main class that represents an instance of a Block element in Slack. Any instance that represents
     a block will inherit from it
+
+    A block can be frozen, see freeze(), so the same instance can be shared safely among threads, requests and
+    other blocks.
     """
     __metaclass__ = abc.ABCMeta
 
     # strict tuple of block fields
-    __slots__ = ()
+    __slots__ = ('_frozen',)
 
     # all slots from inheritance chain. Helps during deserialization
     __all_slots__ = None
@@ -67,6 +102,11 @@ class AbstractBlock:
     # are not included in required_slots
     __mutually_exclusive_slots__ = ()
 
+    # Slots used internally, i.e. caches or indexes, that are not part of the block, so they are neither serialized
+    # nor deserialized. They're not included in __all_slots__.
+    # _frozen holds the tuple (dict, json, hash) with the cached serialization of frozen blocks
+    __transient_slots__ = ('_frozen',)
+
     def __new__(cls, *args, **kwargs):
         if not hasattr(cls, '__type__'):
             raise AttributeError('Missing required class attribute __type__')
@@ -75,9 +115,13 @@ class AbstractBlock:
         if not getattr(cls, '__all_slots__'):
             slots_ = list()
             for c in [c for c in cls.__mro__ if c.__name__ != 'object']:
-                slots_.extend(c.__slots__)
-            setattr(cls, '__all_slots__', tuple(reversed(slots_)))
-        return super().__new__(cls)
+                # classes without their own __slots__, like Home, would repeat the ones of their parent
+                slots_.extend(c.__dict__.get('__slots__', ()))
+            transient_ = [s for c in cls.__mro__ for s in getattr(c, '__transient_slots__', ())]
+            setattr(cls, '__all_slots__', tuple(reversed([s for s in slots_ if s not in transient_])))
+        instance = super().__new__(cls)
+        object.__setattr__(instance, '_frozen', None)
+        return instance
 
     def __init__(self, **kwargs):
         for k, v in kwargs.items():
@@ -86,6 +130,28 @@ class AbstractBlock:
         # check block spec
         self._validation()
 
+    def __setattr__(self, name, value):
+        if self._frozen is not None:
+            raise AttributeError(f'Frozen {self.__class__.__name__} objects are immutable')
+        object.__setattr__(self, name, value)
+
+    def _set(self, name, value):
+        """
+        Sets an attribute of current block, unless it's frozen. It's the fast path used by builders and methods
+        that change blocks, the same check than __setattr__ without its dispatch
+        :param name: The name of the attribute
+        :param value: The value of the attribute
+        """
+        if self._frozen is not None:
+            raise AttributeError(f'Frozen {self.__class__.__name__} objects are immutable')
+        object.__setattr__(self, name, value)
+
+    def __setstate__(self, state):
+        # used by copy and pickle, it restores slots even for frozen blocks
+        slots_ = state[1] if isinstance(state, tuple) else state
+        for name, value in (slots_ or {}).items():
+            object.__setattr__(self, name, value)
+
     def __eq__(self, other):
         """
         Two instances are equal if their serialization dict matches
@@ -93,7 +159,115 @@ class AbstractBlock:
         :return: True if equal, False otherwise
         """
         assert isinstance(other, self.__class__)
-        return self.serialize() == other.serialize()
+        return self is other or self.serialize() == other.serialize()
+
+    def __hash__(self):
+        """
+        Only frozen blocks can be hashed, since regular ones can change
+        :return: The hash of the serialization of the block
+        """
+        if self._frozen is None:
+            raise TypeError(f'unhashable {self.__class__.__name__}, only frozen blocks can be hashed')
+        return self._frozen[2]
+
+    def freeze(self):
+        """
+        Makes current block, and all blocks within it, immutable. Setting any attribute of them raises an
+        AttributeError, and arrays of blocks become FrozenList instances. The serialization and hash of the block
+        are cached, so frozen blocks can be shared by reference among threads, requests and other blocks, i.e. using
+        BlocksArray.Builder().block(frozen_block). Cached serialization is shared, so it must not be modified.
+        :return: Current block
+        """
+        if self._frozen is not None:
+            return self
+
+        for slot in getattr(self, '__all_slots__'):
+            if not hasattr(self, slot):
+                continue
+            slot_value = getattr(self, slot)
+            if isinstance(slot_value, list):
+                for elem in slot_value:
+                    if hasattr(elem, 'freeze'):
+                        elem.freeze()
+                if not isinstance(slot_value, FrozenList):
+                    object.__setattr__(self, slot, FrozenList(slot_value))
+            elif hasattr(slot_value, 'freeze'):
+                slot_value.freeze()
+
+        _dict = self.serialize()
+        _json = json.dumps(_dict)
+        object.__setattr__(self, '_frozen', (_dict, _json, hash((self.__class__, _json))))
+        return self
+
+    def is_frozen(self):
+        """
+        Checks if current block is frozen
+        :return: True if frozen, False otherwise
+        """
+        return self._frozen is not None
+
+    def clone(self):
+        """
+        Provides a shallow copy of current block, which is never frozen. Blocks within it are shared with current
+        block, but arrays of blocks are copied, and so are arrays of blocks of Views (BlocksArray), so blocks can be
+        added, removed or replaced in the clone without changing current block. Blocks are copied only when they're
+        edited, see BlocksArray.Builder.edit
+        :return: A new instance of current block's class
+        """
+        instance = self.__class__.__new__(self.__class__)
+        for slot in getattr(self, '__all_slots__'):
+            slot_value = getattr(self, slot, _MISSING)
+            if slot_value is _MISSING:
+                continue
+            if isinstance(slot_value, list):
+                slot_value = list(slot_value)
+            elif isinstance(slot_value, BlocksArray):
+                slot_value = slot_value.clone()
+            object.__setattr__(instance, slot, slot_value)
+        return instance
+
+    def builder(self):
+        """
+        Provides a builder of current block, to keep building it, i.e. to personalize a clone
+        :return: An instance of the Builder of current block's class, working on current block
+        """
+        return self.Builder(_obj=self)
+
+    def memory_usage(self, deep=True, seen=None):
+        """
+        Provides the bytes of memory held by current block, as reported by sys.getsizeof
+        :param deep: If True, the whole tree is measured: blocks within current block, arrays, strings and cached
+        serializations and indexes. Objects are counted once, even if they're shared within the tree, i.e. frozen
+        blocks or interned texts. If False, only the block object itself is measured
+        :param seen: A set with the ids of objects already measured, that are not counted again. Use the same set to
+        measure many trees sharing objects, i.e. clones of a view
+        :return: The number of bytes
+        """
+        if not deep:
+            return sys.getsizeof(self)
+        return _deep_sizeof(self, set() if seen is None else seen)
+
+    @staticmethod
+    def enable_profiling(profiler=None):
+        """
+        Starts recording calls, time and allocated memory blocks per block class, for creation, validation,
+        serialization and deserialization of blocks. See BlockProfiler
+        :param profiler: The BlockProfiler that records the counters. If None, a new one is created
+        :return: The BlockProfiler
+        """
+        from slackviews.profiling import BlockProfiler
+        return BlockProfiler.enable(profiler)
+
+    @staticmethod
+    def disable_profiling():
+        """
+        Stops recording counters of blocks, the default behaviour
+        :return: The BlockProfiler that was enabled, if any, with the recorded counters
+        """
+        if 'slackviews.profiling' not in sys.modules:
+            return None
+        from slackviews.profiling import BlockProfiler
+        return BlockProfiler.disable()
 
     def serialize(self, as_json=False):
         """
@@ -102,6 +276,9 @@ class AbstractBlock:
         :param as_json: If True, provides a json representation of the dictionary with the block elements.
         :return: A dictionary with block elements
         """
+        if self._frozen is not None:
+            return self._frozen[1 if as_json else 0]
+
         for slot in getattr(self.__class__, '__required_slots__'):
             if not hasattr(self, slot):
                 raise AttributeError(f'Missing required slot [{slot}]')
@@ -215,6 +392,37 @@ class AbstractBlock:
         raise NotImplementedError()
 
 
+def _deep_sizeof(obj, seen):
+    """
+    Provides the bytes of memory held by supplied object and all objects reachable from it, see
+    AbstractBlock.memory_usage
+    :param obj: A block, an array of blocks or any value within them
+    :param seen: A set with the ids of objects already measured, measured objects are added to it
+    :return: The number of bytes
+    """
+    size = 0
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        # None and booleans are singletons, they're not held by the tree
+        if obj is None or obj is True or obj is False or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (AbstractBlock, BlocksArray)):
+            for cls in obj.__class__.__mro__:
+                for slot in cls.__dict__.get('__slots__', ()):
+                    value = getattr(obj, slot, _MISSING)
+                    if value is not _MISSING:
+                        pending.append(value)
+        elif isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+    return size
+
+
 class AbstractBuilder:
     """
     Abstract class that represents a builder of am AbstractBlock. Any builder in an AbstractBlock must
@@ -234,10 +442,11 @@ class AbstractBuilder:
             cls.__obj__ = getattr(importlib.import_module(cls.__module__), getattr(cls, '__obj__'))
         return super().__new__(cls)
 
-    def __init__(self, _parent=None):
+    def __init__(self, _parent=None, _obj=None):
         # helper to return current builder or the supplied one. Needed to navigate through builders
         self._parent = _parent or self
-        self._obj = self.__obj__()
+        # the builder works on supplied instance, if any
+        self._obj = self.__obj__() if _obj is None else _obj
 
     def up(self):
         """
@@ -254,22 +463,101 @@ class AbstractBuilder:
         return self._obj
 
 
+class TextPool:
+    """
+    A bounded pool of shared, frozen text objects, keyed by class, text and emoji/verbatim flag. When the pool
+    is full, the oldest text objects are discarded from it. It's thread safe, i.e. for views rendered in executors
+    """
+    __slots__ = ('_texts', 'maxsize', '_lock')
+
+    def __init__(self, maxsize=4096):
+        # threading is imported only when interning is enabled, so importing the module stays cheap
+        import threading
+        self._texts = dict()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, cls, text, flag):
+        """
+        Provides the shared text object, creating it if it's not in the pool yet
+        :param cls: PlainText or MarkDown
+        :param text: The text of the object
+        :param flag: The value of emoji for PlainText, or verbatim for MarkDown
+        :return: An interned instance of cls
+        """
+        key = (cls, text, flag)
+        instance = self._texts.get(key)
+        if instance is not None:
+            return instance
+        with self._lock:
+            # other thread could have added it meanwhile
+            instance = self._texts.get(key)
+            if instance is None:
+                instance = cls._new(text, flag).freeze()
+                if len(self._texts) >= self.maxsize:
+                    del self._texts[next(iter(self._texts))]
+                self._texts[key] = instance
+        return instance
+
+    def __len__(self):
+        return len(self._texts)
+
+
 class AbstractText(AbstractBlock):
     """
     Represents any Text block in Slack, and contains common functionality to both
     implementations, plain:text and mrkdwn
+
+    Text objects can be interned, that is, shared among blocks instead of creating a new one each time. It's opt-in,
+    enable it with AbstractText.enable_interning(). Interned text objects are frozen, see AbstractBlock.freeze.
     """
     __slots__ = ('_text',)
     __metaclass__ = abc.ABCMeta
 
     __required_slots__ = ('_text',)
 
+    # the TextPool used by builders, None if interning is disabled
+    _pool = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
     def _validation(self):
         return
 
+    @classmethod
+    def from_text(cls, text, flag=False):
+        """
+        Provides a text object with supplied text, an interned one if interning is enabled
+        :param text: The text of the object
+        :param flag: The value of emoji for PlainText, or verbatim for MarkDown
+        :return: An instance of current class
+        """
+        pool = AbstractText._pool
+        if pool is None:
+            return cls._new(text, flag)
+        return pool.get(cls, text, flag)
+
+    @classmethod
+    def _new(cls, text, flag):
+        raise NotImplementedError()
+
+    @staticmethod
+    def enable_interning(maxsize=4096):
+        """
+        Makes builders share PlainText and MarkDown objects with the same text and flags, keeping up to maxsize
+        objects in the pool
+        :param maxsize: Max number of text objects in the pool
+        """
+        AbstractText._pool = TextPool(maxsize)
+
+    @staticmethod
+    def disable_interning():
+        """
+        Makes builders create a new text object each time, the default behaviour
+        """
+        AbstractText._pool = None
+
     class Builder(AbstractBuilder):
         """
         Common Builder for text fields
@@ -281,7 +569,7 @@ class AbstractText(AbstractBlock):
             :param text: The value that contains current Text element
             :return: The current builder
             """
-            setattr(self._obj, '_text', text)
+            self._obj._set('_text', text)
             return self
 
 
@@ -299,6 +587,13 @@ class PlainText(AbstractText):
         kwargs['_emoji'] = kwargs.get('_emoji', False)
         super().__init__(**kwargs)
 
+    @classmethod
+    def _new(cls, text, emoji):
+        instance = cls.__new__(cls)
+        instance._text = text
+        instance._emoji = emoji
+        return instance
+
     class Builder(AbstractText.Builder):
         """
         Builder for PlainText object. Extends AbstractText builder with new methods
@@ -311,7 +606,7 @@ class PlainText(AbstractText):
             :param boolean: boolean value to be set
             :return: Current PlainText builder
             """
-            setattr(self._obj, '_emoji', boolean)
+            self._obj._set('_emoji', boolean)
             return self
 
 
@@ -333,6 +628,13 @@ class MarkDown(AbstractText):
         kwargs['_verbatim'] = kwargs.get('_verbatim', False)
         super().__init__(**kwargs)
 
+    @classmethod
+    def _new(cls, text, verbatim):
+        instance = cls.__new__(cls)
+        instance._text = text
+        instance._verbatim = verbatim
+        return instance
+
     class Builder(AbstractText.Builder):
         """
         Builder for MarkDown object. Extends AbstractText builder with new methods
@@ -347,7 +649,7 @@ class MarkDown(AbstractText):
             :param boolean:  boolean value to be set
             :return: Current MarkDown builder
             """
-            setattr(self._obj, '_verbatim', boolean)
+            self._obj._set('_verbatim', boolean)
             return self
 
 
@@ -375,12 +677,11 @@ class Header(AbstractBlock):
         __obj__ = 'Header'
 
         def text(self, txt):
-            builder = PlainText.Builder().text(txt)
-            setattr(self._obj, '_text', builder.build())
+            self._obj._set('_text', PlainText.from_text(txt))
             return self
 
         def block_id_(self, block_id):
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
 
@@ -408,7 +709,7 @@ class Image(AbstractBlock):
             :param image_url: An url as a string
             :return: Image's builder
             """
-            setattr(self._obj, '_image_url', image_url)
+            self._obj._set('_image_url', image_url)
             return self
 
         def alt_text(self, alt_text):
@@ -417,7 +718,7 @@ class Image(AbstractBlock):
             :param alt_text: The string to use as an alternative description
             :return: Image's builder
             """
-            setattr(self._obj, '_alt_text', alt_text)
+            self._obj._set('_alt_text', alt_text)
             return self
 
 
@@ -457,8 +758,7 @@ class Confirmation(AbstractBlock):
             :param title:  Text to use in  plain_text-only object
             :return: Confirmation's builder
             """
-            builder = PlainText.Builder().text(title)
-            setattr(self._obj, '_title', builder.build())
+            self._obj._set('_title', PlainText.from_text(title))
             return self
 
         def confirm(self, confirm):
@@ -468,8 +768,7 @@ class Confirmation(AbstractBlock):
             :param confirm: The text to use in plain_text object
             :return: Confirmation's builder
             """
-            builder = PlainText.Builder().text(confirm)
-            setattr(self._obj, '_confirm', builder.build())
+            self._obj._set('_confirm', PlainText.from_text(confirm))
             return self
 
         def deny(self, deny):
@@ -479,8 +778,7 @@ class Confirmation(AbstractBlock):
             :param deny: The text for the plain_text object
             :return: Confirmation's builder
             """
-            builder = PlainText.Builder().text(deny)
-            setattr(self._obj, '_deny', builder.build())
+            self._obj._set('_deny', PlainText.from_text(deny))
             return self
 
         def text(self, text, verbatim=False):
@@ -490,8 +788,7 @@ class Confirmation(AbstractBlock):
             :param: Text that will be used to create a MarkDown object
             :return: Confirmation's builder
             """
-            builder = MarkDown.Builder().verbatim_(verbatim).text(text)
-            setattr(self._obj, '_text', builder.build())
+            self._obj._set('_text', MarkDown.from_text(text, verbatim))
             return self
 
         def style_(self, style):
@@ -503,7 +800,7 @@ class Confirmation(AbstractBlock):
             :param style: One of "primary" or "danger"
             :return: Confirmation's builder
             """
-            setattr(self._obj, '_style', style)
+            self._obj._set('_style', style)
             return self
 
 
@@ -535,7 +832,7 @@ class Button(AbstractBlock):
             :param action_id: A valid string
             :return: Button's builder
             """
-            setattr(self._obj, '_action_id', action_id)
+            self._obj._set('_action_id', action_id)
             return self
 
         def text(self, text):
@@ -545,8 +842,7 @@ class Button(AbstractBlock):
             :param text: A valid string
             :return: Button's builder
             """
-            builder = PlainText.Builder().text(text)
-            setattr(self._obj, '_text', builder.build())
+            self._obj._set('_text', PlainText.from_text(text))
             return self
 
         def url_(self, url):
@@ -557,7 +853,7 @@ class Button(AbstractBlock):
             :param url: A valid url as a string
             :return: Button's builder
             """
-            setattr(self._obj, '_url', url)
+            self._obj._set('_url', url)
             return self
 
         def value_(self, value):
@@ -567,7 +863,7 @@ class Button(AbstractBlock):
             :param value: Any value needed to be sent with interaction payload
             :return: Button's builder
             """
-            setattr(self._obj, '_value', value)
+            self._obj._set('_value', value)
             return self
 
         def style_(self, style):
@@ -584,7 +880,7 @@ class Button(AbstractBlock):
             :param style: One of "primary" or "danger"
             :return: Button's builder
             """
-            setattr(self._obj, '_style', style)
+            self._obj._set('_style', style)
             return self
 
         def Confirm_(self):
@@ -594,7 +890,7 @@ class Button(AbstractBlock):
             :return: Confirmation's builder
             """
             builder = Confirmation.Builder(_parent=self)
-            setattr(self._obj, '_confirm', builder.build())
+            self._obj._set('_confirm', builder.build())
             return builder
 
 
@@ -607,18 +903,73 @@ class Option(AbstractBlock):
 
     __required_slots__ = ('_text', '_value')
 
+    # max number of chars of text, value and description
+    MAX_LENGTH = 75
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    @classmethod
+    def of_many(cls, pairs=None, texts=None, values=None, descriptions=None):
+        """
+        Builds many options at once, from an iterable of (text, value) or (text, value, description) tuples, or
+        from parallel columns of texts, values and optionally descriptions, i.e. lists, tuples or array-like objects.
+        Values are validated in one batch, and then all Option and PlainText instances are created in one loop,
+        without builders.
+        :param pairs: An iterable of tuples (text, value) or (text, value, description)
+        :param texts: A sequence with the text of each option, if pairs is not supplied
+        :param values: A sequence with the value of each option, if pairs is not supplied
+        :param descriptions: An optional sequence with the description of each option
+        :return: A list of Option instances
+        """
+        if pairs is not None:
+            assert texts is None and values is None, 'pairs and texts/values columns are mutually exclusive'
+            texts, values, descriptions = [], [], []
+            for row in pairs:
+                assert 2 <= len(row) <= 3, f'Options must be (text, value) or (text, value, description), not {row}'
+                texts.append(row[0])
+                values.append(row[1])
+                descriptions.append(row[2] if len(row) == 3 else None)
+
+        assert texts is not None and values is not None, 'Options require texts and values'
+        assert len(texts) == len(values), 'texts and values must have the same length'
+        assert descriptions is None or len(descriptions) == len(texts), \
+            'descriptions must have the same length than texts'
+        assert all(isinstance(value, str) for value in values), 'value must be a string'
+        max_length = cls.MAX_LENGTH
+        assert all(len(text) <= max_length for text in texts), f'Max number of chars is {max_length} for option text'
+        assert all(len(value) <= max_length for value in values), \
+            f'Max number of chars is {max_length} for option value'
+        assert descriptions is None or all(d is None or len(d) <= max_length for d in descriptions), \
+            f'Max number of chars is {max_length} for option description'
+
+        new_option = cls.__new__
+        new_text = PlainText.from_text
+        options = []
+        for position, (text, value) in enumerate(zip(texts, values)):
+            _opt = new_option(cls)
+            _opt._text = new_text(text)
+            _opt._value = value
+            if descriptions is not None and descriptions[position] is not None:
+                _opt._description = new_text(descriptions[position])
+            options.append(_opt)
+        return options
+
     def _validation(self):
         if hasattr(self, '_text'):
             assert isinstance(getattr(self, '_text'), PlainText), 'text must be an instance of PlainText'
+            assert len(getattr(getattr(self, '_text'), '_text')) <= Option.MAX_LENGTH, \
+                f'Max number of chars is {Option.MAX_LENGTH} for option text'
 
         if hasattr(self, '_value'):
             assert isinstance(getattr(self, '_value'), str), 'value must be a string'
+            assert len(getattr(self, '_value')) <= Option.MAX_LENGTH, \
+                f'Max number of chars is {Option.MAX_LENGTH} for option value'
 
         if hasattr(self, '_description'):
             assert isinstance(getattr(self, '_description'), PlainText), 'description must be an instance of PlainText'
+            assert len(getattr(getattr(self, '_description'), '_text')) <= Option.MAX_LENGTH, \
+                f'Max number of chars is {Option.MAX_LENGTH} for option description'
 
     class Builder(AbstractBuilder):
 
@@ -634,8 +985,7 @@ class Option(AbstractBlock):
             :param text:  The text to show in an plain_text object
             :return: Option's builder
             """
-            builder = PlainText.Builder().text(text)
-            setattr(self._obj, '_text', builder.build())
+            self._obj._set('_text', PlainText.from_text(text))
             return self
 
         def value(self, value):
@@ -645,7 +995,7 @@ class Option(AbstractBlock):
             :param value: A valid string. It MUST be a string, no integers, etc
             :return: Option's builder
             """
-            setattr(self._obj, '_value', value)
+            self._obj._set('_value', value)
             return self
 
         def description_(self, description):
@@ -655,8 +1005,7 @@ class Option(AbstractBlock):
             :param description: A valid string
             :return: Option's builder
             """
-            builder = PlainText.Builder().text(description)
-            setattr(self._obj, '_description', builder.build())
+            self._obj._set('_description', PlainText.from_text(description))
             return self
 
         def url_(self, url):
@@ -668,7 +1017,7 @@ class Option(AbstractBlock):
             :param url: A valid url as a string
             :return: Option's builder
             """
-            setattr(self._obj, '_url', url)
+            self._obj._set('_url', url)
             return self
 
 
@@ -690,6 +1039,8 @@ class OptionGroup(AbstractBlock):
         if hasattr(self, '_options'):
             options = getattr(self, '_options')
             assert isinstance(options, list), 'options must be an array'
+            assert len(options) <= SelectMenu.MAX_OPTIONS, \
+                f'Max number of options in an option group is {SelectMenu.MAX_OPTIONS}'
             for opt in options:
                 assert isinstance(opt, Option), 'options must be an array of Option instances'
 
@@ -704,8 +1055,7 @@ class OptionGroup(AbstractBlock):
             :param label: A valid string
             :return: OptionGroup's builder
             """
-            builder = PlainText.Builder().text(label)
-            setattr(self._obj, '_label', builder.build())
+            self._obj._set('_label', PlainText.from_text(label))
             return self
 
         def Option(self):
@@ -715,13 +1065,27 @@ class OptionGroup(AbstractBlock):
             :return: Option's builder
             """
             if not hasattr(self._obj, '_options'):
-                setattr(self._obj, '_options', [])
+                self._obj._set('_options', [])
 
             opts = getattr(self._obj, '_options')
             builder = Option.Builder(_parent=self)
             opts.append(builder.build())
             return builder
 
+        def options_from(self, pairs=None, texts=None, values=None, descriptions=None):
+            """
+            Adds many options at once to this group, see Option.of_many. Maximum of 100 items.
+            :param pairs: An iterable of tuples (text, value) or (text, value, description)
+            :param texts: A sequence with the text of each option, if pairs is not supplied
+            :param values: A sequence with the value of each option, if pairs is not supplied
+            :param descriptions: An optional sequence with the description of each option
+            :return: OptionGroup's builder
+            """
+            if not hasattr(self._obj, '_options'):
+                self._obj._set('_options', [])
+            getattr(self._obj, '_options').extend(Option.of_many(pairs, texts, values, descriptions))
+            return self
+
 
 class SelectMenu(AbstractBlock):
     """
@@ -729,12 +1093,20 @@ class SelectMenu(AbstractBlock):
     a user to choose. The select menu also includes type-ahead functionality, where a user can type a part or all 
     of an option string to filter the list.
     """
-    __slots__ = ('_placeholder', '_action_id', '_options', '_option_groups', '_initial_option', '_confirm')
+    __slots__ = ('_placeholder', '_action_id', '_options', '_option_groups', '_initial_option', '_confirm',
+                 '_option_index')
 
     __type__ = 'static_select'
     __required_slots__ = ('_placeholder', '_action_id')
     __mutually_exclusive_slots__ = ('_options', '_option_groups')
 
+    # index of options by text and value, see __get_option
+    __transient_slots__ = ('_option_index',)
+
+    # limits of static menus in Slack
+    MAX_OPTIONS = 100
+    MAX_OPTION_GROUPS = 100
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -747,11 +1119,14 @@ class SelectMenu(AbstractBlock):
         if hasattr(self, '_options'):
             options = getattr(self, '_options')
             assert isinstance(options, list), 'options must be an array'
+            assert len(options) <= SelectMenu.MAX_OPTIONS, f'Max number of options is {SelectMenu.MAX_OPTIONS}'
             for opt in options:
                 assert isinstance(opt, Option), 'options must be an array of Option instances'
         elif hasattr(self, '_option_groups'):
             option_groups = getattr(self, '_option_groups')
             assert isinstance(option_groups, list), 'option_groups must be an array'
+            assert len(option_groups) <= SelectMenu.MAX_OPTION_GROUPS, \
+                f'Max number of option groups is {SelectMenu.MAX_OPTION_GROUPS}'
             for group in option_groups:
                 assert isinstance(group, OptionGroup), 'option_groups must be an array of OptionGroup instances'
 
@@ -772,7 +1147,7 @@ class SelectMenu(AbstractBlock):
         assert isinstance(text_option, str), 'supplied value must be the text of desired initial option'
         _opt = self.__get_option(text_option)
         if _opt:
-            setattr(self, '_initial_option', _opt)
+            self._set('_initial_option', _opt)
         else:
             raise AttributeError(f'Option [{text_option}] does not exists')
 
@@ -802,22 +1177,49 @@ class SelectMenu(AbstractBlock):
         :return: The option with supplied text, None if it does not exists
         """
         assert text_option, 'Supplied text_option can not be empty'
+        return self.__update_option_index().get(text_option)
 
-        # look for option in _options, if exists
-        if hasattr(self, '_options'):
-            for _opt in getattr(self, '_options'):
-                if getattr(getattr(_opt, '_text'), '_text') == text_option or \
-                        getattr(_opt, '_value') == text_option:
-                    return _opt
-
-        # now, look for default option in option_groups
-        if hasattr(self, '_option_groups'):
-            for _opt_group in getattr(self, '_option_groups'):
-                for _opt in getattr(_opt_group, '_options'):
-                    if getattr(getattr(_opt, '_text'), '_text') == text_option or \
-                            getattr(_opt, '_value') == text_option:
-                        return _opt
-        return None
+    def __update_option_index(self):
+        """
+        Provides the index of options by text and by value, the first option wins in case of repeated keys, as a
+        sequential search in _options and then in _option_groups would do.
+
+        The index is kept in slot _option_index as [index, options, indexed options, [(group, indexed options),...]],
+        and only options added since last call are indexed, those being still built (without text or value) are
+        left for next call. It's rebuilt from scratch if arrays of options are replaced, i.e. after deserialization.
+        Changing the text or value of an option that is already indexed is not tracked.
+        :return: A dictionary with options by text and by value
+        """
+        options = getattr(self, '_options', None)
+        option_groups = getattr(self, '_option_groups', None) or []
+        _index = getattr(self, '_option_index', None)
+        if _index is None or _index[1] is not options or \
+                any(group is not _group for group, (_group, _) in zip(option_groups, _index[3])):
+            _index = [dict(), options, 0, []]
+            # it's a cache, so it's kept even in frozen menus
+            object.__setattr__(self, '_option_index', _index)
+
+        keys = _index[0]
+
+        def _add(_options, start):
+            for position in range(start, len(_options)):
+                _opt = _options[position]
+                if not hasattr(_opt, '_text') or not hasattr(_opt, '_value'):
+                    return position
+                keys.setdefault(getattr(getattr(_opt, '_text'), '_text'), _opt)
+                keys.setdefault(getattr(_opt, '_value'), _opt)
+            return len(_options)
+
+        if options:
+            _index[2] = _add(options, _index[2])
+
+        groups = _index[3]
+        groups.extend((group, 0) for group in option_groups[len(groups):])
+        for position, (group, indexed) in enumerate(groups):
+            _options = getattr(group, '_options', [])
+            if indexed < len(_options):
+                groups[position] = (group, _add(_options, indexed))
+        return keys
 
     class Builder(AbstractBuilder):
 
@@ -831,7 +1233,7 @@ class SelectMenu(AbstractBlock):
             :param action_id: A string to used as action id
             :return: SelectMenu's builder
             """
-            setattr(self._obj, '_action_id', action_id)
+            self._obj._set('_action_id', action_id)
             return self
 
         def placeholder(self, placeholder):
@@ -841,8 +1243,7 @@ class SelectMenu(AbstractBlock):
             :param placeholder: The text to use as placeholder in the menu. i.e. Choose one:, Select: etc...
             :return: SelectMenu's builder
             """
-            builder = PlainText.Builder().text(placeholder)
-            setattr(self._obj, '_placeholder', builder.build())
+            self._obj._set('_placeholder', PlainText.from_text(placeholder))
             return self
 
         def Option__(self):
@@ -853,13 +1254,82 @@ class SelectMenu(AbstractBlock):
             :return: Option's builder
             """
             if not hasattr(self._obj, '_options'):
-                setattr(self._obj, '_options', [])
+                self._obj._set('_options', [])
 
             opts = getattr(self._obj, '_options')
             builder = Option.Builder(_parent=self)
             opts.append(builder.build())
             return builder
 
+        def options_from(self, pairs=None, texts=None, values=None, descriptions=None):
+            """
+            Adds many options at once to the "options" attribute in the selectmenu, see Option.of_many.
+            Maximum number of options is 100.
+            :param pairs: An iterable of tuples (text, value) or (text, value, description)
+            :param texts: A sequence with the text of each option, if pairs is not supplied
+            :param values: A sequence with the value of each option, if pairs is not supplied
+            :param descriptions: An optional sequence with the description of each option
+            :return: SelectMenu's builder
+            """
+            if not hasattr(self._obj, '_options'):
+                self._obj._set('_options', [])
+            getattr(self._obj, '_options').extend(Option.of_many(pairs, texts, values, descriptions))
+            return self
+
+        def options_from_source(self, rows, group_by=None, sort_key=None, page=0, more_text='More…',
+                                more_value='__more__'):
+            """
+            Adds the options of an arbitrarily large source, making sure the menu stays within Slack limits, that is,
+            100 options or 100 option groups of 100 options each. The source is walked only once.
+
+            Without group_by, options are paged: the page supplied is added, and if there are more rows, the last
+            option is a "more" one, with value more_value followed by the number of next page, so the menu can be
+            updated with next page when it's selected.
+
+            With group_by, an OptionGroup is added for each group, in order of appearance, or sorted by label if
+            sort_key is supplied. Groups beyond 100 are discarded, and groups with too many rows end with a "more"
+            option, with value more_value followed by the label of the group.
+            :param rows: An iterable of tuples (text, value) or (text, value, description)
+            :param group_by: Optional callable that provides the label of the group of a row
+            :param sort_key: Optional callable that provides the key to sort the rows, otherwise source order is kept
+            :param page: The page of options to add, when not grouping
+            :param more_text: Text of the option used to notify there are more rows
+            :param more_value: Prefix of the value of the "more" option
+            :return: SelectMenu's builder
+            """
+            _max = SelectMenu.MAX_OPTIONS
+            if group_by is None:
+                start = page * (_max - 1)
+                # one more row than needed, to know if there is a next page
+                limit = start + _max if page else _max + 1
+                rows = list(islice(rows, limit)) if sort_key is None else heapq.nsmallest(limit, rows, key=sort_key)
+                rows = rows[start:]
+                if page or len(rows) > _max:
+                    more = len(rows) > _max - 1
+                    rows = rows[:_max - 1]
+                    if more:
+                        rows.append((more_text, f'{more_value}{page + 1}'))
+                return self.options_from(rows)
+
+            # group in one pass, without sorting groups yet. When not sorting, a group never holds more rows
+            # than required to know it has to be truncated
+            groups = dict()
+            for row in rows:
+                group = groups.setdefault(group_by(row), [])
+                if sort_key is not None or len(group) <= _max:
+                    group.append(row)
+
+            labels = list(groups) if sort_key is None else sorted(groups, key=str)
+            for label in labels[:SelectMenu.MAX_OPTION_GROUPS]:
+                group = groups[label]
+                if sort_key is not None:
+                    group = heapq.nsmallest(_max + 1, group, key=sort_key)
+                if len(group) > _max:
+                    group = group[:_max - 1]
+                    group.append((more_text, f'{more_value}{label}'[:75]))
+                self.OptionGroup__().label(str(label)).options_from(group)
+            return self
+
         def OptionGroup__(self):
             """
             In case this method is invoked, a new OptionGroup element is created an added to the "option_groups"
@@ -868,7 +1338,7 @@ class SelectMenu(AbstractBlock):
             :return: OptionGroup's builder
             """
             if not hasattr(self._obj, '_option_groups'):
-                setattr(self._obj, '_option_groups', [])
+                self._obj._set('_option_groups', [])
 
             opts = getattr(self._obj, '_option_groups')
             builder = OptionGroup.Builder(_parent=self)
@@ -895,7 +1365,7 @@ class SelectMenu(AbstractBlock):
             :return: Confirmation's builder
             """
             builder = Confirmation.Builder(_parent=self)
-            setattr(self._obj, '_confirm', builder.build())
+            self._obj._set('_confirm', builder.build())
             return builder
 
 
@@ -930,10 +1400,94 @@ class MultiSelectMenu(SelectMenu):
             :param max_selected_items: Number of items that can be selected
             :return: MultiSelectMenu's builder
             """
-            setattr(self._obj, '_max_selected_items', max_selected_items)
+            self._obj._set('_max_selected_items', max_selected_items)
             return self
 
 
+class ExternalSelect(AbstractBlock):
+    """
+    A select menu which options are loaded from an external source, the options load URL of the app. It's the
+    select menu to use with large sets of options, since Slack asks for the options matching what the user types,
+    sending a block_suggestion payload.
+    """
+    __slots__ = ('_placeholder', '_action_id', '_initial_option', '_min_query_length', '_confirm')
+
+    __type__ = 'external_select'
+    __required_slots__ = ('_placeholder', '_action_id')
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def _validation(self):
+        if hasattr(self, '_placeholder'):
+            assert isinstance(getattr(self, '_placeholder'), PlainText), 'placeholder must be an instance of PlainText'
+
+        if hasattr(self, '_initial_option'):
+            assert isinstance(getattr(self, '_initial_option'), Option), 'initial_option must be an instance of Option'
+
+        if hasattr(self, '_min_query_length'):
+            assert isinstance(getattr(self, '_min_query_length'), int), 'min_query_length must be an integer'
+
+        if hasattr(self, '_confirm'):
+            assert isinstance(getattr(self, '_confirm'), Confirmation), 'confirm must be an instance of Confirmation'
+
+    class Builder(AbstractBuilder):
+
+        __obj__ = 'ExternalSelect'
+
+        def action_id(self, action_id):
+            """
+            An identifier for the action triggered when a menu option is selected. It's also sent in block_suggestion
+            payloads, so the app knows the options to provide. Maximum length for this field is 255 characters.
+            :param action_id: A string to used as action id
+            :return: ExternalSelect's builder
+            """
+            self._obj._set('_action_id', action_id)
+            return self
+
+        def placeholder(self, placeholder):
+            """
+            A text for the plain_text object that defines the placeholder text shown on the menu.
+            Maximum length for the text in this field is 150 characters.
+            :param placeholder: The text to use as placeholder in the menu. i.e. Choose one:, Select: etc...
+            :return: ExternalSelect's builder
+            """
+            self._obj._set('_placeholder', PlainText.from_text(placeholder))
+            return self
+
+        def initial_option_(self, text, value):
+            """
+            A single option that will be selected when the menu initially loads. Since options are external, the
+            option must be supplied, and it should match one of the options provided by the app.
+            :param text: The text of the option
+            :param value: The value of the option
+            :return: ExternalSelect's builder
+            """
+            builder = Option.Builder().text(text).value(value)
+            self._obj._set('_initial_option', builder.build())
+            return self
+
+        def min_query_length_(self, min_query_length):
+            """
+            When the typeahead field is used, a request will be sent on every character change. If you prefer fewer
+            requests or more fully ideated queries, use this to tell Slack the fewest number of typed characters
+            required before dispatch. The default value is 3.
+            :param min_query_length: An integer
+            :return: ExternalSelect's builder
+            """
+            self._obj._set('_min_query_length', min_query_length)
+            return self
+
+        def Confirm_(self):
+            """
+            A confirm object that defines an optional confirmation dialog that appears after a menu item is selected.
+            :return: Confirmation's builder
+            """
+            builder = Confirmation.Builder(_parent=self)
+            self._obj._set('_confirm', builder.build())
+            return builder
+
+
 class Overflow(AbstractBlock):
     """
     This is like a cross between a button and a select menu - when a user clicks on this overflow button, they will
@@ -976,7 +1530,7 @@ class Overflow(AbstractBlock):
             :param action_id: A string to be used as axtion id
             :return: Overflow's builder
             """
-            setattr(self._obj, '_action_id', action_id)
+            self._obj._set('_action_id', action_id)
             return self
 
         def Option(self):
@@ -986,20 +1540,34 @@ class Overflow(AbstractBlock):
             :return: Option's builder
             """
             if not hasattr(self._obj, '_options'):
-                setattr(self._obj, '_options', [])
+                self._obj._set('_options', [])
 
             opts = getattr(self._obj, '_options')
             builder = Option.Builder(_parent=self)
             opts.append(builder.build())
             return builder
 
+        def options_from(self, pairs=None, texts=None, values=None, descriptions=None):
+            """
+            Adds many options at once to the overflow, see Option.of_many. Maximum number of options is 5, minimum is 2
+            :param pairs: An iterable of tuples (text, value) or (text, value, description)
+            :param texts: A sequence with the text of each option, if pairs is not supplied
+            :param values: A sequence with the value of each option, if pairs is not supplied
+            :param descriptions: An optional sequence with the description of each option
+            :return: Overflow's builder
+            """
+            if not hasattr(self._obj, '_options'):
+                self._obj._set('_options', [])
+            getattr(self._obj, '_options').extend(Option.of_many(pairs, texts, values, descriptions))
+            return self
+
         def Confirm_(self):
             """
             A confirm object that defines an optional confirmation dialog that appears after an item is selected.
             :return: Confirmation's builder
             """
             builder = Confirmation.Builder(_parent=self)
-            setattr(self._obj, '_confirm', builder.build())
+            self._obj._set('_confirm', builder.build())
             return builder
 
 
@@ -1039,7 +1607,7 @@ class PlainTextInput(AbstractBlock):
             :param action_id: A string to be used as action id
             :return: PlainTextInput's builder
             """
-            setattr(self._obj, '_action_id', action_id)
+            self._obj._set('_action_id', action_id)
             return self
 
         def initial_value_(self, initial_value):
@@ -1048,7 +1616,7 @@ class PlainTextInput(AbstractBlock):
             :param initial_value: A string
             :return: PlainTextInput's builder
             """
-            setattr(self._obj, '_initial_value', initial_value)
+            self._obj._set('_initial_value', initial_value)
             return self
 
         def min_length_(self, min_length):
@@ -1058,7 +1626,7 @@ class PlainTextInput(AbstractBlock):
             :param min_length: An integer representing min input length
             :return: PlainTextInput's builder
             """
-            setattr(self._obj, '_min_length', min_length)
+            self._obj._set('_min_length', min_length)
             return self
 
         def max_length_(self, max_length):
@@ -1068,7 +1636,7 @@ class PlainTextInput(AbstractBlock):
             :param max_length: An integer representing max input length
             :return: PlainTextInput's builder
             """
-            setattr(self._obj, '_max_length', max_length)
+            self._obj._set('_max_length', max_length)
             return self
 
         def multiline_(self, boolean):
@@ -1078,7 +1646,7 @@ class PlainTextInput(AbstractBlock):
             :param boolean: A boolean to use multi-line in input text.
             :return: PlainTextInput's builder
             """
-            setattr(self._obj, '_multiline', boolean)
+            self._obj._set('_multiline', boolean)
             return self
 
         def placeholder_(self, placeholder):
@@ -1088,8 +1656,7 @@ class PlainTextInput(AbstractBlock):
             :param placeholder: A string for the placeholder
             :return: PlainTextInput's builder
             """
-            builder = PlainText.Builder().text(placeholder)
-            setattr(self._obj, '_placeholder', builder.build())
+            self._obj._set('_placeholder', PlainText.from_text(placeholder))
             return self
 
 
@@ -1107,7 +1674,7 @@ class Section(AbstractBlock):
     __type__ = 'section'
     __mutually_exclusive_slots__ = '_text', '_fields'
 
-    _ALLOWED_ACCESSORIES = [Button, Image, Overflow, PlainTextInput, SelectMenu, MultiSelectMenu]
+    _ALLOWED_ACCESSORIES = [Button, Image, Overflow, PlainTextInput, SelectMenu, MultiSelectMenu, ExternalSelect]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1139,8 +1706,7 @@ class Section(AbstractBlock):
             :param verbatim: Use verbatim mode in text object
             :return: Section's builder
             """
-            builder = MarkDown.Builder().verbatim_(verbatim).text(text)
-            setattr(self._obj, '_text', builder.build())
+            self._obj._set('_text', MarkDown.from_text(text, verbatim))
             return self
 
         def block_id_(self, block_id):
@@ -1152,7 +1718,7 @@ class Section(AbstractBlock):
             :param block_id: A string to use as block_id
             :return: Section's builder
             """
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
         def field__(self, text, verbatim=False):
@@ -1165,15 +1731,14 @@ class Section(AbstractBlock):
             :return: Section's buildr
             """
             if not hasattr(self._obj, '_fields'):
-                setattr(self._obj, '_fields', [])
+                self._obj._set('_fields', [])
             fields = getattr(self._obj, '_fields')
 
             # max is 10 elements
             if len(fields) == 10:
                 raise AttributeError('max number of fields elements is 10, can not add another one')
 
-            builder = MarkDown.Builder().verbatim_(verbatim).text(text)
-            fields.append(builder.build())
+            fields.append(MarkDown.from_text(text, verbatim))
             return self
 
         def accessory_(self):
@@ -1194,7 +1759,7 @@ class Section(AbstractBlock):
                     :return: Button's builder
                     """
                     _builder = Button.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
                 def Image(self):
@@ -1203,7 +1768,7 @@ class Section(AbstractBlock):
                     :return: Image's builder
                     """
                     _builder = Image.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
                 def MultiSelectMenu(self):
@@ -1212,7 +1777,7 @@ class Section(AbstractBlock):
                     :return: MultiSelectMenu's builder
                     """
                     _builder = MultiSelectMenu.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
                 def Overflow(self):
@@ -1221,7 +1786,7 @@ class Section(AbstractBlock):
                     :return: Overflow's builder
                     """
                     _builder = Overflow.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
                 def PlainTextInput(self):
@@ -1230,7 +1795,7 @@ class Section(AbstractBlock):
                     :return: PlainTextInput's builder
                     """
                     _builder = PlainTextInput.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
                 def SelectMenu(self):
@@ -1239,7 +1804,16 @@ class Section(AbstractBlock):
                     :return: SelectMenu's builder
                     """
                     _builder = SelectMenu.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_accessory', _builder.build())
+                    self._parent._obj._set('_accessory', _builder.build())
+                    return _builder
+
+                def ExternalSelect(self):
+                    """
+                    An instance of ExternalSelect builder
+                    :return: ExternalSelect's builder
+                    """
+                    _builder = ExternalSelect.Builder(_parent=self._parent)
+                    self._parent._obj._set('_accessory', _builder.build())
                     return _builder
 
             return Accessory(_parent=self)
@@ -1263,7 +1837,7 @@ class Divider(AbstractBlock):
         __obj__ = 'Divider'
 
         def block_id_(self, block_id):
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
 
@@ -1277,7 +1851,7 @@ class Actions(AbstractBlock):
     __type__ = 'actions'
     __required_slots__ = ('_elements',)
 
-    _ALLOWED_ELEMENTS = Button, SelectMenu, Overflow
+    _ALLOWED_ELEMENTS = Button, SelectMenu, Overflow, ExternalSelect
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1303,7 +1877,7 @@ class Actions(AbstractBlock):
             :param block_id: A valid string representing the block id
             :return: Action's builder
             """
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
         def element(self):
@@ -1316,7 +1890,7 @@ class Actions(AbstractBlock):
             """
 
             if not hasattr(self._obj, '_elements'):
-                setattr(self._obj, '_elements', [])
+                self._obj._set('_elements', [])
 
             if len(getattr(self._obj, '_elements')) == 5:
                 raise AttributeError('elements already has max number of allowed elements, [5]')
@@ -1324,7 +1898,11 @@ class Actions(AbstractBlock):
             class Element:
                 def __init__(self, _parent):
                     self._parent = _parent
-                    self._elements = getattr(getattr(_parent, '_obj'), '_elements')
+
+                @property
+                def _elements(self):
+                    # looked up each time, freeze() replaces the array of the block
+                    return getattr(getattr(self._parent, '_obj'), '_elements')
 
                 def Button(self):
                     """
@@ -1353,6 +1931,15 @@ class Actions(AbstractBlock):
                     self._elements.append(_builder.build())
                     return _builder
 
+                def ExternalSelect(self):
+                    """
+                    Provides an instance of ExternalSelect builder
+                    :return: ExternalSelect's builder
+                    """
+                    _builder = ExternalSelect.Builder(_parent=self._parent)
+                    self._elements.append(_builder.build())
+                    return _builder
+
             return Element(_parent=self)
 
 
@@ -1392,12 +1979,12 @@ class Context(AbstractBlock):
             :param block_id: A string representing the block id
             :return: Context's builder
             """
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
         def element(self):
             if not hasattr(self._obj, '_elements'):
-                setattr(self._obj, '_elements', [])
+                self._obj._set('_elements', [])
 
             if len(getattr(self._obj, '_elements')) == 5:
                 raise AttributeError('elements already has max number of allowed elements, [5]')
@@ -1405,7 +1992,11 @@ class Context(AbstractBlock):
             class Element:
                 def __init__(self, _parent):
                     self._parent = _parent
-                    self._elements = getattr(getattr(_parent, '_obj'), '_elements')
+
+                @property
+                def _elements(self):
+                    # looked up each time, freeze() replaces the array of the block
+                    return getattr(getattr(self._parent, '_obj'), '_elements')
 
                 def Image(self):
                     """
@@ -1439,7 +2030,7 @@ class Input(AbstractBlock):
     __type__ = 'input'
     __required_slots__ = ('_label', '_element')
 
-    _ALLOWED_ELEMENTS = PlainTextInput, SelectMenu, MultiSelectMenu
+    _ALLOWED_ELEMENTS = PlainTextInput, SelectMenu, MultiSelectMenu, ExternalSelect
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -1467,8 +2058,7 @@ class Input(AbstractBlock):
             :param label: A valid string
             :return: Input's builder
             """
-            _builder = PlainText.Builder().text(label)
-            setattr(self._obj, '_label', _builder.build())
+            self._obj._set('_label', PlainText.from_text(label))
             return self
 
         def element(self):
@@ -1487,7 +2077,7 @@ class Input(AbstractBlock):
                     :return: PlainTextInput's builder
                     """
                     _builder = PlainTextInput.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_element', _builder.build())
+                    self._parent._obj._set('_element', _builder.build())
                     return _builder
 
                 def SelectMenu(self):
@@ -1496,7 +2086,7 @@ class Input(AbstractBlock):
                     :return: SelectMenu's builder
                     """
                     _builder = SelectMenu.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_element', _builder.build())
+                    self._parent._obj._set('_element', _builder.build())
                     return _builder
 
                 def MultiSelectMenu(self):
@@ -1505,7 +2095,16 @@ class Input(AbstractBlock):
                     :return: MultiSelectMenu's builder
                     """
                     _builder = MultiSelectMenu.Builder(_parent=self._parent)
-                    setattr(getattr(self._parent, '_obj'), '_element', _builder.build())
+                    self._parent._obj._set('_element', _builder.build())
+                    return _builder
+
+                def ExternalSelect(self):
+                    """
+                    An instance of ExternalSelect builder
+                    :return: ExternalSelect's builder
+                    """
+                    _builder = ExternalSelect.Builder(_parent=self._parent)
+                    self._parent._obj._set('_element', _builder.build())
                     return _builder
 
             return Element(_parent=self)
@@ -1518,7 +2117,7 @@ class Input(AbstractBlock):
             :param block_id: A string representing the block id
             :return: Input's builder
             """
-            setattr(self._obj, '_block_id', block_id)
+            self._obj._set('_block_id', block_id)
             return self
 
         def hint_(self, hint):
@@ -1528,8 +2127,7 @@ class Input(AbstractBlock):
             :param hint: A valid string
             :return: Input's builder
             """
-            _builder = PlainText.Builder().text(hint)
-            setattr(self._obj, '_hint', _builder.build())
+            self._obj._set('_hint', PlainText.from_text(hint))
             return self
 
         def optional_(self, boolean):
@@ -1539,7 +2137,7 @@ class Input(AbstractBlock):
             :param boolean: A boolean
             :return: Input's builder
             """
-            setattr(self._obj, '_optional', boolean)
+            self._obj._set('_optional', boolean)
             return self
 
 
@@ -1588,7 +2186,8 @@ class View(AbstractBlock):
                 assert getattr(self, '_submit'), 'submit is required when an input block is within supplied blocks'
 
             if hasattr(self, '_private_metadata'):
-                assert len(getattr(self, '_private_metadata')) <= 3000, 'Max length for private_metadata is 3.000 chars'
+                assert len(getattr(self, '_private_metadata')) <= MAX_PRIVATE_METADATA_LENGTH, \
+                    'Max length for private_metadata is 3.000 chars'
 
             if hasattr(self, '_callback_id'):
                 assert len(getattr(self, '_callback_id')) <= 255, 'Max length for private_metadata is 255 chars'
@@ -1603,8 +2202,7 @@ class View(AbstractBlock):
             :param txt: The content of the plain-text object
             :return: View's builder
             """
-            _builder = PlainText.Builder().text(txt)
-            setattr(self._obj, '_title', _builder.build())
+            self._obj._set('_title', PlainText.from_text(txt))
             return self
 
         def Blocks(self):
@@ -1613,9 +2211,25 @@ class View(AbstractBlock):
             :return: An instance of BlockArray's builder
             """
             _builder = BlocksArray.Builder(_parent=self)
-            setattr(self._obj, '_blocks', _builder.build())
+            self._obj._set('_blocks', _builder.build())
             return _builder
 
+        def edit_blocks(self):
+            """
+            Use this to edit the array of blocks already set in the view, i.e. in a clone of another view. Blocks can
+            be appended, replaced or edited with copy-on-write, see BlocksArray.Builder.edit
+            :return: An instance of BlockArray's builder, working on current array of blocks
+            """
+            if not hasattr(self._obj, '_blocks'):
+                return self.Blocks()
+            blocks = getattr(self._obj, '_blocks')
+            if not isinstance(blocks, BlocksArray):
+                # blocks in a plain array could be shared with other views, so they're copied on write
+                blocks = BlocksArray(_blocks=blocks)
+                object.__setattr__(blocks, '_shared', {id(blk) for blk in getattr(blocks, '_blocks')})
+                self._obj._set('_blocks', blocks)
+            return BlocksArray.Builder(_parent=self, _obj=blocks)
+
         def close_(self, close_txt):
             """
             Text to create a plain_text element that
@@ -1624,8 +2238,7 @@ class View(AbstractBlock):
             :param close_txt: The content of the plain-text object
             :return: View's builder
             """
-            _builder = PlainText.Builder().text(close_txt)
-            setattr(self._obj, '_close', _builder.build())
+            self._obj._set('_close', PlainText.from_text(close_txt))
             return self
 
         def submit_(self, submit_txt):
@@ -1636,19 +2249,24 @@ class View(AbstractBlock):
             :param submit_txt: The content of the plain-text object
             :return: View's builder
             """
-            _builder = PlainText.Builder().text(submit_txt)
-            setattr(self._obj, '_submit', _builder.build())
+            self._obj._set('_submit', PlainText.from_text(submit_txt))
             return self
 
-        def private_metadata_(self, private_metadata):
+        def private_metadata_(self, private_metadata, codec=None):
             """
             An optional string that will be sent to your slackviews in
             view_submission and block_actions events.
             Max length of 3000 characters.
-            :param private_metadata: The string representing private metadata
+            :param private_metadata: The string representing private metadata, or a dictionary to be encoded
+            with supplied codec
+            :param codec: The codec used to encode a dictionary. If None, default PrivateMetadataCodec is used
             :return: View's builder
             """
-            setattr(self._obj, '_private_metadata', private_metadata)
+            if isinstance(private_metadata, dict):
+                private_metadata = (codec or default_codec).encode(private_metadata)
+            elif len(private_metadata) > MAX_PRIVATE_METADATA_LENGTH:
+                raise AttributeError(f'Max length for private_metadata is {MAX_PRIVATE_METADATA_LENGTH} chars')
+            self._obj._set('_private_metadata', private_metadata)
             return self
 
         def callback_id_(self, callback_id):
@@ -1659,7 +2277,7 @@ class View(AbstractBlock):
             :param callback_id: The callback_id as a string
             :return: View's builder
             """
-            setattr(self._obj, '_callback_id', callback_id)
+            self._obj._set('_callback_id', callback_id)
             return self
 
         def clear_on_close_(self, clear_on_close):
@@ -1669,7 +2287,7 @@ class View(AbstractBlock):
             :param clear_on_close: A boolean
             :return: View's builder
             """
-            setattr(self._obj, '_clear_on_close', clear_on_close)
+            self._obj._set('_clear_on_close', clear_on_close)
             return self
 
         def notify_on_close_(self, notify_on_close):
@@ -1679,7 +2297,7 @@ class View(AbstractBlock):
             :param notify_on_close: A boolean
             :return: View's builder
             """
-            setattr(self._obj, '_notify_on_close', notify_on_close)
+            self._obj._set('_notify_on_close', notify_on_close)
             return self
 
         def external_id_(self, external_id):
@@ -1688,7 +2306,7 @@ class View(AbstractBlock):
             :param external_id: A string representing external id
             :return: View's builder
             """
-            setattr(self._obj, '_external_id', external_id)
+            self._obj._set('_external_id', external_id)
             return self
 
 
@@ -1725,43 +2343,291 @@ class BlocksArray:
     actually it's not a block, but a group of blocks in an array. So just acts as a wrapper of an array with a
     dictionary of blocks
     """
-    __slots__ = ('_blocks',)
+    # _shared holds the ids of blocks shared with the array this one was cloned from, see clone(), and _index the
+    # positions of blocks by block_id and action_id, see _update_index()
+    __slots__ = ('_blocks', '_frozen', '_shared', '_index')
 
     def __init__(self, **kwargs):
+        object.__setattr__(self, '_frozen', None)
+        object.__setattr__(self, '_shared', None)
+        object.__setattr__(self, '_index', None)
         setattr(self, '_blocks', kwargs.get('_blocks', []))
 
+    __setattr__ = AbstractBlock.__setattr__
+    _set = AbstractBlock._set
+    __setstate__ = AbstractBlock.__setstate__
+    __hash__ = AbstractBlock.__hash__
+    is_frozen = AbstractBlock.is_frozen
+    memory_usage = AbstractBlock.memory_usage
+
+    def freeze(self):
+        """
+        Makes current array of blocks, and all blocks in it, immutable, caching its serialization. See
+        AbstractBlock.freeze
+        :return: Current instance
+        """
+        if self._frozen is not None:
+            return self
+        blocks = [blk.freeze() for blk in getattr(self, '_blocks')]
+        object.__setattr__(self, '_blocks', FrozenList(blocks))
+        _array = self.serialize()
+        _json = json.dumps(_array)
+        object.__setattr__(self, '_frozen', (_array, _json, hash((self.__class__, _json))))
+        return self
+
+    def clone(self):
+        """
+        Provides a copy of current array of blocks, with copy-on-write semantics: the blocks are shared with current
+        array, and a block is copied only when it's edited in the clone using BlocksArray.Builder.edit. Blocks can be
+        appended or replaced in the clone too, without changing current array. Cloning only copies the references
+        to the blocks, so it's cheap even for the largest views.
+        :return: A new instance of BlocksArray, never frozen
+        """
+        instance = BlocksArray.__new__(BlocksArray)
+        blocks = list(getattr(self, '_blocks'))
+        object.__setattr__(instance, '_frozen', None)
+        object.__setattr__(instance, '_blocks', blocks)
+        object.__setattr__(instance, '_shared', {id(blk) for blk in blocks})
+        object.__setattr__(instance, '_index', None)
+        return instance
+
+    def builder(self):
+        """
+        Provides a builder of current array of blocks, to keep building it, i.e. to personalize a clone
+        :return: An instance of BlocksArray.Builder, working on current array
+        """
+        return BlocksArray.Builder(_obj=self)
+
+    def index_of(self, key):
+        """
+        Provides the position of a block in current array
+        :param key: The position of the block, or its block_id
+        :return: The position of the block. An AttributeError is thrown if it does not exists
+        """
+        if isinstance(key, int):
+            length = len(getattr(self, '_blocks'))
+            if not -length <= key < length:
+                raise AttributeError(f'No block at position [{key}]')
+            return key % length
+        position = self._update_index()[0].get(key)
+        if position is None:
+            raise AttributeError(f'No block with block_id [{key}]')
+        return position
+
+    def get(self, key, default=None):
+        """
+        Provides a block of current array
+        :param key: The position of the block, or its block_id
+        :param default: Value returned if there is no such block
+        :return: The block, or default value
+        """
+        try:
+            return getattr(self, '_blocks')[self.index_of(key)]
+        except AttributeError:
+            return default
+
+    def get_by_action_id(self, action_id, default=None):
+        """
+        Provides the block containing the element with supplied action_id, i.e. the Actions block with a Button,
+        or the Section with an accessory
+        :param action_id: The action_id of an element in the block
+        :param default: Value returned if there is no such block
+        :return: The block, or default value
+        """
+        position = self._update_index()[1].get(action_id)
+        return default if position is None else getattr(self, '_blocks')[position]
+
+    def replace_block(self, key, block):
+        """
+        Replaces a block of current array by supplied block. Supplied block is not copied, so it's shared if it
+        belongs to any other array too
+        :param key: The position of the block to replace, or its block_id
+        :param block: An instance of AbstractBlock
+        :return: The replaced block
+        """
+        assert isinstance(block, AbstractBlock), 'block must be an instance of AbstractBlock'
+        position = self.index_of(key)
+        blocks = getattr(self, '_blocks')
+        old = blocks[position]
+        blocks[position] = block
+        self._reindex(position, old, block)
+        # the same block could be in the array more than once
+        if self._shared and not any(blk is old for blk in blocks):
+            self._shared.discard(id(old))
+        return old
+
+    def insert_after(self, key, block):
+        """
+        Inserts supplied block after another block of current array
+        :param key: The position of the block after which supplied block is inserted, or its block_id. If None,
+        the block is inserted first
+        :param block: An instance of AbstractBlock
+        """
+        assert isinstance(block, AbstractBlock), 'block must be an instance of AbstractBlock'
+        position = 0 if key is None else self.index_of(key) + 1
+        getattr(self, '_blocks').insert(position, block)
+        self._reindex(position, None, block)
+
+    def remove(self, key):
+        """
+        Removes a block from current array
+        :param key: The position of the block, or its block_id
+        :return: The removed block
+        """
+        position = self.index_of(key)
+        blocks = getattr(self, '_blocks')
+        old = blocks.pop(position)
+        self._reindex(position, old, None)
+        if self._shared and not any(blk is old for blk in blocks):
+            self._shared.discard(id(old))
+        return old
+
+    def _own_block(self, key):
+        """
+        Provides a block of current array that can be modified: blocks shared with the array this one was cloned
+        from, and frozen blocks, are replaced by a clone of them first
+        :param key: The position of the block, or its block_id
+        :return: The block, owned by current array
+        """
+        position = self.index_of(key)
+        block = getattr(self, '_blocks')[position]
+        if block.is_frozen() or (self._shared and id(block) in self._shared):
+            block = block.clone()
+            self.replace_block(position, block)
+        return block
+
     def serialize(self, as_json=False):
         """
         Returns the array of blocks's dictionary. It's an array,  not a dictionary with key "blocks". The array is ready
         to be serialized in Slack
         :return: An array of  dicts with current content blocks
         """
+        if self._frozen is not None:
+            return self._frozen[1 if as_json else 0]
         array_ = [blk.serialize() for blk in getattr(self, '_blocks')]
         if as_json:
             return json.dumps(array_)
         else:
             return array_
 
+    @staticmethod
+    def _keys_of(block):
+        """
+        Provides the block_id of a block, and the action_id of the elements within it
+        :param block: An instance of AbstractBlock
+        :return: A tuple (block_id or None, [action_id, ...])
+        """
+        action_ids = []
+        for slot in ('_accessory', '_element', '_elements'):
+            value = getattr(block, slot, None)
+            if value is None:
+                continue
+            for elem in (value if isinstance(value, list) else (value,)):
+                action_id = getattr(elem, '_action_id', None)
+                if action_id is not None:
+                    action_ids.append(action_id)
+        return getattr(block, '_block_id', None), action_ids
+
+    def _update_index(self):
+        """
+        Provides the index of blocks by block_id and by action_id of their elements, the first block wins in case of
+        repeated keys, as a sequential search would do.
+
+        The index is kept in slot _index as [positions by block_id, positions by action_id, number of Input blocks,
+        blocks, indexed blocks, repeated keys], and only blocks appended since last call are indexed. It's rebuilt
+        from scratch if the array of blocks is replaced or shortened, without using remove(). replace_block(),
+        insert_after() and remove() keep it up to date, but changing the block_id or action_id of a block that is
+        already indexed is only tracked when it's done through BlocksArray.Builder.edit.
+        :return: The index
+        """
+        blocks = getattr(self, '_blocks')
+        _index = self._index
+        if _index is None or _index[3] is not blocks or _index[4] > len(blocks):
+            _index = [dict(), dict(), 0, blocks, 0, False]
+            # it's a cache, so it's kept even in frozen arrays
+            object.__setattr__(self, '_index', _index)
+
+        by_block_id, by_action_id = _index[0], _index[1]
+        for position in range(_index[4], len(blocks)):
+            block = blocks[position]
+            block_id, action_ids = self._keys_of(block)
+            for keys, key in [(by_block_id, block_id)] + [(by_action_id, action_id) for action_id in action_ids]:
+                if key is None:
+                    continue
+                if key in keys:
+                    _index[5] = True
+                else:
+                    keys[key] = position
+            if isinstance(block, Input):
+                _index[2] += 1
+        _index[4] = len(blocks)
+        return _index
+
+    def _reindex(self, position, old, new):
+        """
+        Updates the index after replacing, inserting or removing the block at supplied position. The index is
+        discarded if it wasn't up to date, or if there are repeated keys
+        :param position: The position of the changed block
+        :param old: The block that was at supplied position, None if a block was inserted
+        :param new: The block now at supplied position, None if a block was removed
+        """
+        _index = self._index
+        if _index is None:
+            return
+        blocks = getattr(self, '_blocks')
+        shift = (old is None) - (new is None)
+        if _index[5] or _index[3] is not blocks or _index[4] != len(blocks) - shift:
+            object.__setattr__(self, '_index', None)
+            return
+
+        by_block_id, by_action_id = _index[0], _index[1]
+        if old is not None:
+            block_id, action_ids = self._keys_of(old)
+            by_block_id.pop(block_id, None)
+            for action_id in action_ids:
+                by_action_id.pop(action_id, None)
+            _index[2] -= isinstance(old, Input)
+
+        if shift:
+            for keys in (by_block_id, by_action_id):
+                for key, pos in keys.items():
+                    if pos > position or (pos == position and shift > 0):
+                        keys[key] = pos + shift
+
+        if new is not None:
+            block_id, action_ids = self._keys_of(new)
+            for keys, key in [(by_block_id, block_id)] + [(by_action_id, action_id) for action_id in action_ids]:
+                if key is None:
+                    continue
+                if key in keys:
+                    # the first block should win, but positions of other blocks with same key are unknown
+                    object.__setattr__(self, '_index', None)
+                    return
+                keys[key] = position
+            _index[2] += isinstance(new, Input)
+
+        _index[4] += shift
+
     def _from(self, _array_of_blocks):
         """
         Sets the array of blocks of current instance not from dictionary directly but from supplied array of
         AbstractBlock instances. It's an internal method, the static method <of> should be used to create an instance
         from an array of already serialized blocks, that is, an array of dictionaries
         """
-        assert len(list(filter(lambda x: not x, [isinstance(elem, AbstractBlock)
-                                                 for elem in _array_of_blocks]))) == 0, \
+        assert all(isinstance(elem, AbstractBlock) for elem in _array_of_blocks), \
             'All elements in array must be an instance of AbstractBlock'
-        setattr(self, '_blocks', _array_of_blocks)
+        self._set('_blocks', _array_of_blocks)
 
     def has_input_block(self):
         """
         Check if current blocks contain an Input block type. Useful to validate submit field in Views
         :return: True if contains an Input Block, False otherwise
         """
-        for blk in getattr(self, '_blocks'):
-            if isinstance(blk, Input):
-                return True
-        return False
+        _index = self._index
+        blocks = getattr(self, '_blocks')
+        if _index is not None and _index[3] is blocks and _index[4] == len(blocks):
+            return _index[2] > 0
+        return any(isinstance(blk, Input) for blk in blocks)
 
     def num_of_blocks(self):
         """
@@ -1793,6 +2659,55 @@ class BlocksArray:
 
         __obj__ = 'BlocksArray'
 
+        def block(self, block):
+            """
+            Appends an already built block to current array of blocks. The block is not copied, so frozen blocks
+            (see AbstractBlock.freeze) can be shared by reference among many arrays of blocks
+            :param block: An instance of AbstractBlock
+            :return: BlocksArray's builder
+            """
+            assert isinstance(block, AbstractBlock), 'block must be an instance of AbstractBlock'
+            getattr(getattr(self, '_obj'), '_blocks').append(block)
+            return self
+
+        def blocks(self, blocks):
+            """
+            Appends the blocks of an already built array of blocks to current one, by reference as in block(). The
+            blocks of a frozen array, i.e. a fragment of slackviews.fragments.FragmentCache, keep their cached
+            serialization, so they're spliced with no cost
+            :param blocks: An instance of BlocksArray, or an iterable of AbstractBlock instances
+            :return: BlocksArray's builder
+            """
+            if isinstance(blocks, BlocksArray):
+                blocks = getattr(blocks, '_blocks')
+            for block in blocks:
+                self.block(block)
+            return self
+
+        def edit(self, key):
+            """
+            Provides the builder of a block already in current array, to modify it. If the block is shared with the
+            array this one was cloned from (see BlocksArray.clone), or it's frozen, it's copied first and the copy
+            replaces it in current array, so the original block is never modified
+            :param key: The position of the block, or its block_id
+            :return: The builder of the block
+            """
+            _obj = getattr(self, '_obj')
+            block = _obj._own_block(key)
+            # the builder could change the block_id or action_ids of the block
+            object.__setattr__(_obj, '_index', None)
+            return block.Builder(_parent=self, _obj=block)
+
+        def replace(self, key, block):
+            """
+            Replaces a block of current array by supplied block, see BlocksArray.replace_block
+            :param key: The position of the block to replace, or its block_id
+            :param block: An instance of AbstractBlock
+            :return: BlocksArray's builder
+            """
+            getattr(self, '_obj').replace_block(key, block)
+            return self
+
         def Actions(self):
             """
             Appends an instance of Actions to current array of blocks, and returns the Builder the instance
@@ -1859,6 +2774,7 @@ class BlocksFactory:
                       Button.__type__: Button,
                       Context.__type__: Context,
                       Divider.__type__: Divider,
+                      ExternalSelect.__type__: ExternalSelect,
                       Header.__type__: Header,
                       Image.__type__: Image,
                       Input.__type__: Input,
@@ -1869,7 +2785,8 @@ class BlocksFactory:
                       PlainTextInput.__type__: PlainTextInput,
                       Section.__type__: Section,
                       SelectMenu.__type__: SelectMenu,
-                      Modal.__type__: Modal}
+                      Modal.__type__: Modal,
+                      Home.__type__: Home}
 
     _BLOCK_BY_REQUIRED_FIELDS = {Confirmation.__required_slots__: Confirmation,
                                  Option.__required_slots__: Option,
@@ -1936,3 +2853,14 @@ class BlocksFactory:
         assert issubclass(class_of, AbstractBlock), 'Unknown dict type. Only AbstractBlock classes can be deserialized'
 
         return class_of.deserialize(dictionary)
+
+
+def __getattr__(name):
+    """
+    Provides classes moved to submodules that are only imported when needed (PEP 562), so they can still be imported
+    from this module
+    """
+    if name == 'BlockProfiler':
+        from slackviews.profiling import BlockProfiler
+        return BlockProfiler
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -160,3 +160,67 @@ class TestBlocksArray:
 
         # WHEN
         BlocksArray.of([Divider.Builder().build(), object()])
+
+    def test_should_get_blocks_by_position_block_id_and_action_id(self):
+
+        # GIVEN
+        instance = BlocksArray.Builder() \
+            .Section().block_id_('section').text__('any').accessory_().Button().action_id('accessory').text('any') \
+            .up().up() \
+            .Actions().block_id_('actions').element().Button().action_id('button').text('any').up().up() \
+            .build()
+
+        # THEN
+        blocks = getattr(instance, '_blocks')
+        assert instance.get(0) is instance.get('section') is instance.get_by_action_id('accessory') is blocks[0]
+        assert instance.get(-1) is instance.get('actions') is instance.get_by_action_id('button') is blocks[1]
+        assert instance.get('any missing block id') is None and instance.get_by_action_id('any missing') is None
+
+    def test_should_insert_replace_and_remove_keep_index_consistent(self):
+
+        # GIVEN
+        instance = BlocksArray.Builder() \
+            .Divider().block_id_('first').up() \
+            .Divider().block_id_('last').up() \
+            .build()
+        assert not instance.has_input_block()
+
+        # WHEN
+        _input = Input.Builder().block_id_('input').label('any').element().PlainTextInput().action_id('text') \
+            .up().build()
+        instance.insert_after('first', _input)
+        instance.insert_after(None, Header.Builder().block_id_('header').text('any').build())
+
+        # THEN
+        assert [getattr(blk, '_block_id') for blk in getattr(instance, '_blocks')] == \
+               ['header', 'first', 'input', 'last']
+        assert instance.get('last') is getattr(instance, '_blocks')[3]
+        assert instance.get_by_action_id('text') is _input and instance.has_input_block()
+
+        # WHEN
+        instance.replace_block('first', Divider.Builder().block_id_('other').build())
+        removed = instance.remove('input')
+
+        # THEN
+        assert removed is _input and not instance.has_input_block()
+        assert instance.get('first') is None and instance.get_by_action_id('text') is None
+        assert instance.index_of('other') == 1 and instance.index_of('last') == 2
+
+    def test_should_index_first_block_with_repeated_block_id(self):
+
+        # GIVEN
+        instance = BlocksArray.Builder().Divider().block_id_('any').up().Divider().block_id_('any').up().build()
+        first, second = getattr(instance, '_blocks')
+
+        # WHEN
+        found = instance.get('any')
+        instance.remove(0)
+
+        # THEN
+        assert found is first and instance.get('any') is second
+
+    @raises(AttributeError)
+    def test_should_remove_missing_block_raise_attributeerror(self):
+
+        # WHEN
+        self.instance.remove('any missing block id')
@@ -4,7 +4,7 @@ Class with nosetests for BlocksFactory in slack_view library
 from nose.tools import raises
 
 from slackviews.view import PlainText, BlocksFactory, Actions, Button, Context, Confirmation, Divider, Header, Image, \
-    MarkDown, Option, MultiSelectMenu, OptionGroup, Overflow, PlainTextInput, Section, SelectMenu, Input
+    MarkDown, Option, MultiSelectMenu, OptionGroup, Overflow, PlainTextInput, Section, SelectMenu, Input, Home
 
 __author__ = 'Agustin Escamez'
 __email__ = 'aech22@gmail.com'
@@ -538,3 +538,15 @@ class TestPlainText:
         assert isinstance(instance_from_json, Input)
         assert instance_from_dict.__eq__(expected_instance)
         assert instance_from_json.__eq__(expected_instance)
+
+    def test_should_blocksfactory_provide_correct_home_instance_from_serialized_dict(self):
+        # GIVEN
+        serialized_dict = {'type': 'home', 'title': {'type': 'plain_text', 'text': 'any title', 'emoji': False},
+                           'blocks': [{'type': 'divider'}]}
+
+        # WHEN
+        instance_from_dict = BlocksFactory.of(serialized_dict)
+
+        # THEN
+        assert isinstance(instance_from_dict, Home)
+        assert instance_from_dict.serialize() == serialized_dict
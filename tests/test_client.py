@@ -0,0 +1,194 @@
+"""
+Class with nosetests for the client of Slack's Web API in slack_view library, using the local stub
+"""
+import http.client
+import json
+
+from nose.tools import raises
+
+from slackviews.client import ConnectionPool, SlackClient, SlackApiException
+from slackviews.stub import StubSlackServer
+from slackviews.view import Home, Modal, BlocksArray
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class FakeResponse:
+    status = 200
+    headers = {}
+    will_close = False
+
+    def read(self):
+        return b'{"ok": true}'
+
+
+class FakeConnection:
+    """
+    Connection which fails in the given step ('request' or 'getresponse') when it's reused, as if it were closed by
+    the server while it was idle
+    """
+    # step which fails once the connection is idle
+    fails_in = None
+    # (method, path) of every request sent
+    sent = []
+
+    def __init__(self, host, timeout=None):
+        self.used = False
+
+    def request(self, method, path, body=None, headers=None):
+        if self.used and self.fails_in == 'request':
+            raise BrokenPipeError()
+        self.sent.append((method, path))
+
+    def getresponse(self):
+        if self.used and self.fails_in == 'getresponse':
+            raise http.client.RemoteDisconnected()
+        self.used = True
+        return FakeResponse()
+
+    def close(self):
+        pass
+
+
+class TestConnectionPool:
+
+    def setup(self):
+        FakeConnection.sent = []
+        self.pool = ConnectionPool('http', 'any host')
+        self.pool.connection_class = FakeConnection
+
+    def test_should_retry_requests_not_sent_by_stale_connections(self):
+
+        # GIVEN
+        FakeConnection.fails_in = 'request'
+        self.pool.request('POST', '/chat.postMessage', b'{}', {})
+
+        # WHEN
+        status, _, _ = self.pool.request('POST', '/chat.postMessage', b'{}', {})
+
+        # THEN
+        assert status == 200 and self.pool.opened == 2
+        assert FakeConnection.sent == [('POST', '/chat.postMessage')] * 2
+
+    def test_should_retry_idempotent_requests_of_stale_connections(self):
+
+        # GIVEN
+        FakeConnection.fails_in = 'getresponse'
+        self.pool.request('GET', '/any', None, {})
+
+        # WHEN
+        status, _, _ = self.pool.request('GET', '/any', None, {})
+
+        # THEN
+        assert status == 200 and self.pool.opened == 2
+        assert FakeConnection.sent == [('GET', '/any')] * 3
+
+    @raises(http.client.RemoteDisconnected)
+    def test_should_not_retry_sent_posts_of_stale_connections(self):
+
+        # GIVEN
+        FakeConnection.fails_in = 'getresponse'
+        self.pool.request('POST', '/chat.postMessage', b'{}', {})
+
+        # WHEN
+        try:
+            self.pool.request('POST', '/chat.postMessage', b'{}', {})
+        finally:
+
+            # THEN
+            assert FakeConnection.sent == [('POST', '/chat.postMessage')] * 2 and self.pool.opened == 1
+
+
+class TestSlackClient:
+
+    def setup(self):
+        self.server = StubSlackServer().start()
+        self.client = SlackClient('any token', base_url=self.server.api_url)
+        self.home = Home.Builder().title('any title').Blocks().Section().text__('any text').up().up().build()
+
+    def teardown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_should_publish_view(self):
+
+        # WHEN
+        response = self.client.views_publish('U000000', self.home)
+
+        # THEN
+        request = self.server.requests[0]
+        assert request.method == 'views.publish' and request.headers['Authorization'] == 'Bearer any token'
+        assert request.body == {'user_id': 'U000000', 'view': self.home.serialize()}
+        assert response['ok'] and response['view']['id']
+
+    def test_should_send_pre_serialized_view_as_it_is(self):
+
+        # GIVEN
+        modal = Modal.Builder().title('any title').Blocks().Divider().up().up().build().serialize(as_json=True)
+
+        # WHEN
+        self.client.views_open('any trigger', modal)
+        self.client.views_update(modal.encode('utf-8'), view_id='V000000', hash_='any hash')
+
+        # THEN
+        assert self.server.requests[0].body == {'trigger_id': 'any trigger', 'view': json.loads(modal)}
+        assert self.server.requests[1].body == {'view_id': 'V000000', 'hash': 'any hash', 'view': json.loads(modal)}
+
+    def test_should_reuse_connections(self):
+
+        # WHEN
+        for user in range(5):
+            self.client.views_publish(f'U{user}', self.home)
+
+        # THEN
+        assert self.server.count == 5
+        assert self.client.pool('http', self.server.url[len('http://'):]).opened == 1
+
+    def test_should_post_message_and_respond(self):
+
+        # GIVEN
+        blocks = BlocksArray.Builder().Divider().up().build()
+
+        # WHEN
+        self.client.chat_post_message('C000000', blocks=blocks, text='any text', thread_ts='1.0')
+        self.client.respond(f'{self.server.url}/commands/T000/1/any', text='any text', response_type='ephemeral')
+
+        # THEN
+        message, response = self.server.requests
+        assert message.body == {'channel': 'C000000', 'text': 'any text', 'blocks': [{'type': 'divider'}],
+                                'thread_ts': '1.0'}
+        assert response.method == '/commands/T000/1/any' and 'Authorization' not in response.headers
+        assert response.body == {'text': 'any text', 'response_type': 'ephemeral'}
+
+    def test_should_error_raise_slackapiexception(self):
+
+        # GIVEN
+        self.server.responses['views.open'] = {'ok': False, 'error': 'expired_trigger_id'}
+
+        # WHEN
+        try:
+            self.client.views_open('any trigger', self.home)
+            assert False, 'SlackApiException expected'
+        except SlackApiException as e:
+
+            # THEN
+            assert str(e) == 'expired_trigger_id' and e.status == 200 and e.retry_after is None
+
+    def test_should_rate_limit_provide_retry_after(self):
+
+        # GIVEN
+        self.server.responses['views.publish'] = (429, {'ok': False, 'error': 'ratelimited'}, {'Retry-After': '3'})
+
+        # WHEN
+        try:
+            self.client.views_publish('U000000', self.home)
+            assert False, 'SlackApiException expected'
+        except SlackApiException as e:
+
+            # THEN
+            assert e.status == 429 and e.retry_after == 3
+
+    @raises(AssertionError)
+    def test_should_update_without_id_raise_assertionerror(self):
+        self.client.views_update(self.home)
@@ -0,0 +1,107 @@
+"""
+Class with nosetests for copy-on-write clones of views in slack_view library
+"""
+from nose.tools import raises
+
+from slackviews.view import Home, Section, Divider
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestClone:
+
+    def setup(self):
+        self.base = Home.Builder().title('any title').callback_id_('any callback') \
+            .Blocks() \
+            .Section().block_id_('greeting').text__('Hello').up() \
+            .Divider().up() \
+            .Section().block_id_('footer').field__('any footer').field__('any field').up() \
+            .up().build()
+        self.base_dict = self.base.serialize()
+
+    def test_should_clone_share_blocks_until_edited(self):
+
+        # WHEN
+        view = self.base.clone()
+        blocks = getattr(getattr(view, '_blocks'), '_blocks')
+        base_blocks = getattr(getattr(self.base, '_blocks'), '_blocks')
+
+        # THEN
+        assert view is not self.base and getattr(view, '_blocks') is not getattr(self.base, '_blocks')
+        assert all(blk is base_blk for blk, base_blk in zip(blocks, base_blocks))
+        assert view.serialize() == self.base_dict
+
+    def test_should_edit_copy_only_touched_blocks(self):
+
+        # GIVEN
+        view = self.base.clone()
+
+        # WHEN
+        view.builder().title('other title').edit_blocks() \
+            .edit('greeting').text__('Hello Ann').up() \
+            .edit(-1).field__('other field').up() \
+            .Divider()
+        blocks = getattr(getattr(view, '_blocks'), '_blocks')
+        base_blocks = getattr(getattr(self.base, '_blocks'), '_blocks')
+
+        # THEN
+        assert self.base.serialize() == self.base_dict
+        assert blocks[0] is not base_blocks[0] and blocks[1] is base_blocks[1] and blocks[2] is not base_blocks[2]
+        assert view.serialize()['blocks'][0]['text']['text'] == 'Hello Ann'
+        assert len(view.serialize()['blocks'][2]['fields']) == 3 and len(blocks) == 4
+        assert view.serialize()['title']['text'] == 'other title'
+
+    def test_should_edit_same_block_twice_copy_it_once(self):
+
+        # GIVEN
+        blocks = self.base.clone().builder().edit_blocks()
+
+        # WHEN
+        first = blocks.edit('greeting').build()
+        second = blocks.edit('greeting').build()
+
+        # THEN
+        assert first is second
+
+    def test_should_replace_block_in_clone(self):
+
+        # GIVEN
+        view = self.base.clone()
+        block = Section.Builder().text__('any text').build()
+
+        # WHEN
+        old = getattr(view, '_blocks').replace_block('greeting', block)
+
+        # THEN
+        assert old is getattr(getattr(self.base, '_blocks'), '_blocks')[0]
+        assert getattr(getattr(view, '_blocks'), '_blocks')[0] is block
+        assert self.base.serialize() == self.base_dict
+
+    def test_should_edit_frozen_view_clone(self):
+
+        # GIVEN
+        self.base.freeze()
+
+        # WHEN
+        view = self.base.clone()
+        view.builder().edit_blocks().edit('footer').block_id_('other footer')
+
+        # THEN
+        assert not view.is_frozen() and self.base.serialize() == self.base_dict
+        assert view.serialize()['blocks'][2]['block_id'] == 'other footer'
+
+    @raises(AttributeError)
+    def test_should_edit_missing_block_raise_attributeerror(self):
+        self.base.clone().builder().edit_blocks().edit('any missing block id')
+
+    def test_should_clone_block(self):
+
+        # GIVEN
+        divider = Divider.Builder().block_id_('any block id').build().freeze()
+
+        # WHEN
+        clone = divider.clone()
+
+        # THEN
+        assert not clone.is_frozen() and clone == divider
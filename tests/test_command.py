@@ -0,0 +1,183 @@
+"""
+Class with nosetests for Command in slack_view library
+"""
+import copy
+import json
+import pickle
+
+from nose.tools import raises
+
+from slackviews.payloads import Command, CommandArguments, CommandArgumentsException, ImmutableMapping, \
+    PositionalArgument, OptionArgument, FlagArgument
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class Deploy(Command):
+    __arguments__ = (PositionalArgument('service'),
+                     OptionArgument('timeout', type_=int, default=30, aliases=('-t',)),
+                     FlagArgument('force'))
+
+
+class Echo(Command):
+
+    def _verify_command(self):
+        pass
+
+
+class Notes(Command):
+    __arguments__ = (PositionalArgument('words', many=True, required=False),)
+
+
+class TestCommand:
+
+    def setup(self):
+        self.form = {'token': 'xyz', 'team_id': 'T1', 'user_id': 'U1', 'command': '/deploy',
+                     'text': 'api -t 10 --force', 'trigger_id': 'TR1'}
+
+    def test_should_command_be_a_dictionary(self):
+
+        # WHEN
+        command = Deploy(self.form)
+
+        # THEN
+        assert isinstance(command, dict) and command == self.form
+        assert json.loads(json.dumps(command)) == self.form
+        assert dict(command) == self.form and {**command} == self.form
+        assert command.user_id() == 'U1' and command.get('missing') is None
+
+    @raises(TypeError)
+    def test_should_command_reject_item_assignment(self):
+        Deploy(self.form)['user_id'] = 'U2'
+
+    def test_should_command_reject_any_change(self):
+
+        # GIVEN
+        command = Deploy(self.form)
+        changes = [lambda: command.update(user_id='U2'), lambda: command.pop('token'), command.popitem,
+                   command.clear, lambda: command.setdefault('channel_id', 'C1'),
+                   lambda: command.__delitem__('token')]
+
+        # WHEN
+        errors = 0
+        for change in changes:
+            try:
+                change()
+            except TypeError:
+                errors += 1
+
+        # THEN
+        assert errors == len(changes)
+        assert command == self.form
+
+    def test_should_command_copy_be_mutable(self):
+
+        # GIVEN
+        command = Deploy(self.form)
+
+        # WHEN
+        copied = command.copy()
+        copied['user_id'] = 'U2'
+
+        # THEN
+        assert type(copied) is dict and command.user_id() == 'U1'
+
+    def test_should_command_be_pickled_and_copied(self):
+
+        # GIVEN
+        command = Deploy(self.form)
+
+        # WHEN
+        pickled, copied = pickle.loads(pickle.dumps(command)), copy.deepcopy(command)
+
+        # THEN
+        assert type(pickled) is Deploy and pickled == command and pickled.arguments().timeout == 10
+        assert type(copied) is Deploy and copied == command
+
+    def test_should_immutablemapping_be_hashable(self):
+
+        # WHEN
+        mappings = {ImmutableMapping(a=1, b=2), ImmutableMapping(b=2, a=1), ImmutableMapping.fromkeys('ab')}
+
+        # THEN
+        assert len(mappings) == 2
+        assert repr(ImmutableMapping(a=1)) == "ImmutableMapping({'a': 1})"
+
+    def test_should_command_parse_declared_arguments(self):
+
+        # WHEN
+        arguments = Deploy(self.form).arguments()
+
+        # THEN
+        assert (arguments.service, arguments.timeout, arguments.force) == ('api', 10, True)
+
+    def test_should_tokenize_quoted_arguments(self):
+
+        # WHEN
+        tokens = CommandArguments.tokenize('add "my task" \u201cother task\u201d --tag=#ops')
+
+        # THEN
+        assert tokens == ['add', 'my task', 'other task', '--tag=#ops']
+
+    def test_should_tokenize_keep_apostrophes_and_backslashes(self):
+
+        # WHEN
+        apostrophe = CommandArguments.tokenize("it's  done")
+        slack_apostrophe = CommandArguments.tokenize('it\u2019s done')
+        quoted = CommandArguments.tokenize('"it\'s done" \u2018a b\u2019')
+        unbalanced = CommandArguments.tokenize('"it\'s done')
+        backslashes = CommandArguments.tokenize('C:\\temp "a\\" b')
+
+        # THEN
+        assert apostrophe == ["it's", 'done']
+        assert slack_apostrophe == ['it\u2019s', 'done']
+        assert quoted == ["it's done", '\u2018a', 'b\u2019']
+        assert unbalanced == ['"it\'s', 'done']
+        assert backslashes == ['C:\\temp', 'a\\', 'b']
+
+    def test_should_commandarguments_parse_tokens(self):
+
+        # GIVEN
+        spec = Deploy.arguments_spec()
+
+        # WHEN
+        values = spec.parse(['api', '--timeout=5'])
+
+        # THEN
+        assert values == {'service': 'api', 'timeout': 5, 'force': False}
+
+    @raises(CommandArgumentsException)
+    def test_should_commandarguments_reject_wrong_values(self):
+        Deploy.arguments_spec().parse(['api', '-t', 'soon'])
+
+    @raises(CommandArgumentsException)
+    def test_should_commandarguments_reject_missing_arguments(self):
+        Deploy.arguments_spec().parse(['--force'])
+
+    def test_should_parse_args_of_declared_arguments(self):
+
+        # GIVEN
+        command = Notes(dict(self.form, text='add  "my task" it\'s'))
+
+        # WHEN
+        args = command.parse_args()
+
+        # THEN
+        assert args == ['add', 'my task', "it's"]
+        assert command.num_args() == 3 and command.arguments().words == args
+        assert command.contains_argument('my task') and not command.contains_argument('my')
+
+    def test_should_parse_args_split_by_spaces_without_declared_arguments(self):
+
+        # GIVEN
+        command = Echo(dict(self.form, text='add  "my task"'))
+
+        # WHEN
+        args = command.parse_args()
+
+        # THEN
+        assert args == ['add', '', '"my', 'task"']
+        assert command.num_args() == 4
+        assert command.contains_argument('my t') and not command.contains_argument('other')
+        assert Echo(dict(self.form, text='')).parse_args() == []
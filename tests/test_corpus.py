@@ -0,0 +1,78 @@
+"""
+Class with nosetests for the generator of the benchmarks corpus
+"""
+import io
+import json
+import os
+import tempfile
+
+from benchmarks.corpus import CorpusGenerator, KINDS, MAX_MESSAGE_BLOCKS, read
+from slackviews.payloads import interaction_of, ViewSubmission, BlockActions
+from slackviews.view import BlocksArray, BlocksFactory, Modal, Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestCorpus:
+
+    def setup(self):
+        self.generator = CorpusGenerator(seed=1, blocks=(1, 5, 30), options=(2, 8, 150), words=(1, 4, 20))
+
+    def test_should_same_seed_provide_same_corpus(self):
+
+        # WHEN
+        records = list(CorpusGenerator(seed=7).records(20))
+        others = list(CorpusGenerator(seed=7).records(20))
+
+        # THEN
+        assert json.dumps(records) == json.dumps(others)
+        assert {record['kind'] for record in records} <= set(KINDS)
+
+    def test_should_corpus_views_be_valid(self):
+
+        # WHEN
+        views = [self.generator.record(kind)['data'] for kind in ('modal', 'home') for _ in range(20)]
+
+        # THEN
+        for data in views:
+            view = BlocksFactory.of(data)
+            assert isinstance(view, (Modal, Home))
+            assert view.serialize() == data
+
+    def test_should_corpus_messages_be_valid(self):
+
+        # WHEN
+        messages = [self.generator.record('message')['data'] for _ in range(20)]
+
+        # THEN
+        for data in messages:
+            assert 0 < len(data) <= MAX_MESSAGE_BLOCKS
+            assert BlocksArray.of(data).serialize() == data
+
+    def test_should_corpus_payloads_be_interactions(self):
+
+        # WHEN
+        submissions = [interaction_of(self.generator.record('view_submission')['data']) for _ in range(10)]
+        actions = [interaction_of(self.generator.record('block_actions')['data']) for _ in range(10)]
+
+        # THEN
+        assert all(isinstance(interaction, ViewSubmission) for interaction in submissions)
+        assert all(isinstance(interaction, BlockActions) and interaction.action_id() for interaction in actions)
+
+    def test_should_write_and_read_corpus(self):
+
+        # GIVEN
+        output = io.StringIO()
+        self.generator.write(output, 10)
+
+        # WHEN
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'corpus.jsonl')
+            with open(path, 'w') as f:
+                f.write(output.getvalue())
+            records = list(read(path))
+
+        # THEN
+        assert len(records) == 10
+        assert [json.dumps(record) for record in records] == output.getvalue().splitlines()
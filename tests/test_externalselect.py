@@ -0,0 +1,68 @@
+"""
+Class with nosetests for ExternalSelect AbstractBlock in slack_view library
+"""
+from slackviews.view import PlainText, Option, ExternalSelect, Section, BlocksFactory
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestExternalSelect:
+
+    def setup(self):
+        self.expected_action_id = 'any action id'
+        self.expected_placeholder = 'any placeholder'
+        self.expected_option_text = 'any text'
+        self.expected_option_value = 'any value'
+        self.expected_min_query_length = 2
+
+        self.serialized_dict = {'type': 'external_select',
+                                'placeholder': {'type': 'plain_text', 'text': self.expected_placeholder,
+                                                'emoji': False},
+                                'action_id': self.expected_action_id,
+                                'initial_option': {'text': {'type': 'plain_text', 'text': self.expected_option_text,
+                                                            'emoji': False},
+                                                   'value': self.expected_option_value},
+                                'min_query_length': self.expected_min_query_length}
+
+    def teardown(self):
+        ExternalSelect.__all_slots__ = None
+
+    def test_should_externalselect_builder_provide_a_valid_instance(self):
+
+        # WHEN
+        instance = ExternalSelect.Builder().action_id(self.expected_action_id).placeholder(self.expected_placeholder) \
+            .initial_option_(self.expected_option_text, self.expected_option_value) \
+            .min_query_length_(self.expected_min_query_length).build()
+
+        # THEN
+        assert isinstance(instance, ExternalSelect)
+        assert isinstance(getattr(instance, '_placeholder'), PlainText)
+        assert isinstance(getattr(instance, '_initial_option'), Option)
+        assert getattr(instance, '_action_id') == self.expected_action_id
+        assert getattr(instance, '_min_query_length') == self.expected_min_query_length
+
+    def test_should_externalselect_serialize_and_deserialize_correctly(self):
+
+        # GIVEN
+        instance = ExternalSelect.Builder().action_id(self.expected_action_id).placeholder(self.expected_placeholder) \
+            .initial_option_(self.expected_option_text, self.expected_option_value) \
+            .min_query_length_(self.expected_min_query_length).build()
+
+        # WHEN
+        serialized_dict = instance.serialize()
+        instance_from_dict = BlocksFactory.of(serialized_dict)
+
+        # THEN
+        assert serialized_dict == self.serialized_dict
+        assert isinstance(instance_from_dict, ExternalSelect)
+        assert instance_from_dict == instance
+
+    def test_should_externalselect_be_allowed_as_section_accessory(self):
+
+        # WHEN
+        instance = Section.Builder().text__('any text').accessory_().ExternalSelect() \
+            .action_id(self.expected_action_id).placeholder(self.expected_placeholder).up().build()
+
+        # THEN
+        assert instance.serialize()['accessory']['type'] == 'external_select'
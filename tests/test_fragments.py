@@ -0,0 +1,106 @@
+"""
+Class with nosetests for the cache of fragments of views in slack_view library
+"""
+import threading
+
+from slackviews.fragments import FragmentCache
+from slackviews.view import BlocksArray, Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestFragmentCache:
+
+    def setup(self):
+        self.now = 0.0
+        self.renders = 0
+        self.cache = FragmentCache('any cache', ttl=10, max_size=2, stale_while_revalidate=5, clock=lambda: self.now)
+
+    def render(self):
+        self.renders += 1
+        return BlocksArray.Builder().Header().text(f'Leaderboard {self.renders}').up().Divider().up().build()
+
+    def test_should_splice_fragment_by_reference(self):
+
+        # GIVEN
+        fragment = self.cache.get('leaderboard', self.render)
+
+        # WHEN
+        home = Home.Builder().title('any title').Blocks().Section().text__('Hello').up() \
+            .blocks(self.cache.get('leaderboard', self.render)).up().build()
+
+        # THEN
+        blocks = getattr(getattr(home, '_blocks'), '_blocks')
+        assert fragment.is_frozen() and self.renders == 1
+        assert blocks[1] is getattr(fragment, '_blocks')[0] and blocks[2] is getattr(fragment, '_blocks')[1]
+        assert home.serialize()['blocks'][1:] == fragment.serialize()
+
+    def test_should_render_expired_fragment_again(self):
+
+        # GIVEN
+        self.cache.stale_while_revalidate = 0
+        self.cache.get('leaderboard', self.render)
+
+        # WHEN
+        self.now = 10
+        fragment = self.cache.get('leaderboard', self.render)
+
+        # THEN
+        assert self.renders == 2 and fragment.serialize()[0]['text']['text'] == 'Leaderboard 2'
+        assert self.cache.metrics()['misses'] == 2
+
+    def test_should_provide_stale_fragment_while_revalidating(self):
+
+        # GIVEN
+        first = self.cache.get('leaderboard', self.render)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_render():
+            started.set()
+            release.wait(5)
+            return self.render()
+
+        # WHEN
+        self.now = 12
+        stale = self.cache.get('leaderboard', slow_render)
+        started.wait(5)
+        again = self.cache.get('leaderboard', slow_render)
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == 'FragmentCache-any cache':
+                thread.join(5)
+        fresh = self.cache.get('leaderboard', self.render)
+
+        # THEN
+        assert stale is first and again is first and fresh is not first
+        metrics = self.cache.metrics()
+        assert metrics['stale_hits'] == 2 and metrics['revalidations'] == 1 and self.renders == 2
+
+    def test_should_evict_least_recently_used(self):
+
+        # GIVEN
+        self.cache.put('a', self.render())
+        self.cache.put('b', self.render())
+        self.cache.get('a')
+
+        # WHEN
+        self.cache.put('c', self.render())
+
+        # THEN
+        assert self.cache.get('b') is None and self.cache.get('a') is not None
+        assert len(self.cache) == 2 and self.cache.metrics()['evictions'] == 1
+
+    def test_should_store_pre_serialized_fragment(self):
+
+        # GIVEN
+        serialized = self.render().serialize(as_json=True)
+
+        # WHEN
+        fragment = self.cache.put('any key', serialized)
+
+        # THEN
+        assert fragment.is_frozen() and fragment.serialize(as_json=True) == serialized
+
+    def test_should_named_provide_same_cache(self):
+        assert FragmentCache.named('any name', ttl=5) is FragmentCache.named('any name')
@@ -0,0 +1,118 @@
+"""
+Class with nosetests for frozen blocks in slack_view library
+"""
+from nose.tools import raises
+
+from slackviews.view import Header, Context, Actions, BlocksArray, Home, FrozenList, SelectMenu
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestFreeze:
+
+    def setup(self):
+        self.header = Header.Builder().text('any header').build().freeze()
+        self.footer = Context.Builder().element().Text().text('any footer').up().up().build().freeze()
+        self.actions = Actions.Builder().element().Button().action_id('any action').text('any text').up().build()
+
+    @raises(AttributeError)
+    def test_should_frozen_block_raise_attributeerror_on_setattr(self):
+        setattr(self.header, '_block_id', 'any block id')
+
+    @raises(AttributeError)
+    def test_should_frozen_block_raise_attributeerror_on_setattr_of_nested_text(self):
+        getattr(self.header, '_text')._text = 'changed'
+
+    def test_should_frozen_block_raise_attributeerror_on_setattr_of_nested_elements(self):
+
+        # GIVEN
+        self.actions.freeze()
+        button = getattr(self.actions, '_elements')[0]
+        serialized = self.actions.serialize(as_json=True)
+
+        # WHEN
+        errors = 0
+        for obj, name in ((button, '_action_id'), (getattr(button, '_text'), '_text'),
+                          (getattr(self.footer, '_elements')[0], '_text')):
+            try:
+                setattr(obj, name, 'changed')
+            except AttributeError:
+                errors += 1
+
+        # THEN
+        assert errors == 3 and self.actions.serialize(as_json=True) == serialized
+
+    @raises(AttributeError)
+    def test_should_frozen_block_raise_attributeerror_on_builder_setters(self):
+        self.header.builder().block_id_('any block id')
+
+    @raises(AttributeError)
+    def test_should_builders_of_nested_blocks_raise_attributeerror_after_freeze(self):
+
+        # GIVEN
+        builder = Actions.Builder().element().Button().action_id('any action').text('any text')
+        builder.up().build().freeze()
+
+        # WHEN
+        builder.url_('any url')
+
+    def test_should_element_builders_not_append_to_arrays_replaced_by_freeze(self):
+
+        # GIVEN
+        builder = Actions.Builder()
+        elements = builder.element()
+        elements.Button().action_id('any action').text('any text')
+        actions = builder.build().freeze()
+
+        # WHEN
+        try:
+            elements.Button()
+            assert False, 'arrays of frozen blocks must not be modified'
+        except AttributeError:
+            pass
+
+        # THEN
+        assert len(getattr(actions, '_elements')) == 1 and len(actions.serialize()['elements']) == 1
+
+    @raises(AttributeError)
+    def test_should_frozen_block_arrays_raise_attributeerror_on_modification(self):
+        getattr(self.footer, '_elements').append(None)
+
+    def test_should_freeze_whole_tree_and_cache_serialization_and_hash(self):
+
+        # WHEN
+        self.actions.freeze()
+        button = getattr(self.actions, '_elements')[0]
+
+        # THEN
+        assert self.actions.is_frozen() and button.is_frozen() and getattr(button, '_text').is_frozen()
+        assert isinstance(getattr(self.actions, '_elements'), FrozenList)
+        assert self.actions.serialize() is self.actions.serialize()
+        other = Actions.Builder().element().Button().action_id('any action').text('any text').up().build().freeze()
+        assert hash(self.actions) == hash(other) and self.actions == other
+
+    def test_should_builders_share_frozen_blocks_by_reference(self):
+
+        # WHEN
+        blocks0 = BlocksArray.Builder().block(self.header).Divider().up().block(self.footer).build()
+        view = Home.Builder().title('any title').Blocks().block(self.header).block(self.footer).up().build()
+        blocks1 = getattr(view, '_blocks')
+
+        # THEN
+        assert getattr(blocks0, '_blocks')[0] is getattr(blocks1, '_blocks')[0] is self.header
+        assert getattr(blocks0, '_blocks')[2] is getattr(blocks1, '_blocks')[1] is self.footer
+        assert blocks0.serialize()[0] == self.header.serialize()
+
+    @raises(TypeError)
+    def test_should_not_frozen_block_be_unhashable(self):
+        hash(self.actions)
+
+    def test_should_frozen_select_menu_find_options(self):
+
+        # GIVEN
+        menu = SelectMenu.Builder().action_id('any action').placeholder('any placeholder') \
+            .Option__().text('any text').value('any value').up().build().freeze()
+
+        # THEN
+        assert menu.has_option('any text') and menu.has_option('any value')
@@ -0,0 +1,170 @@
+"""
+Class with nosetests for the guard that skips publishing unchanged views in slack_view library, using the local stub
+"""
+import json
+import os
+import tempfile
+import threading
+
+from slackviews.client import SlackClient, SlackApiException
+from slackviews.guard import PublishGuard, LRUFingerprintStore, SQLiteFingerprintStore
+from slackviews.stub import StubSlackServer
+from slackviews.view import Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def home(text):
+    return Home.Builder().title('any title').Blocks().Section().text__(text).up().up().build()
+
+
+class SlowClient:
+    """
+    Client which first call to views_publish waits until it's released
+    """
+
+    def __init__(self):
+        self.texts = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def views_publish(self, user_id, view, hash_=None):
+        self.texts.append(json.loads(view)['blocks'][0]['text']['text'])
+        if len(self.texts) == 1:
+            self.entered.set()
+            self.release.wait(5)
+        return {'ok': True}
+
+
+class TestPublishGuard:
+
+    def setup(self):
+        self.server = StubSlackServer().start()
+        self.client = SlackClient('any token', base_url=self.server.api_url)
+        self.guard = PublishGuard(self.client, team_id='T1')
+
+    def teardown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_should_skip_unchanged_view(self):
+
+        # WHEN
+        first = self.guard.views_publish('U1', home('any text'))
+        second = self.guard.views_publish('U1', home('any text').serialize(as_json=True))
+
+        # THEN
+        assert self.server.count == 1
+        assert first['view']['id'] and second == {'ok': True, 'skipped': True}
+        assert self.guard.metrics() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    def test_should_publish_changed_view_and_other_users(self):
+
+        # WHEN
+        self.guard.views_publish('U1', home('any text'))
+        self.guard.views_publish('U1', home('other text'))
+        self.guard.views_publish('U2', home('other text'))
+        self.guard.views_publish('U2', home('other text'), team_id='T2')
+
+        # THEN
+        assert self.server.count == 4 and self.guard.metrics()['hits'] == 0
+
+    def test_should_not_store_failed_publish(self):
+
+        # GIVEN
+        self.server.responses['views.publish'] = {'ok': False, 'error': 'any error'}
+        try:
+            self.guard.views_publish('U1', home('any text'))
+        except SlackApiException:
+            pass
+        del self.server.responses['views.publish']
+
+        # WHEN
+        response = self.guard.views_publish('U1', home('any text'))
+
+        # THEN
+        assert self.server.count == 2 and 'skipped' not in response
+
+    def test_should_invalidate_user(self):
+
+        # GIVEN
+        self.guard.views_publish('U1', home('any text'))
+
+        # WHEN
+        self.guard.invalidate('U1')
+        self.guard.views_publish('U1', home('any text'))
+
+        # THEN
+        assert self.server.count == 2
+
+    def test_should_publish_views_of_same_user_one_at_a_time(self):
+
+        # GIVEN
+        client = SlowClient()
+        guard = PublishGuard(client, team_id='T1')
+        older = threading.Thread(target=guard.views_publish, args=('U1', home('older text')))
+        newer = threading.Thread(target=guard.views_publish, args=('U1', home('newer text')))
+        other = threading.Thread(target=guard.views_publish, args=('U2', home('other text')))
+
+        # WHEN
+        older.start()
+        assert client.entered.wait(5)
+        newer.start()
+        other.start()
+        other.join(5)
+        newer.join(0.1)
+        waiting = newer.is_alive()
+        client.release.set()
+        older.join(5)
+        newer.join(5)
+
+        # THEN
+        assert waiting and client.texts == ['older text', 'other text', 'newer text']
+        assert guard.store.get(('T1', 'U1', 'home')) == guard.fingerprint(home('newer text'))[0]
+        assert guard.views_publish('U1', home('newer text')) == {'ok': True, 'skipped': True}
+        assert not guard._key_locks
+
+    def test_should_delegate_other_methods_to_client(self):
+        assert self.guard.views_open.__self__ is self.client
+
+
+class TestFingerprintStores:
+
+    def test_should_lru_store_evict_least_recently_used(self):
+
+        # GIVEN
+        store = LRUFingerprintStore(max_size=2)
+        store.set(('T', 'U1', 'home'), 'a')
+        store.set(('T', 'U2', 'home'), 'b')
+
+        # WHEN
+        store.get(('T', 'U1', 'home'))
+        store.set(('T', 'U3', 'home'), 'c')
+
+        # THEN
+        assert len(store) == 2 and store.get(('T', 'U2', 'home')) is None and store.get(('T', 'U1', 'home')) == 'a'
+
+    def test_should_sqlite_store_keep_fingerprints_in_file(self):
+
+        # GIVEN
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'fingerprints.db')
+        store = SQLiteFingerprintStore(path)
+        store.set(('T', 'U1', 'home'), 'a')
+        store.set((None, 'U1', 'home'), 'b')
+        store.set(('T', 'U1', 'home'), 'c')
+        store.close()
+
+        # WHEN
+        store = SQLiteFingerprintStore(path)
+
+        # THEN
+        try:
+            assert len(store) == 2 and store.get(('T', 'U1', 'home')) == 'c' and store.get((None, 'U1', 'home')) == 'b'
+            store.delete(('T', 'U1', 'home'))
+            assert store.get(('T', 'U1', 'home')) is None
+        finally:
+            store.close()
+            os.remove(path)
+            os.rmdir(directory)
@@ -0,0 +1,76 @@
+"""
+Class with nosetests for memory usage of blocks in slack_view library
+"""
+import sys
+
+from slackviews.view import AbstractText, Section, Header, Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestMemoryUsage:
+
+    def setup(self):
+        self.header = Header.Builder().text('any header').build().freeze()
+
+    def teardown(self):
+        AbstractText.disable_interning()
+
+    def test_should_deep_memory_usage_include_whole_tree(self):
+
+        # GIVEN
+        section = Section.Builder().text__('any text').build()
+        text = getattr(section, '_text')
+
+        # WHEN
+        deep = section.memory_usage()
+        shallow = section.memory_usage(deep=False)
+
+        # THEN
+        assert shallow == sys.getsizeof(section)
+        assert deep >= shallow + text.memory_usage(deep=False) + sys.getsizeof(getattr(text, '_text'))
+
+    def test_should_count_shared_blocks_once(self):
+
+        # GIVEN
+        view = Home.Builder().title('any title').Blocks().block(self.header).up().build()
+        shared = Home.Builder().title('any title').Blocks().block(self.header).block(self.header).up().build()
+
+        # WHEN
+        size = view.memory_usage()
+        shared_size = shared.memory_usage()
+
+        # THEN
+        # only the array of blocks grows with the second reference
+        assert shared_size - size < self.header.memory_usage()
+
+    def test_should_count_interned_texts_once(self):
+
+        # GIVEN
+        AbstractText.enable_interning()
+        blocks = Home.Builder().title('any title').Blocks()
+        for _ in range(10):
+            blocks.Section().text__('any repeated text')
+        view = blocks.up().build()
+
+        # WHEN
+        size = view.memory_usage()
+        text = getattr(getattr(getattr(view, '_blocks'), '_blocks')[0], '_text')
+
+        # THEN
+        assert size < 10 * (text.memory_usage() + getattr(view, '_blocks').memory_usage(deep=False))
+
+    def test_should_seen_set_skip_objects_of_other_trees(self):
+
+        # GIVEN
+        base = Home.Builder().title('any title').Blocks().block(self.header).up().build().freeze()
+        clone = base.clone()
+        seen = set()
+
+        # WHEN
+        base.memory_usage(seen=seen)
+        clone_size = clone.memory_usage(seen=seen)
+
+        # THEN
+        assert clone_size < base.memory_usage()
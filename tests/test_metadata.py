@@ -0,0 +1,128 @@
+"""
+Class with nosetests for PrivateMetadataCodec in slack_view library
+"""
+from nose.tools import raises
+
+from slackviews.metadata import PrivateMetadataCodec
+from slackviews.payloads import ViewInteraction, ViewSubmission
+from slackviews.view import Modal
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestPrivateMetadataCodec:
+
+    def setup(self):
+        self.expected_dict = {'field1': 'value1', 'field2': 'a=b&c=d', 'field 3': ''}
+
+    def test_should_codec_encode_and_decode_values_with_separators(self):
+
+        # GIVEN
+        codec = PrivateMetadataCodec()
+
+        # WHEN
+        string = codec.encode(self.expected_dict)
+        dict_ = codec.decode(string)
+
+        # THEN
+        assert dict_ == self.expected_dict
+        assert string.startswith('field1=value1&')
+
+    def test_should_codec_decode_legacy_format(self):
+
+        # GIVEN
+        codec = PrivateMetadataCodec()
+
+        # WHEN
+        dict_ = codec.decode('field1=value1&field2=value2')
+
+        # THEN
+        assert dict_ == {'field1': 'value1', 'field2': 'value2'}
+
+    def test_should_codec_decode_legacy_values_unescaped(self):
+
+        # GIVEN
+        codec = PrivateMetadataCodec()
+
+        # WHEN
+        dict_ = codec.decode('sum=1+2&rate=50%25&path=a b')
+
+        # THEN
+        assert dict_ == {'sum': '1+2', 'rate': '50%25', 'path': 'a b'}
+
+    def test_should_codec_decode_legacy_keys_with_compressed_prefix(self):
+
+        # WHEN
+        dictionary = PrivateMetadataCodec().decode('z:index=1&zone=eu')
+
+        # THEN
+        assert dictionary == {'z:index': '1', 'zone': 'eu'}
+
+    @raises(ValueError)
+    def test_should_codec_fail_on_wrong_compressed_string(self):
+        PrivateMetadataCodec().decode('z:eJzLSM3JyQcABiwCFQ')
+
+    def test_should_codec_mark_plain_strings(self):
+
+        # GIVEN
+        codec = PrivateMetadataCodec()
+
+        # WHEN
+        string = codec.encode({'sum': '1+2', 'rate': '50%'})
+
+        # THEN
+        assert string == 'sum=1%2B2&rate=50%25&' and codec.decode(string) == {'sum': '1+2', 'rate': '50%'}
+        assert codec.encode(dict()) == '' and codec.decode('') == dict()
+
+    def test_should_interaction_helpers_use_codec_of_class(self):
+
+        # GIVEN
+        class UpperCodec:
+            @staticmethod
+            def encode(dictionary):
+                return 'UPPER'
+
+            @staticmethod
+            def decode(string):
+                return {'codec': 'upper'}
+
+        class CustomSubmission(ViewSubmission):
+            codec = UpperCodec
+
+        # WHEN
+        string = CustomSubmission.private_metadata_string({'any': 'value'})
+        dict_ = CustomSubmission.private_metadata_dictionary('any string')
+
+        # THEN
+        assert string == 'UPPER' and dict_ == {'codec': 'upper'}
+        assert ViewInteraction.private_metadata_dictionary('a=1') == {'a': '1'}
+
+    def test_should_codec_compress_large_state(self):
+
+        # GIVEN
+        codec = PrivateMetadataCodec(compress=True)
+        expected_dict = {f'field{i}': 'any repeated value' * 5 for i in range(100)}
+
+        # WHEN
+        string = codec.encode(expected_dict)
+
+        # THEN
+        assert string.startswith(PrivateMetadataCodec.COMPRESSED_PREFIX)
+        assert len(string) <= 3000
+        assert codec.decode(string) == expected_dict
+
+    @raises(AttributeError)
+    def test_should_codec_fail_when_encoded_state_is_too_long(self):
+        PrivateMetadataCodec().encode({f'field{i}': 'any repeated value' * 5 for i in range(100)})
+
+    def test_should_view_builder_encode_dictionary_metadata(self):
+
+        # GIVEN
+        builder = Modal.Builder().title('any title').Blocks().Divider().up().up()
+
+        # WHEN
+        instance = builder.private_metadata_(self.expected_dict).build()
+
+        # THEN
+        assert PrivateMetadataCodec().decode(getattr(instance, '_private_metadata')) == self.expected_dict
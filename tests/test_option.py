@@ -141,3 +141,45 @@ class TestOption:
 
         # THEN
         assert result
+
+    def test_should_option_of_many_provide_same_options_than_builder(self):
+
+        # GIVEN
+        expected_options = [Option.Builder().text(f'text {i}').value(f'value {i}').description_(f'description {i}')
+                            .build() for i in range(10)]
+        rows = [(f'text {i}', f'value {i}', f'description {i}') for i in range(10)]
+
+        # WHEN
+        options_from_pairs = Option.of_many(rows)
+        options_from_columns = Option.of_many(texts=[r[0] for r in rows], values=[r[1] for r in rows],
+                                              descriptions=[r[2] for r in rows])
+
+        # THEN
+        assert [o.serialize() for o in options_from_pairs] == [o.serialize() for o in expected_options]
+        assert [o.serialize() for o in options_from_columns] == [o.serialize() for o in expected_options]
+
+    @raises(AssertionError)
+    def test_should_option_of_many_raise_assertionerror_if_any_value_is_not_a_string(self):
+        Option.of_many([('text 0', 'value 0'), ('text 1', 1)])
+
+    def test_should_option_of_many_accept_rows_of_mixed_length(self):
+
+        # WHEN
+        options = Option.of_many([('text 0', 'value 0'), ('text 1', 'value 1', 'description 1'), ('text 2', 'value 2')])
+
+        # THEN
+        assert [o.serialize().get('description') for o in options] == \
+            [None, {'type': 'plain_text', 'text': 'description 1', 'emoji': False}, None]
+        assert [o.serialize()['value'] for o in options] == ['value 0', 'value 1', 'value 2']
+
+    @raises(AssertionError)
+    def test_should_option_of_many_raise_assertionerror_if_a_row_has_one_item(self):
+        Option.of_many([('text 0', 'value 0'), ('text 1',)])
+
+    @raises(AssertionError)
+    def test_should_option_of_many_raise_assertionerror_if_a_text_is_too_long(self):
+        Option.of_many([('text 0', 'value 0'), ('t' * 76, 'value 1')])
+
+    @raises(AssertionError)
+    def test_should_option_raise_assertionerror_if_description_is_too_long(self):
+        Option.Builder().text('any text').value('any value').description_('d' * 76).build().serialize()
@@ -0,0 +1,64 @@
+"""
+Class with nosetests for lazy imports of slackviews package
+"""
+import subprocess
+import sys
+
+from nose.tools import raises
+
+import slackviews
+from slackviews import view
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestPackage:
+
+    def test_should_provide_classes_of_view_module(self):
+
+        # WHEN
+        classes = [getattr(slackviews, name) for name in slackviews.__all__ if name != 'BlockProfiler']
+
+        # THEN
+        assert all(cls is getattr(view, cls.__name__) for cls in classes)
+        assert slackviews.Modal is view.Modal
+
+    def test_should_import_from_package(self):
+
+        # WHEN
+        from slackviews import Section, BlockProfiler
+
+        # THEN
+        assert Section is view.Section and BlockProfiler is view.BlockProfiler
+
+    def test_should_dir_list_lazy_classes(self):
+        assert {'Section', 'BlocksArray', 'BlockProfiler'} <= set(dir(slackviews))
+
+    @raises(AttributeError)
+    def test_should_missing_attribute_raise_attributeerror(self):
+        getattr(slackviews, 'AnyMissingClass')
+
+    def test_should_provide_submodules(self):
+
+        # GIVEN
+        code = 'import slackviews; print(slackviews.payloads.__name__, slackviews.metadata.__name__, ' \
+               'slackviews.view.Section.__name__)'
+
+        # WHEN
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+
+        # THEN
+        assert output.split() == ['slackviews.payloads', 'slackviews.metadata', 'Section']
+        assert slackviews.view is view
+
+    def test_should_import_package_without_importing_modules(self):
+
+        # GIVEN
+        code = 'import sys, slackviews; print(",".join(sorted(m for m in sys.modules if m.startswith("slackviews"))))'
+
+        # WHEN
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+
+        # THEN
+        assert output.strip() == 'slackviews'
@@ -0,0 +1,72 @@
+"""
+Class with nosetests for pagination of blocks in slack_view library
+"""
+import json
+
+from nose.tools import raises
+
+from slackviews.pagination import BlocksPaginator
+from slackviews.view import Header, Section, Divider, Modal, BlocksArray
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestBlocksPaginator:
+
+    def setup(self):
+        self.sections = [Section.Builder().text__(f'any text {i}').build() for i in range(10)]
+
+    def test_should_split_blocks_by_max_blocks(self):
+
+        # WHEN
+        pages = list(BlocksPaginator(max_blocks=4).pages(self.sections))
+
+        # THEN
+        assert [page.num_of_blocks() for page in pages] == [4, 4, 2]
+        assert all(isinstance(page, BlocksArray) for page in pages)
+        assert [blk for page in pages for blk in getattr(page, '_blocks')] == self.sections
+
+    def test_should_keep_header_with_next_block(self):
+
+        # GIVEN
+        header = Header.Builder().text('any header').build()
+        blocks = self.sections[:3] + [header] + self.sections[3:6]
+
+        # WHEN
+        pages = list(BlocksPaginator(max_blocks=4).pages(iter(blocks)))
+
+        # THEN
+        assert [page.num_of_blocks() for page in pages] == [3, 4]
+        assert getattr(pages[1], '_blocks')[0] is header
+
+    def test_should_split_blocks_by_max_bytes(self):
+
+        # GIVEN
+        max_bytes = len(json.dumps([blk.serialize() for blk in self.sections[:3]]))
+
+        # WHEN
+        pages = list(BlocksPaginator(max_blocks=50, max_bytes=max_bytes).pages(BlocksArray(_blocks=self.sections)))
+
+        # THEN
+        assert [page.num_of_blocks() for page in pages] == [3, 3, 3, 1]
+        assert all(len(page.serialize(as_json=True)) <= max_bytes for page in pages)
+
+    def test_should_views_repeat_template_blocks_in_each_page(self):
+
+        # GIVEN
+        template = Modal.Builder().title('any title').close_('any close').Blocks().Divider().up().up().build()
+
+        # WHEN
+        views = list(BlocksPaginator(max_blocks=5).views(template, self.sections))
+
+        # THEN
+        assert len(views) == 3
+        for view in views:
+            blocks = getattr(getattr(view, '_blocks'), '_blocks')
+            assert isinstance(blocks[0], Divider) and view.serialize()['title']['text'] == 'any title'
+        assert getattr(template, '_blocks').num_of_blocks() == 1
+
+    @raises(AttributeError)
+    def test_should_block_larger_than_max_bytes_raise_attributeerror(self):
+        list(BlocksPaginator(max_bytes=10).pages(self.sections))
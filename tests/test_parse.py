@@ -0,0 +1,62 @@
+"""
+Class with nosetests for parse_interaction of raw request bodies in slack_view library
+"""
+import json
+from urllib.parse import urlencode
+
+from nose.tools import raises
+
+from slackviews.payloads import parse_interaction, ViewSubmission, ViewBlocksInteraction
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestParse:
+
+    def setup(self):
+        self.payload = {'type': 'view_submission', 'user': {'id': 'U1'},
+                        'view': {'callback_id': 'new_ticket', 'private_metadata': 'a=1+2&b=50%&',
+                                 'state': {'values': {'title': {'input': {'type': 'plain_text_input',
+                                                                          'value': 'Año & día'}}}}}}
+        self.body = urlencode({'token': 'xyz', 'payload': json.dumps(self.payload), 'team': 'T1'})
+
+    def test_should_parse_bytes(self):
+
+        # WHEN
+        interaction = parse_interaction(self.body.encode('utf-8'))
+
+        # THEN
+        assert isinstance(interaction, ViewSubmission)
+        assert interaction.get_textinput_value('title', 'input') == 'Año & día'
+        assert interaction.view.private_metadata == 'a=1+2&b=50%&'
+
+    def test_should_parse_memoryview_and_bytearray(self):
+
+        # GIVEN
+        buffer = bytearray(self.body.encode('utf-8'))
+
+        # WHEN
+        interactions = parse_interaction(memoryview(buffer)), parse_interaction(buffer)
+
+        # THEN
+        assert all(i.get_textinput_value('title', 'input') == 'Año & día' for i in interactions)
+
+    def test_should_parse_str_with_payload_first(self):
+
+        # GIVEN
+        body = urlencode({'payload': json.dumps({'type': 'block_actions', 'view': {}, 'actions': []})})
+
+        # WHEN
+        interaction = parse_interaction(body)
+
+        # THEN
+        assert isinstance(interaction, ViewBlocksInteraction)
+
+    @raises(AttributeError)
+    def test_should_missing_payload_raise_attributeerror(self):
+        parse_interaction(b'token=xyz&my_payload=%7B%7D')
+
+    @raises(ValueError)
+    def test_should_malformed_payload_raise_valueerror(self):
+        parse_interaction(b'token=xyz&payload=%7B%22type%22')
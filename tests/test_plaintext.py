@@ -1,10 +1,12 @@
 """
 Class with nosetests for PlainText AbstractBlock in slack_view library
 """
+import sys
+import threading
 
 from nose.tools import raises
 
-from slackviews.view import PlainText
+from slackviews.view import PlainText, AbstractText, Button, TextPool
 
 __author__ = 'Agustin Escamez'
 __email__ = 'aech22@gmail.com'
@@ -85,3 +87,60 @@ class TestPlainText:
         assert getattr(instance_from_json, '_text') == 'any text'
         assert getattr(instance_from_dict, '_emoji') is False
         assert getattr(instance_from_json, '_emoji') is False
+
+    def test_should_interned_plaintext_be_shared_immutable_and_serialize_the_same(self):
+
+        # GIVEN
+        AbstractText.enable_interning(maxsize=2)
+        try:
+            # WHEN
+            instance = Button.Builder().action_id('any action').text('any text').build()
+            other = Button.Builder().action_id('other action').text('any text').build()
+            text = getattr(instance, '_text')
+
+            # THEN
+            assert text is getattr(other, '_text')
+            assert text.serialize() == {'type': 'plain_text', 'text': 'any text', 'emoji': False}
+            assert text.serialize(as_json=True) == '{"type": "plain_text", "text": "any text", "emoji": false}'
+            try:
+                text.builder().text('other text')
+                assert False, 'interned text objects must be immutable'
+            except AttributeError:
+                pass
+        finally:
+            AbstractText.disable_interning()
+
+        assert getattr(Button.Builder().action_id('any action').text('any text').build(), '_text') is not text
+
+    def test_should_text_pool_be_shared_by_threads(self):
+
+        # GIVEN
+        pool = TextPool(maxsize=4)
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def intern(thread):
+            barrier.wait()
+            try:
+                for i in range(2000):
+                    text = pool.get(PlainText, f'text {i % 64}', False)
+                    assert getattr(text, '_text') == f'text {i % 64}'
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=intern, args=(thread,)) for thread in range(8)]
+
+        # WHEN
+        # switch threads as often as possible, so they race
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        # THEN
+        assert errors == [] and len(pool) <= 4
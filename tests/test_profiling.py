@@ -0,0 +1,70 @@
+"""
+Class with nosetests for profiling of blocks in slack_view library
+"""
+from slackviews.profiling import BlockProfiler
+from slackviews.view import AbstractBlock, BlocksFactory, Section, MultiSelectMenu
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestBlockProfiler:
+
+    def setup(self):
+        self.original = AbstractBlock.__dict__['serialize']
+        self.profiler = AbstractBlock.enable_profiling()
+
+    def teardown(self):
+        AbstractBlock.disable_profiling()
+
+    def test_should_record_counters_per_block_class_and_operation(self):
+
+        # GIVEN
+        section = Section.Builder().text__('any text').accessory_().Button().action_id('any').text('any').up().build()
+
+        # WHEN
+        BlocksFactory.of(section.serialize())
+        counters = self.profiler.serialize()
+
+        # THEN
+        assert counters['Section']['build']['calls'] == 2
+        assert counters['Section']['serialize']['calls'] == 1
+        assert counters['Section']['deserialize']['calls'] == 1
+        assert counters['Button']['serialize']['calls'] == 1
+        assert counters['MarkDown']['serialize']['seconds'] > 0
+        assert counters['Section']['serialize']['seconds'] >= counters['Button']['serialize']['seconds']
+
+    def test_should_not_count_nested_calls_of_same_operation_twice(self):
+
+        # GIVEN
+        menu = MultiSelectMenu.Builder().action_id('any').placeholder('any').Option__().text('any').value('any') \
+            .up().build()
+        self.profiler.reset()
+
+        # WHEN
+        menu.serialize()
+
+        # THEN
+        assert self.profiler.serialize()['MultiSelectMenu']['validation']['calls'] == 1
+
+    def test_should_provide_prometheus_text(self):
+
+        # GIVEN
+        Section.Builder().text__('any text').build().serialize()
+
+        # WHEN
+        text = self.profiler.prometheus(prefix='any')
+
+        # THEN
+        assert '# TYPE any_block_calls_total counter' in text
+        assert 'any_block_calls_total{block="Section",operation="serialize"} 1' in text
+
+    def test_should_disable_restore_original_methods(self):
+
+        # WHEN
+        profiler = AbstractBlock.disable_profiling()
+        Section.Builder().text__('any text').build().serialize()
+
+        # THEN
+        assert profiler is self.profiler and not profiler.serialize()
+        assert AbstractBlock.__dict__['serialize'] is self.original and not BlockProfiler._wrapped
@@ -0,0 +1,103 @@
+"""
+Class with nosetests for asynchronous rendering of views in slack_view library
+"""
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from nose.tools import raises
+
+from slackviews.rendering import render_async, render_stream
+from slackviews.view import Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestRendering:
+
+    def setup(self):
+        # the default executor of the loop is shut down in teardown
+        self.executor = ThreadPoolExecutor(4)
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(self.executor)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = 0
+
+    def teardown(self):
+        self.loop.close()
+        self.executor.shutdown(wait=True)
+
+    def build_home(self, user):
+        with self.lock:
+            self.started += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.005)
+        with self.lock:
+            self.in_flight -= 1
+        return Home.Builder().title('any title').Blocks().Section().text__(f'Hello {user}').up().up().build()
+
+    def test_should_render_all_users(self):
+
+        # GIVEN
+        rendered = dict()
+
+        async def consumer(user, view):
+            rendered[user] = json.loads(view)
+
+        # WHEN
+        count = self.loop.run_until_complete(render_async(self.build_home, range(10), consumer, concurrency=3))
+
+        # THEN
+        assert count == 10 and set(rendered) == set(range(10))
+        assert rendered[7]['blocks'][0]['text']['text'] == 'Hello 7'
+        assert 1 <= self.max_in_flight <= 3
+
+    def test_should_not_start_renders_until_consumed(self):
+
+        # GIVEN
+        started = []
+
+        async def consume():
+            async for _ in render_stream(self.build_home, range(20), concurrency=2, as_json=False):
+                started.append(self.started)
+                await asyncio.sleep(0.01)
+
+        # WHEN
+        self.loop.run_until_complete(consume())
+
+        # THEN
+        assert len(started) == 20
+        assert all(count <= consumed + 2 for consumed, count in enumerate(started, start=1))
+
+    def test_should_render_asynchronous_iterable_of_users(self):
+
+        # GIVEN
+        async def users():
+            for user in ('U1', 'U2'):
+                await asyncio.sleep(0)
+                yield user
+
+        async def collect():
+            return {user: view async for user, view in render_stream(self.build_home, users(), as_json=False)}
+
+        # WHEN
+        rendered = self.loop.run_until_complete(collect())
+
+        # THEN
+        assert rendered['U2']['blocks'][0]['text']['text'] == 'Hello U2'
+
+    @raises(ZeroDivisionError)
+    def test_should_failed_render_raise_its_exception(self):
+
+        # GIVEN
+        async def consumer(user, view):
+            pass
+
+        # WHEN
+        self.loop.run_until_complete(render_async(lambda user: 1 / 0, range(5), consumer))
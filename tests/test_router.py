@@ -0,0 +1,152 @@
+"""
+Class with nosetests for InteractionRouter, interaction_of and RouteStats in slack_view library
+"""
+from nose.tools import raises
+
+from slackviews.payloads import InteractionRouter, NoRouteException, RouteStats, interaction_of, Interaction, \
+    ViewSubmission, ViewInteraction, ViewBlocksInteraction, MessageBlocksInteraction, BlockSuggestion
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestRouter:
+
+    def setup(self):
+        self.submission = {'type': 'view_submission', 'user': {'id': 'U1'},
+                           'view': {'callback_id': 'new_ticket', 'state': {'values': {}}}}
+        self.action = {'type': 'block_actions', 'view': {'callback_id': 'new_ticket'},
+                       'actions': [{'block_id': 'priority', 'action_id': 'select', 'type': 'static_select'}]}
+        self.shortcut = {'type': 'shortcut', 'callback_id': 'open_ticket', 'trigger_id': 'T1'}
+
+    def test_should_interaction_of_build_right_class(self):
+
+        # GIVEN
+        payloads = [(self.submission, ViewSubmission), ({'type': 'view_closed', 'view': {}}, ViewInteraction),
+                    (self.action, ViewBlocksInteraction),
+                    ({'type': 'block_actions', 'actions': [], 'message': {}}, MessageBlocksInteraction),
+                    ({'type': 'block_suggestion', 'value': 'sm', 'view': {}}, BlockSuggestion)]
+
+        # WHEN
+        interactions = [interaction_of(payload) for payload, _ in payloads]
+
+        # THEN
+        assert [type(interaction) for interaction in interactions] == [class_ for _, class_ in payloads]
+        assert interactions[0].user_slack_id() == 'U1'
+
+    @raises(NoRouteException)
+    def test_should_interaction_of_unknown_type_raise_exception(self):
+        interaction_of(self.shortcut)
+
+    def test_should_router_dispatch_to_most_specific_route(self):
+
+        # GIVEN
+        router = InteractionRouter()
+        router.add(lambda i: 'type', 'block_actions')
+        router.add(lambda i: 'callback', 'block_actions', callback_id='new_ticket')
+        router.add(lambda i: 'action', 'block_actions', callback_id='*', block_id='priority', action_id='select')
+
+        @router.route('view_submission', callback_id='new_ticket')
+        def on_new_ticket(interaction):
+            return type(interaction)
+
+        # WHEN
+        results = router.dispatch(self.action), router.dispatch(self.submission)
+
+        # THEN
+        assert results == ('action', ViewSubmission)
+
+    def test_should_router_dispatch_built_interactions(self):
+
+        # GIVEN
+        router = InteractionRouter()
+        router.add(lambda i: i, 'view_submission')
+        interaction = interaction_of(self.submission)
+
+        # WHEN
+        result = router.dispatch(interaction)
+
+        # THEN
+        assert result is interaction
+
+    def test_should_router_dispatch_unknown_types_to_default(self):
+
+        # GIVEN
+        router = InteractionRouter(default=lambda i: i)
+        router.add(lambda i: 'submission', 'view_submission')
+
+        # WHEN
+        interaction = router.dispatch(self.shortcut)
+
+        # THEN
+        assert type(interaction) is Interaction
+        assert interaction.callback_id == 'open_ticket'
+
+    def test_should_router_dispatch_unknown_types_to_their_route(self):
+
+        # GIVEN
+        router = InteractionRouter()
+        router.add(lambda i: i.trigger_id, 'shortcut', callback_id='open_ticket')
+        router.add(lambda i: 'other', 'shortcut', callback_id='close_ticket')
+        interaction = Interaction(**dict(self.shortcut, callback_id='close_ticket'))
+
+        # WHEN
+        results = router.dispatch(self.shortcut), router.dispatch(interaction)
+
+        # THEN
+        assert results == ('T1', 'other')
+        assert router.route_key(self.shortcut) == ('shortcut', 'open_ticket', None, None)
+
+    @raises(NoRouteException)
+    def test_should_router_without_default_raise_exception(self):
+
+        # GIVEN
+        router = InteractionRouter()
+        router.add(lambda i: 'submission', 'view_submission')
+
+        # WHEN
+        router.dispatch(self.shortcut)
+
+    @raises(AttributeError)
+    def test_should_router_reject_duplicated_routes(self):
+
+        # GIVEN
+        router = InteractionRouter()
+        router.add(lambda i: 1, 'view_submission', callback_id='new_ticket')
+
+        # WHEN
+        router.add(lambda i: 2, 'view_submission', callback_id='new_ticket')
+
+    def test_should_router_count_calls_and_errors(self):
+
+        # GIVEN
+        router = InteractionRouter()
+
+        @router.route('block_actions')
+        def on_action(interaction):
+            if interaction.actions[0]['action_id'] == 'fail':
+                raise ValueError('fail')
+            return True
+
+        failing = dict(self.action, actions=[{'block_id': 'priority', 'action_id': 'fail'}])
+
+        # WHEN
+        router.dispatch(self.action)
+        try:
+            router.dispatch(failing)
+        except ValueError:
+            pass
+        stats = router.stats()[('block_actions', None, None, None)]
+
+        # THEN
+        assert stats['calls'] == 2 and stats['errors'] == 1
+        assert 0.0 < stats['max_time'] <= stats['total_time']
+        assert stats['mean_time'] == stats['total_time'] / 2
+
+    def test_should_routestats_serialize_empty_counters(self):
+
+        # WHEN
+        stats = RouteStats().serialize()
+
+        # THEN
+        assert stats == {'calls': 0, 'errors': 0, 'total_time': 0.0, 'mean_time': 0.0, 'max_time': 0.0}
@@ -0,0 +1,165 @@
+"""
+Class with nosetests for the scheduler of publications of views in slack_view library, using the local stub
+"""
+import threading
+import time
+
+from slackviews.client import SlackClient
+from slackviews.scheduler import PublishScheduler, TokenBucket, PUBLISH_RATE
+from slackviews.stub import StubSlackServer
+from slackviews.view import Home
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+def home(text):
+    return Home.Builder().title('any title').Blocks().Section().text__(text).up().up().build()
+
+
+class TestTokenBucket:
+
+    def setup(self):
+        self.now = 0.0
+        self.bucket = TokenBucket(rate=2, capacity=2, clock=lambda: self.now)
+
+    def test_should_allow_burst_then_rate(self):
+
+        # WHEN
+        burst = [self.bucket.consume() for _ in range(3)]
+        wait = self.bucket.wait_time()
+        self.now += 0.5
+        refilled = self.bucket.consume()
+
+        # THEN
+        assert burst == [True, True, False]
+        assert wait == 0.5 and refilled and not self.bucket.consume()
+
+    def test_should_not_exceed_capacity(self):
+
+        # GIVEN
+        self.now += 100
+
+        # WHEN
+        taken = sum(self.bucket.consume() for _ in range(5))
+
+        # THEN
+        assert taken == 2
+
+
+class TestPublishScheduler:
+
+    def setup(self):
+        self.server = StubSlackServer().start()
+        self.client = SlackClient('any token', base_url=self.server.api_url)
+
+    def teardown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_should_publish_only_newest_view_of_each_user(self):
+
+        # GIVEN
+        scheduler = PublishScheduler(self.client, rate=1000)
+        scheduler.submit_all([('U1', home('first')), ('U2', home('other')), ('U1', home('second')),
+                              ('U1', home('third'))])
+
+        # WHEN
+        with scheduler:
+            assert scheduler.join(timeout=5)
+
+        # THEN
+        bodies = [request.body for request in self.server.requests]
+        assert [body['user_id'] for body in bodies] == ['U1', 'U2']
+        assert bodies[0]['view']['blocks'][0]['text']['text'] == 'third'
+        metrics = scheduler.metrics()
+        assert metrics['submitted'] == 4 and metrics['coalesced'] == 2 and metrics['published'] == 2
+        assert metrics['max_queue_depth'] == 2 and metrics['queue_depth'] == 0
+
+    def test_should_honor_retry_after(self):
+
+        # GIVEN
+        responses = iter([(429, {'ok': False, 'error': 'ratelimited'}, {'Retry-After': '0.2'})])
+        self.server.responses['views.publish'] = lambda request: next(responses, None)
+        scheduler = PublishScheduler(self.client, rate=1000)
+
+        # WHEN
+        start = time.monotonic()
+        with scheduler:
+            scheduler.submit_all([('U1', home('any text')), ('U2', home('any text'))])
+            assert scheduler.join(timeout=5)
+        elapsed = time.monotonic() - start
+
+        # THEN
+        assert [request.body['user_id'] for request in self.server.requests] == ['U1', 'U1', 'U2']
+        assert elapsed >= 0.2
+        metrics = scheduler.metrics()
+        assert metrics['rate_limited'] == 1 and metrics['published'] == 2 and metrics['failed'] == 0
+
+    def test_should_not_retry_views_superseded_while_in_flight(self):
+
+        # GIVEN
+        received, release = threading.Event(), threading.Event()
+
+        def rate_limit_first(request):
+            if self.server.count == 1:
+                received.set()
+                release.wait(5)
+                return 429, {'ok': False, 'error': 'ratelimited'}, {'Retry-After': '0.1'}
+            return None
+
+        self.server.responses['views.publish'] = rate_limit_first
+        scheduler = PublishScheduler(self.client, workers=2, rate=1000, burst=2)
+
+        # WHEN
+        with scheduler:
+            scheduler.submit('U1', home('v1'))
+            assert received.wait(5)
+            scheduler.submit('U1', home('v2'))
+            time.sleep(0.05)
+            release.set()
+            assert scheduler.join(timeout=5)
+
+        # THEN
+        texts = [request.body['view']['blocks'][0]['text']['text'] for request in self.server.requests]
+        assert texts == ['v1', 'v2']
+        metrics = scheduler.metrics()
+        assert metrics['rate_limited'] == 1 and metrics['published'] == 1 and metrics['in_flight'] == 0
+
+    def test_should_publish_at_rate_of_views_publish_by_default(self):
+
+        # WHEN
+        scheduler = PublishScheduler(self.client)
+
+        # THEN
+        assert scheduler.bucket.rate == PUBLISH_RATE == 100 / 60 and scheduler.bucket.capacity == 1
+
+    def test_should_limit_rate(self):
+
+        # GIVEN
+        scheduler = PublishScheduler(self.client, workers=2, rate=20, burst=1)
+
+        # WHEN
+        start = time.monotonic()
+        with scheduler:
+            scheduler.submit_all((f'U{user}', home('any text')) for user in range(5))
+            assert scheduler.join(timeout=5)
+        elapsed = time.monotonic() - start
+
+        # THEN
+        assert self.server.count == 5 and elapsed >= 0.2
+
+    def test_should_count_failed_views(self):
+
+        # GIVEN
+        self.server.responses['views.publish'] = {'ok': False, 'error': 'invalid_blocks'}
+        scheduler = PublishScheduler(self.client, rate=1000)
+
+        # WHEN
+        with scheduler:
+            scheduler.submit('U1', home('any text'))
+            assert scheduler.join(timeout=5)
+
+        # THEN
+        assert scheduler.metrics()['failed'] == 1
+        assert 'slackviews_publish_failed_total 1' in scheduler.prometheus()
@@ -333,3 +333,60 @@ class TestSelectMenu:
         # WHEN
         _builder.initial_option_('any value when no options or option_groups exist')
 
+
+    def test_should_has_option_find_options_added_after_previous_lookups_and_after_deserialization(self):
+
+        # GIVEN
+        _builder = SelectMenu.Builder().placeholder('any placeholder').action_id('any action_id')
+        for i in range(99):
+            _builder.Option__().text(f'text {i}').value(f'value {i}')
+        instance = _builder.build()
+        assert instance.has_option('text 98')
+
+        # WHEN
+        _builder.Option__().text('text 99').value('value 99')
+        deserialized = SelectMenu.deserialize(instance.serialize())
+
+        # THEN
+        for menu in (instance, deserialized):
+            assert menu.has_option('text 99') and menu.has_option('value 0')
+            assert not menu.has_option('text 100')
+        assert 'option_index' not in instance.serialize()
+
+    def test_should_has_option_find_options_in_option_groups(self):
+
+        # GIVEN
+        _builder = SelectMenu.Builder().placeholder('any placeholder').action_id('any action_id')
+        _group = _builder.OptionGroup__().label('any label')
+        _group.Option().text('text 0').value('value 0')
+        assert _builder.build().has_option('value 0')
+
+        # WHEN
+        _group.Option().text('text 1').value('value 1')
+        _builder.initial_option_('text 1')
+
+        # THEN
+        assert getattr(_builder.build().get_default(), '_value') == 'value 1'
+
+    def test_should_options_from_source_keep_menu_within_slack_limits(self):
+
+        # GIVEN
+        rows = [(f'text {i:05d}', f'value {i}') for i in range(10000)]
+
+        # WHEN
+        paged = SelectMenu.Builder().placeholder('any placeholder').action_id('any action_id') \
+            .options_from_source(iter(rows), page=1).build()
+        grouped = SelectMenu.Builder().placeholder('any placeholder').action_id('any action_id') \
+            .options_from_source(iter(rows), group_by=lambda row: row[0][-1], sort_key=lambda row: row[0]).build()
+
+        # THEN
+        paged_options = getattr(paged, '_options')
+        assert len(paged_options) == 100
+        assert getattr(paged_options[0], '_value') == 'value 99'
+        assert getattr(paged_options[-1], '_value') == '__more__2'
+
+        option_groups = getattr(grouped, '_option_groups')
+        assert [getattr(getattr(g, '_label'), '_text') for g in option_groups] == [str(i) for i in range(10)]
+        for group in option_groups:
+            assert len(getattr(group, '_options')) == 100
+        assert grouped.serialize()
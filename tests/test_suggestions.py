@@ -0,0 +1,54 @@
+"""
+Class with nosetests for OptionsIndex and OptionsProvider in slack_view library
+"""
+from slackviews.suggestions import OptionsIndex, OptionsProvider
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class TestSuggestions:
+
+    def setup(self):
+        self.rows = [('Alice Smith', '1'), ('Bob Smithers', '2'), ('Carol Black', '3'), ('Blacksmith Tools', '4')]
+
+    def test_should_optionsindex_match_word_prefixes(self):
+
+        # GIVEN
+        index = OptionsIndex(self.rows)
+
+        # WHEN
+        by_prefix = index.search('SMI')
+        by_words = index.search('s b')
+
+        # THEN
+        assert by_prefix == [('Alice Smith', '1'), ('Bob Smithers', '2')]
+        assert by_words == [('Bob Smithers', '2')]
+
+    def test_should_optionsindex_match_substrings_after_prefixes(self):
+
+        # GIVEN
+        index = OptionsIndex(self.rows, substring=True)
+
+        # WHEN
+        options = index.search('smith')
+
+        # THEN
+        assert options == [('Alice Smith', '1'), ('Bob Smithers', '2'), ('Blacksmith Tools', '4')]
+
+    def test_should_optionsprovider_cache_responses_by_action_id_and_query(self):
+
+        # GIVEN
+        provider = OptionsProvider(cache_size=1)
+        provider.register('any action id', OptionsIndex(self.rows))
+
+        # WHEN
+        response = provider.options('any action id', 'car')
+        cached = provider.options('any action id', 'car')
+        provider.options('any action id', 'bob')
+
+        # THEN
+        assert response is cached
+        assert response == {'options': [{'text': {'type': 'plain_text', 'text': 'Carol Black', 'emoji': False},
+                                         'value': '3'}]}
+        assert provider.stats() == {'hits': 1, 'misses': 2, 'size': 1}
@@ -0,0 +1,126 @@
+"""
+Class with nosetests for tracing and logging of interactions in slack_view library
+"""
+import logging
+
+from slackviews.payloads import set_tracer, traced, interaction_of, Interaction, ViewInteraction, ViewSubmission
+
+__author__ = 'Agustin Escamez'
+__email__ = 'aech22@gmail.com'
+
+
+class RecordsHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestTracing:
+
+    def setup(self):
+        self.spans = []
+        self.payload = {'type': 'view_submission',
+                        'view': {'private_metadata': 'ticket=1&',
+                                 'state': {'values': {'title': {'input': {'type': 'plain_text_input',
+                                                                          'value': 'Broken build'}}}}}}
+        self.handler = RecordsHandler()
+        self.logger = logging.getLogger('ViewSubmission')
+        self.level = self.logger.level
+        self.logger.addHandler(self.handler)
+
+    def teardown(self):
+        set_tracer(None)
+        self.logger.removeHandler(self.handler)
+        self.logger.setLevel(self.level)
+
+    def test_should_tracer_receive_spans_of_traced_methods(self):
+
+        # GIVEN
+        set_tracer(lambda name, elapsed, instance: self.spans.append((name, elapsed, instance)))
+        interaction = interaction_of(self.payload)
+
+        # WHEN
+        interaction.get_textinput_value('title', 'input')
+        interaction.private_metadata()
+
+        # THEN
+        names = [name for name, _, _ in self.spans]
+        assert names == ['ViewSubmission.get_input_action', 'Interaction.get_textinput_value',
+                         'ViewInteraction.private_metadata']
+        assert all(elapsed >= 0 and instance is interaction for _, elapsed, instance in self.spans)
+
+    def test_should_tracer_receive_spans_of_failed_methods(self):
+
+        # GIVEN
+        class Failing(Interaction):
+            @traced
+            def fail(self):
+                raise ValueError('fail')
+
+        set_tracer(lambda name, elapsed, instance: self.spans.append(name))
+
+        # WHEN
+        try:
+            Failing(type='any').fail()
+        except ValueError:
+            pass
+
+        # THEN
+        assert self.spans == ['TestTracing.test_should_tracer_receive_spans_of_failed_methods.<locals>.Failing.fail']
+
+    def test_should_traced_methods_work_without_tracer(self):
+
+        # GIVEN
+        set_tracer(lambda name, elapsed, instance: self.spans.append(name))
+        set_tracer(None)
+        interaction = interaction_of(self.payload)
+
+        # WHEN
+        value = interaction.get_textinput_value('title', 'input')
+
+        # THEN
+        assert value == 'Broken build' and interaction.private_metadata() == {'ticket': '1'}
+        assert self.spans == []
+        assert interaction.get_textinput_value.__name__ == 'get_textinput_value'
+
+    def test_should_subclasses_have_their_own_logger(self):
+
+        # GIVEN
+        class Custom(ViewSubmission):
+            pass
+
+        # THEN
+        assert Interaction.logger.name == 'Interaction'
+        assert ViewInteraction.logger.name == 'ViewInteraction' and ViewSubmission.logger is self.logger
+        assert Custom.logger.name == 'Custom'
+
+    def test_should_logger_emit_debug_records(self):
+
+        # GIVEN
+        self.logger.setLevel(logging.DEBUG)
+        interaction = interaction_of(self.payload)
+
+        # WHEN
+        interaction.get_textinput_value('title', 'input')
+
+        # THEN
+        messages = [record.getMessage() for record in self.handler.records]
+        assert messages[0] == 'searching for __input__ in input block __title__'
+        assert messages[-1] == '\t value -> Broken build'
+        assert all(record.name == 'ViewSubmission' for record in self.handler.records)
+
+    def test_should_logger_skip_records_below_level(self):
+
+        # GIVEN
+        self.logger.setLevel(logging.INFO)
+        interaction = interaction_of(self.payload)
+
+        # WHEN
+        interaction.get_textinput_value('title', 'input')
+
+        # THEN
+        assert self.handler.records == []